@@ -0,0 +1,149 @@
+"""Benchmark the cost of importing the model and of its first use.
+
+Each run starts a fresh interpreter under ``-X importtime`` that imports
+``simple_data_catalog_model.datamodel``, then validates a small synthetic
+catalog twice. It reports:
+
+* ``import``: cumulative import time of the datamodel module, pydantic included;
+* ``import-datamodel``: the self time of the datamodel module, without the
+  modules it imports (what running ``datamodel.py`` itself costs);
+* ``first-validate``: the first ``Container.model_validate``, which builds the
+  validators of the classes involved (they are built once and kept);
+* ``validate``: a second validation, with the validators in place.
+
+Before each of these interpreters, another one runs a bare ``import pydantic``;
+its import time is reported as ``reference`` and every stage is also given as
+its ratio to it. Times are the median of ``--runs`` interpreters. The results
+are compared with the ``import`` entry of ``baseline.json`` by these ratios, so
+a baseline recorded on one machine can be checked on another; milliseconds are
+only printed. ``--check`` exits with status 1 when a stage is slower than the
+baseline by more than ``--tolerance`` or when the import takes longer than
+``--max-relative`` times the reference, and ``--save-baseline`` records the run.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --check --max-relative 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+BASELINE = Path(__file__).with_name("baseline.json")
+KEY = "import"
+MODULE = "simple_data_catalog_model.datamodel"
+REFERENCE = "pydantic"
+
+PROBE = f"""
+import json, sys, time
+import {MODULE}
+from {MODULE} import Container
+from simple_data_catalog_model.synthetic import iter_synthetic
+from simple_data_catalog_model.streaming import SINGLE_VALUED
+
+data = {{}}
+for section, item in iter_synthetic(10):
+    if section in SINGLE_VALUED:
+        data[section] = item
+    else:
+        data.setdefault(section, []).append(item)
+timings = []
+for _ in range(2):
+    start = time.perf_counter()
+    Container.model_validate(data)
+    timings.append(time.perf_counter() - start)
+print(json.dumps(timings))
+"""
+
+# import time: self [us] | cumulative | imported package
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _run(code: str, module: str) -> tuple[tuple[int, int], str]:
+    """Run ``code`` in a fresh interpreter; return the import times of ``module`` and the output."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    records: dict[str, tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            records.setdefault(match[4], (int(match[1]), int(match[2])))
+    if module not in records:
+        raise SystemExit(f"{module} not found in the -X importtime output:\n{completed.stderr}")
+    return records[module], completed.stdout
+
+
+def probe() -> dict[str, float]:
+    """Run the reference and the probe interpreters and return their timings in milliseconds."""
+    (_own, reference), _output = _run(f"import {REFERENCE}", REFERENCE)
+    (own, total), output = _run(PROBE, MODULE)
+    first, second = json.loads(output.splitlines()[-1])
+    return {
+        "reference": reference / 1000,
+        "import": total / 1000,
+        "import-datamodel": own / 1000,
+        "first-validate": first * 1000,
+        "validate": second * 1000,
+    }
+
+
+def compare(now: float, then: Optional[float], tolerance: float) -> tuple[str, bool]:
+    if not then:
+        return "", False
+    ratio = now / then
+    worse = ratio > 1 + tolerance
+    return f"x{ratio:.2f}{' REGRESSION' if worse else ''}", worse
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="take the median of this many interpreters")
+    parser.add_argument(
+        "--max-relative", type=float, help="fail when the import takes longer than this many times the reference"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, as a fraction")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 on a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run in the baseline file")
+    args = parser.parse_args()
+
+    runs = [probe() for _ in range(args.runs)]
+    results = {stage: statistics.median(run[stage] for run in runs) for stage in runs[0]}
+    relatives = {stage: ms / results["reference"] for stage, ms in results.items()}
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    baseline = stored.get(KEY, {})
+
+    print(f"median of {args.runs} interpreters, {sys.version.split()[0]}")
+    print(f"{'stage':<18}{'ms':>9}{'relative':>10}  vs baseline")
+    regressions = []
+    for stage, ms in results.items():
+        note, regressed = "", False
+        if stage != "reference":
+            note, regressed = compare(relatives[stage], baseline.get(stage, {}).get("relative"), args.tolerance)
+        if regressed:
+            regressions.append(stage)
+        print(f"{stage:<18}{ms:9.1f}{relatives[stage]:10.3f}  {note}")
+    if args.max_relative is not None and relatives["import"] > args.max_relative:
+        print(f"import takes {relatives['import']:.2f}x the reference, more than --max-relative {args.max_relative:g}")
+        regressions.append("import")
+
+    if args.save_baseline:
+        stored[KEY] = {
+            stage: {"ms": round(ms, 2), "relative": round(relatives[stage], 4)} for stage, ms in results.items()
+        }
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"baseline {KEY} saved to {args.baseline}")
+    if regressions:
+        print(f"regressions: {', '.join(dict.fromkeys(regressions))}")
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
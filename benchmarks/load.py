@@ -0,0 +1,100 @@
+"""Time loading a large catalog, with and without the garbage collector paused.
+
+Writes a synthetic catalog of ``--datasets`` datasets (each with a publisher,
+contact point, licence, temporal coverage and two distributions) plus one
+quality measurement per dataset, then loads it with ``load_container``, which
+pauses the cyclic GC while it builds the tree, and once by collecting
+``iter_records`` with the GC left on.
+
+    python benchmarks/load.py --datasets 20000 --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from simple_data_catalog_model.datamodel import Container
+from simple_data_catalog_model.streaming import SINGLE_VALUED, CatalogWriter, iter_records, load_container
+
+
+def write_catalog(path: Path, datasets: int, format: str) -> None:
+    with CatalogWriter(path, format) as writer:
+        writer.write(
+            "dataCatalog",
+            {
+                "identifier": "ex:catalog",
+                "title": "synthetic catalog",
+                "dataset": [f"ex:dataset-{i}" for i in range(datasets)],
+            },
+        )
+        for i in range(datasets):
+            writer.write(
+                "datasets",
+                {
+                    "identifier": f"ex:dataset-{i}",
+                    "title": f"dataset {i}",
+                    "description": "a synthetic dataset for the load benchmark",
+                    "publisher": {"name": f"publisher {i % 100}"},
+                    "contactPoint": {"hasEmail": f"contact{i % 100}@example.com"},
+                    "license": {"title": "cc-by 4.0"},
+                    "status": "draft",
+                    "issued": "2025-01-01",
+                    "temporal": {"hasBeginning": "2025-01-01", "hasEnd": "2025-12-31"},
+                    "theme": ["ex:abc", "ex:bcd"],
+                    "distribution": [
+                        {"identifier": f"ex:dataset-{i}-{fmt}", "title": fmt, "format": fmt, "issued": "2025-01-02"}
+                        for fmt in ("csv", "parquet")
+                    ],
+                },
+            )
+        for i in range(datasets):
+            writer.write(
+                "qualityMeasurements",
+                {
+                    "identifier": f"ex:measurement-{i}",
+                    "computedOn": f"ex:dataset-{i}",
+                    "isMeasurementOf": "ex:completeness",
+                    "value": 0.9,
+                    "generatedAtTime": "2025-04-22",
+                },
+            )
+
+
+def load_with_gc(path: Path) -> Container:
+    sections: dict = {}
+    for record in iter_records(path):
+        if record.section in SINGLE_VALUED:
+            sections[record.section] = record.item
+        else:
+            sections.setdefault(record.section, []).append(record.item)
+    return Container(**sections)
+
+
+def timed(label: str, function, baseline: float = None) -> float:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    speedup = f"  ({baseline / elapsed:.1f}x)" if baseline else ""
+    print(f"{label:<28}{elapsed:8.2f} s{speedup}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=20000)
+    parser.add_argument("--format", choices=("yaml", "json", "jsonl"), default="json")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"catalog.{args.format}"
+        write_catalog(path, args.datasets, args.format)
+        print(f"{args.datasets} datasets, {path.stat().st_size / 1e6:.1f} MB {args.format}")
+        baseline = timed("GC enabled", lambda: load_with_gc(path))
+        timed("load_container (GC paused)", lambda: load_container(path), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""Benchmark the catalog pipeline on a synthetic catalog.
+
+Generates a catalog of ``--datasets`` datasets with
+``simple_data_catalog_model.synthetic`` (deterministic for a given ``--seed``),
+writes it as YAML and JSON, and measures each stage:
+
+* ``reference``: ``json.loads`` of the JSON file. It runs only the standard
+  library, so it measures the machine rather than this package. It is also
+  run before every timed run of the other stages;
+* ``load-yaml``, ``load-json``: ``load_container`` from the written files;
+* ``validate``: ``Container.model_validate`` of the parsed JSON document;
+* ``rdf-export``: N-Triples of the loaded catalog;
+* ``shacl``: parsing the N-Triples into rdflib and validating them against the
+  SHACL shapes (skipped above ``--shacl-max`` datasets, it is slow);
+* ``size-*``: the size of the YAML, JSON and N-Triples serializations.
+
+Every stage reports its time (best of ``--repeat`` runs; SHACL runs once), the
+ratio of that time to the best ``reference`` run taken alongside, its throughput in entities per second and,
+unless ``--no-memory`` is given, its peak Python memory, measured in one more
+run under ``tracemalloc`` so the timings are not distorted by tracing.
+
+The results are compared with the entry for the same size and seed in
+``baseline.json``. Times are compared by their ratio to ``reference``, so a
+baseline recorded on one machine can be checked on another; absolute seconds
+are only printed. Memory and sizes are compared as they are.
+``--check`` exits with status 1 when a stage is slower or bigger than the
+baseline by more than ``--tolerance``, and ``--save-baseline`` records the run.
+Ratios still vary somewhat between CPUs; re-record the baseline after a change
+that is meant to alter them.
+
+    python benchmarks/suite.py --datasets 10000
+    python benchmarks/suite.py --datasets 1000000 --shacl-max 0 --no-memory
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from simple_data_catalog_model.datamodel import Container
+from simple_data_catalog_model.rdf import write_ntriples
+from simple_data_catalog_model.streaming import CatalogWriter, load_container
+from simple_data_catalog_model.synthetic import iter_synthetic
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+@dataclass
+class Result:
+    stage: str
+    seconds: Optional[float] = None
+    # seconds / seconds of the ``reference`` workload, timed alongside
+    relative: Optional[float] = None
+    peak_mb: Optional[float] = None
+    size_mb: Optional[float] = None
+    entities: int = 0
+
+    @property
+    def throughput(self) -> Optional[float]:
+        return self.entities / self.seconds if self.seconds else None
+
+
+def _timed(function: Callable[[], Any]) -> tuple[float, Any]:
+    gc.collect()
+    start = time.perf_counter()
+    value = function()
+    return time.perf_counter() - start, value
+
+
+def measure(
+    stage: str,
+    function: Callable[[], Any],
+    entities: int,
+    memory: bool,
+    repeat: int,
+    reference: Optional[Callable[[], Any]] = None,
+) -> tuple[Result, Any]:
+    """Time the best of ``repeat`` runs of ``function``, then trace one run for its peak memory.
+
+    With ``reference``, each run is preceded by a run of ``reference`` and the
+    result's ``relative`` is the ratio of the two best times, so both are taken
+    under the same load of the machine.
+    """
+    best = reference_best = float("inf")
+    value = None
+    for _ in range(repeat):
+        if reference is not None:
+            reference_best = min(reference_best, _timed(reference)[0])
+        value = None
+        seconds, value = _timed(function)
+        best = min(best, seconds)
+    result = Result(stage, seconds=best, entities=entities)
+    if reference is not None:
+        result.relative = best / reference_best
+    if memory:
+        value = None
+        gc.collect()
+        tracemalloc.start()
+        try:
+            value = function()
+            result.peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        finally:
+            tracemalloc.stop()
+    return result, value
+
+
+def write_catalog(directory: Path, datasets: int, seed: int) -> tuple[dict[str, Path], int]:
+    paths = {format: directory / f"catalog.{format}" for format in ("yaml", "json")}
+    writers = [CatalogWriter(path, format) for format, path in paths.items()]
+    entities = 0
+    try:
+        for section, data in iter_synthetic(datasets, seed):
+            entities += 1
+            for writer in writers:
+                writer.write(section, data)
+    finally:
+        for writer in writers:
+            writer.close()
+    return paths, entities
+
+
+def run(datasets: int, seed: int, shacl_max: int, memory: bool, repeat: int) -> list[Result]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        paths, entities = write_catalog(directory, datasets, seed)
+        for format, path in paths.items():
+            results.append(Result(f"size-{format}", size_mb=path.stat().st_size / 1e6, entities=entities))
+
+        text = paths["json"].read_text(encoding="utf-8")
+
+        def reference() -> Any:
+            return json.loads(text)
+
+        result, _ = measure("reference", reference, entities, memory, repeat)
+        result.relative = 1.0
+        results.append(result)
+
+        for format, path in paths.items():
+            result, container = measure(
+                f"load-{format}", lambda path=path: load_container(path), entities, memory, repeat, reference
+            )
+            results.append(result)
+
+        document = reference()
+        result, _ = measure("validate", lambda: Container.model_validate(document), entities, memory, repeat, reference)
+        results.append(result)
+        del document
+
+        def export() -> str:
+            sink = io.StringIO()
+            write_ntriples(container, sink)
+            return sink.getvalue()
+
+        result, ntriples = measure("rdf-export", export, entities, memory, repeat, reference)
+        results.append(result)
+        results.append(Result("size-ntriples", size_mb=len(ntriples.encode("utf-8")) / 1e6, entities=entities))
+
+        if datasets <= shacl_max:
+            import rdflib
+
+            from simple_data_catalog_model.shacl import load_shapes, validate_graph
+
+            shapes = load_shapes()
+
+            def shacl() -> rdflib.Graph:
+                graph = rdflib.Graph().parse(data=ntriples, format="nt")
+                return validate_graph(graph, shapes)
+
+            result, _ = measure("shacl", shacl, entities, memory, 1, reference)
+            results.append(result)
+    return results
+
+
+def _format(value: Optional[float], spec: str) -> str:
+    width = int(spec.split(".")[0].rstrip(",")) if spec[0].isdigit() else 0
+    return "-".rjust(width) if value is None else format(value, spec)
+
+
+def compare(result: Result, baseline: Optional[dict[str, Any]], tolerance: float) -> tuple[str, bool]:
+    """Return the comparison column and whether the stage regressed."""
+    if not baseline:
+        return "", False
+    notes, regressed = [], False
+    for metric in ("relative", "peak_mb", "size_mb"):
+        if metric == "relative" and result.stage == "reference":
+            continue
+        now, then = getattr(result, metric), baseline.get(metric)
+        if now is None or not then:
+            continue
+        ratio = now / then
+        worse = ratio > 1 + tolerance
+        regressed |= worse
+        notes.append(f"{metric} x{ratio:.2f}{' REGRESSION' if worse else ''}")
+    return ", ".join(notes), regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="time the best of this many runs")
+    parser.add_argument("--shacl-max", type=int, default=2000, help="skip SHACL above this many datasets")
+    parser.add_argument("--no-memory", action="store_true", help="do not measure peak memory")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown or growth, as a fraction")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 on a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run in the baseline file")
+    args = parser.parse_args()
+
+    results = run(args.datasets, args.seed, args.shacl_max, not args.no_memory, args.repeat)
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    key = f"{args.datasets}/{args.seed}"
+    baseline = stored.get(key, {})
+
+    print(f"{args.datasets} datasets, seed {args.seed}, {results[0].entities} entities")
+    print(f"{'stage':<16}{'seconds':>9}{'relative':>10}{'entities/s':>12}{'peak MB':>9}{'size MB':>9}  vs baseline")
+    regressions = []
+    for result in results:
+        note, regressed = compare(result, baseline.get(result.stage), args.tolerance)
+        if regressed:
+            regressions.append(result.stage)
+        print(
+            f"{result.stage:<16}{_format(result.seconds, '9.3f')}{_format(result.relative, '10.2f')}"
+            f"{_format(result.throughput, '12,.0f')}"
+            f"{_format(result.peak_mb, '9.1f')}{_format(result.size_mb, '9.2f')}  {note}"
+        )
+
+    if args.save_baseline:
+        stored[key] = {
+            r.stage: {k: round(v, 4) for k, v in asdict(r).items() if k not in ("stage", "entities") and v is not None}
+            for r in results
+        }
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"baseline {key} saved to {args.baseline}")
+    if regressions:
+        print(f"regressions: {', '.join(regressions)}")
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
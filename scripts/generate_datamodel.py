@@ -0,0 +1,211 @@
+"""Generate ``datamodel.py`` from ``data-catalog.yaml`` in its fast-import form.
+
+Runs ``gen-pydantic`` on the schema (or reads its output with ``--generated``)
+and rewrites the result so that importing it does little more than define the
+classes:
+
+* the LinkML metadata (the module's ``linkml_meta``, each class's
+  ``linkml_meta`` and each field's ``json_schema_extra``) moves to
+  ``datamodel_meta.json``, read on first access: ``linkml_meta`` attributes
+  become lazy descriptors and ``json_schema_extra`` a callable that fills the
+  JSON schema in when one is generated;
+* the models get ``defer_build=True``, so pydantic builds the validator and
+  serializer of a class the first time it is used and keeps them on the class;
+* fields that a class re-declares exactly as inherited from its base (as
+  gen-pydantic does for every ``Resource`` slot of ``Dataset``,
+  ``DatasetSeries``, ``DataCatalog`` ...) are left to inheritance, so pydantic
+  collects and evaluates each of them once;
+* names imported but not used are dropped, such as the ``re``, ``sys``,
+  ``datetime``, ``time``, ``Decimal``, ``Literal`` and ``Union`` imports
+  gen-pydantic always emits, and unused pydantic names, several of which
+  pydantic loads lazily and would otherwise be imported for nothing;
+* the trailing ``model_rebuild()`` calls, which would build everything at
+  import, are dropped; forward references are resolved at the deferred build.
+
+    python scripts/generate_datamodel.py
+    python scripts/generate_datamodel.py --generated datamodel_from_gen_pydantic.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import subprocess
+from pathlib import Path
+from typing import Any
+
+PACKAGE = Path(__file__).resolve().parent.parent / "src" / "simple_data_catalog_model"
+SCHEMA = PACKAGE / "data-catalog.yaml"
+OUTPUT = PACKAGE / "datamodel.py"
+METADATA = PACKAGE / "datamodel_meta.json"
+
+IMPORTS = (b"from enum import Enum\n", b"from enum import Enum\nfrom functools import lru_cache\nfrom pathlib import Path\n")
+CONFIG = (b"        strict = False,\n    )", b"        strict = False,\n        defer_build = True,\n    )")
+META_CONFIG = (b"model_config = ConfigDict(frozen=True)", b"model_config = ConfigDict(frozen=True, defer_build=True)")
+
+HELPERS = b'''\
+# LinkML metadata lives in datamodel_meta.json and is read on first access.
+_METADATA_PATH = Path(__file__).with_name("datamodel_meta.json")
+
+
+@lru_cache(maxsize=None)
+def _metadata() -> dict[str, Any]:
+    import json
+
+    with open(_METADATA_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class _ClassMeta:
+    """The ``linkml_meta`` of a class, built on first access."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._class = owner.__name__
+        self._value = None
+
+    def __get__(self, instance: Any, owner: type) -> LinkMLMeta:
+        if self._value is None:
+            self._value = LinkMLMeta(_metadata()["classes"][self._class])
+        return self._value
+
+
+def _slot_meta(cls: str, slot: str):
+    def extra(schema: dict[str, Any]) -> None:
+        schema["linkml_meta"] = _metadata()["slots"][cls][slot]
+    return extra
+
+
+def __getattr__(name: str) -> Any:
+    if name == "linkml_meta":
+        value = globals()["linkml_meta"] = LinkMLMeta(_metadata()["schema"])
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+'''
+
+
+def _replace(source: bytes, replacement: tuple[bytes, bytes]) -> bytes:
+    old, new = replacement
+    if source.count(old) != 1:
+        raise SystemExit(f"expected exactly one {old!r} in the generated module")
+    return source.replace(old, new)
+
+
+def _pruned_import(statement: ast.Import | ast.ImportFrom, used: set[str]) -> bytes:
+    """Return the import statement with the names the module does not use left out (empty if none is used)."""
+    names = [alias for alias in statement.names if (alias.asname or alias.name.split(".")[0]) in used]
+    if not names:
+        return b""
+    spelled = [alias.name if alias.asname is None else f"{alias.name} as {alias.asname}" for alias in names]
+    if isinstance(statement, ast.Import):
+        return "".join(f"import {name}\n" for name in spelled).rstrip("\n").encode()
+    if len(spelled) == 1:
+        return f"from {statement.module} import {spelled[0]}".encode()
+    return (f"from {statement.module} import (\n" + "".join(f"    {name},\n" for name in spelled) + ")").encode()
+
+
+def transform(generated: str) -> tuple[str, dict[str, Any]]:
+    """Return the fast-import module and the metadata taken out of it."""
+    source = generated.encode("utf-8")
+    tree = ast.parse(generated)
+    # ast offsets are in bytes of the UTF-8 source.
+    starts = [0]
+    for line in source.splitlines(keepends=True):
+        starts.append(starts[-1] + len(line))
+
+    def span(node: ast.AST) -> tuple[int, int]:
+        return starts[node.lineno - 1] + node.col_offset, starts[node.end_lineno - 1] + node.end_col_offset
+
+    def meta_argument(node: ast.expr) -> Any:
+        # LinkMLMeta({...})
+        assert isinstance(node, ast.Call) and len(node.args) == 1
+        return ast.literal_eval(node.args[0])
+
+    def signature(item: ast.AnnAssign) -> str:
+        value = item.value
+        if isinstance(value, ast.Call):
+            value = ast.Call(value.func, value.args, [k for k in value.keywords if k.arg != "json_schema_extra"])
+        return ast.unparse(item.annotation) + " = " + ast.unparse(value)
+
+    metadata: dict[str, Any] = {"schema": None, "classes": {}, "slots": {}}
+    # class -> field -> (signature, linkml_meta) of every field, inherited ones included
+    declared: dict[str, dict[str, tuple[str, Any]]] = {}
+    edits: list[tuple[int, int, bytes]] = []
+    used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    used |= {node.id for node in ast.walk(ast.parse(HELPERS)) if isinstance(node, ast.Name)}
+    for statement in tree.body:
+        if isinstance(statement, (ast.Import, ast.ImportFrom)) and getattr(statement, "module", None) != "__future__":
+            text = _pruned_import(statement, used)
+            start, end = span(statement)
+            edits.append((start, end, text) if text else (start, end + 1, b""))
+        elif isinstance(statement, ast.Assign) and [getattr(t, "id", None) for t in statement.targets] == ["linkml_meta"]:
+            metadata["schema"] = meta_argument(statement.value)
+            edits.append((*span(statement), HELPERS))
+        elif (
+            isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Call)
+            and getattr(statement.value.func, "attr", None) == "model_rebuild"
+        ):
+            start, end = span(statement)
+            edits.append((start, end + 1, b""))
+        elif isinstance(statement, ast.ClassDef):
+            slots = metadata["slots"].setdefault(statement.name, {})
+            bases = [base.id for base in statement.bases if isinstance(base, ast.Name)]
+            fields = declared[statement.name] = {}
+            for base in bases:
+                fields.update(declared.get(base, {}))
+            for item in statement.body:
+                if not isinstance(item, ast.AnnAssign) or item.value is None:
+                    continue
+                name = item.target.id
+                if name == "linkml_meta":
+                    metadata["classes"][statement.name] = meta_argument(item.value)
+                    edits.append((*span(item.value), b"_ClassMeta()"))
+                    continue
+                if not isinstance(item.value, ast.Call):
+                    continue
+                extra = [k for k in item.value.keywords if k.arg == "json_schema_extra"]
+                meta = ast.literal_eval(extra[0].value)["linkml_meta"] if extra else None
+                field = (signature(item), meta)
+                if fields.get(name) == field:
+                    start, end = span(item)
+                    edits.append((starts[item.lineno - 1], end + 1, b""))
+                    continue
+                fields[name] = field
+                if extra:
+                    slots[name] = meta
+                    call = f'_slot_meta("{statement.name}", "{name}")'.encode()
+                    edits.append((*span(extra[0].value), call))
+            if not slots:
+                del metadata["slots"][statement.name]
+    if metadata["schema"] is None:
+        raise SystemExit("no module-level linkml_meta in the generated module")
+    for start, end, text in sorted(edits, reverse=True):
+        source = source[:start] + text + source[end:]
+    source = source.replace(
+        b"# Model rebuild\n# see https://pydantic-docs.helpmanual.io/usage/models/#rebuilding-a-model\n", b""
+    )
+    for replacement in (IMPORTS, CONFIG, META_CONFIG):
+        source = _replace(source, replacement)
+    return source.rstrip().decode("utf-8") + "\n", metadata
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--generated", type=Path, help="gen-pydantic output to transform instead of running it")
+    args = parser.parse_args()
+    if args.generated:
+        generated = args.generated.read_text(encoding="utf-8")
+    else:
+        generated = subprocess.run(
+            ["gen-pydantic", str(SCHEMA.relative_to(PACKAGE.parent.parent))],
+            cwd=PACKAGE.parent.parent, check=True, capture_output=True, text=True,
+        ).stdout
+    module, metadata = transform(generated)
+    OUTPUT.write_text(module, encoding="utf-8")
+    METADATA.write_text(json.dumps(metadata, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"wrote {OUTPUT} and {METADATA}")
+
+
+if __name__ == "__main__":
+    main()
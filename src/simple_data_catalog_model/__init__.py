@@ -0,0 +1 @@
+"""LinkML model and tooling for the simple data catalog."""
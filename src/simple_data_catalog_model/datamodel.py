@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+from datetime import date
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    ClassVar,
+    Optional,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+)
+
+
+metamodel_version = "1.12.0"
+version = "None"
+
+
+class ConfiguredBaseModel(BaseModel):
+    model_config = ConfigDict(
+        serialize_by_alias = True,
+        validate_by_name = True,
+        validate_assignment = True,
+        validate_default = True,
+        extra = "forbid",
+        arbitrary_types_allowed = True,
+        use_enum_values = True,
+        strict = False,
+        defer_build = True,
+    )
+
+
+
+
+
+class LinkMLMeta(RootModel):
+    root: dict[str, Any] = {}
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    def __getattr__(self, key:str):
+        return getattr(self.root, key)
+
+    def __getitem__(self, key:str):
+        return self.root[key]
+
+    def __setitem__(self, key:str, value):
+        self.root[key] = value
+
+    def __contains__(self, key:str) -> bool:
+        return key in self.root
+
+
+# LinkML metadata lives in datamodel_meta.json and is read on first access.
+_METADATA_PATH = Path(__file__).with_name("datamodel_meta.json")
+
+
+@lru_cache(maxsize=None)
+def _metadata() -> dict[str, Any]:
+    import json
+
+    with open(_METADATA_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class _ClassMeta:
+    """The ``linkml_meta`` of a class, built on first access."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._class = owner.__name__
+        self._value = None
+
+    def __get__(self, instance: Any, owner: type) -> LinkMLMeta:
+        if self._value is None:
+            self._value = LinkMLMeta(_metadata()["classes"][self._class])
+        return self._value
+
+
+def _slot_meta(cls: str, slot: str):
+    def extra(schema: dict[str, Any]) -> None:
+        schema["linkml_meta"] = _metadata()["slots"][cls][slot]
+    return extra
+
+
+def __getattr__(name: str) -> Any:
+    if name == "linkml_meta":
+        value = globals()["linkml_meta"] = LinkMLMeta(_metadata()["schema"])
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class PartyCollection(str, Enum):
+    """
+    a Party that is a single entity representing a set of member entities. This indicates that all the members of the set will undertake the same functional role in the Rule.
+For the purpse of the simple_data_catalog, an enumerated list representing the IDS-RAM roles is used.
+    """
+    Data_Consumer = "Data Consumer"
+    """
+    The term data user means a natural or legal person who has lawful access to certain personal or non-personal data and has the right, including under Regulation (EU) 2016/679 in the case of personal data, to use that data for commercial or non-commercial purposes.
+    """
+    Data_Provider = "Data Provider"
+    """
+    The term data holder means a legal person, including public sector bodies and international organizations, or a natural person who is not a data subject with respect to the specific data in question, who has the right to grant access to or to share certain personal data or non-personal data in accordance with applicable Union or national law.
+    """
+    Service_Provider = "Service Provider"
+    """
+    In a data space multiple service providers can offer optional capabilities to enable data sharing and data transactions. Some services may be considered as essential, depending on the data space governance framework. Those may be services required to operate a data space, to intermediate in data transactions, or support the value creation process in a data space. Fundamentally, all such service providers are considered to be a participant in a data space and therefore bound to the agreed policies and rules of a given data space.
+    """
+
+
+
+class Resource(ConfiguredBaseModel):
+    """
+    A resource that is described in the catalog (e.g., a dataset, a data service, or a catalog).
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    identifier: str = Field(default=..., description="""An unambiguous reference to the resource within a given context.""", json_schema_extra = _slot_meta("Resource", "identifier"))
+    title: Optional[str] = Field(default=None, description="""A name given to the resource.""", json_schema_extra = _slot_meta("Resource", "title"))
+    description: Optional[str] = Field(default=None, description="""Description may include but is not limited to: an abstract, a table of contents, a graphical representation, or a free-text account of the resource.""", json_schema_extra = _slot_meta("Resource", "description"))
+    publisher: Optional[Agent] = Field(default=None, description="""An entity responsible for making the resource available.""", json_schema_extra = _slot_meta("Resource", "publisher"))
+    issued: Optional[date] = Field(default=None, description="""Date of formal issuance (e.g., publication) of the resource./""", json_schema_extra = _slot_meta("Resource", "issued"))
+    contactPoint: Optional[Kind] = Field(default=None, description="""Relevant contact information for the cataloged resource. Use of vCard is recommended""", json_schema_extra = _slot_meta("Resource", "contactPoint"))
+    license: Optional[LicenseDocument] = Field(default=None, description="""A legal document giving official permission to do something with the resource.""", json_schema_extra = _slot_meta("Resource", "license"))
+    version: Optional[str] = Field(default=None, description="""The version indicator (name or identifier) of a resource.""", json_schema_extra = _slot_meta("Resource", "version"))
+    status: Optional[str] = Field(default=None, description="""The status of the Asset in the context of a particular workflow process.""", json_schema_extra = _slot_meta("Resource", "status"))
+    modified: Optional[date] = Field(default=None, description="""date on which the resource was changed.""", json_schema_extra = _slot_meta("Resource", "modified"))
+    theme: Optional[list[str]] = Field(default=None, description="""A main category of the resource. A resource can have multiple themes.""", json_schema_extra = _slot_meta("Resource", "theme"))
+    wasDerivedFrom: Optional[list[str]] = Field(default=None, description="""A derivation is a transformation of an entity into another, an update of an entity resulting in a new one, or the construction of a new entity based on a pre-existing entity.""", json_schema_extra = _slot_meta("Resource", "wasDerivedFrom"))
+    hasPolicy: Optional[str] = Field(default=None, description="""The ODRL policy associated with this resource""", json_schema_extra = _slot_meta("Resource", "hasPolicy"))
+
+
+class Dataset(Resource):
+    """
+    A collection of data, published or curated by a single agent, and available for access or download.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    temporal: Optional[PeriodOfTime] = Field(default=None, description="""Temporal characteristics of the resource.""", json_schema_extra = _slot_meta("Dataset", "temporal"))
+    inSeries: Optional[str] = Field(default=None, description=""".""", json_schema_extra = _slot_meta("Dataset", "inSeries"))
+    distribution: Optional[list[Distribution]] = Field(default=None, description="""An available distribution of the dataset.""", json_schema_extra = _slot_meta("Dataset", "distribution"))
+
+
+class Agent(ConfiguredBaseModel):
+    """
+    An entity (person, organization, or software) that can be a publisher, creator, or contributor of a resource.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    name: Optional[str] = Field(default=None, description="""A name for some thing""", json_schema_extra = _slot_meta("Agent", "name"))
+
+
+class Kind(ConfiguredBaseModel):
+    """
+    A vCard kind representing a contact point for a resource.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    hasEmail: Optional[str] = Field(default=None, description="""The e‑mail address associated with a contact point.""", json_schema_extra = _slot_meta("Kind", "hasEmail"))
+
+
+class LicenseDocument(ConfiguredBaseModel):
+    """
+    A vCard kind representing a contact point for a resource.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    title: Optional[str] = Field(default=None, description="""A name given to the resource.""", json_schema_extra = _slot_meta("LicenseDocument", "title"))
+
+
+class PeriodOfTime(ConfiguredBaseModel):
+    """
+    A temporal extent or interval.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    hasBeginning: Optional[date] = Field(default=None, description="""Temporal characteristics of the resource.""", json_schema_extra = _slot_meta("PeriodOfTime", "hasBeginning"))
+    hasEnd: Optional[date] = Field(default=None, description="""Temporal characteristics of the resource.""", json_schema_extra = _slot_meta("PeriodOfTime", "hasEnd"))
+
+
+class Concept(ConfiguredBaseModel):
+    """
+    A unit of thought (an idea or notion) that can be expressed as a term.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    identifier: str = Field(default=..., description="""An unambiguous reference to the resource within a given context.""", json_schema_extra = _slot_meta("Concept", "identifier"))
+    definition: Optional[str] = Field(default=None, description="""A statement or formal explanation of the meaning of a concept.""", json_schema_extra = _slot_meta("Concept", "definition"))
+    prefLabel: Optional[str] = Field(default=None, description="""The preferred lexical label for a resource, in a given language.""", json_schema_extra = _slot_meta("Concept", "prefLabel"))
+    altLabel: Optional[str] = Field(default=None, description="""An alternative lexical label for a resource.""", json_schema_extra = _slot_meta("Concept", "altLabel"))
+    example: Optional[str] = Field(default=None, description="""An example of the use of a concept.""", json_schema_extra = _slot_meta("Concept", "example"))
+
+
+class DatasetSeries(Dataset):
+    """
+    A series of datasets that are related in some way (e.g., by time, version, or theme).
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+
+
+class DataCatalog(Dataset):
+    """
+    A curated collection of metadata about datasets, data services, and related resources.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    dataset: Optional[list[str]] = Field(default=None, description=""".""", json_schema_extra = _slot_meta("DataCatalog", "dataset"))
+
+
+class Distribution(ConfiguredBaseModel):
+    """
+    A specific representation of a dataset, typically available for download or access via a service.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    identifier: str = Field(default=..., description="""An unambiguous reference to the resource within a given context.""", json_schema_extra = _slot_meta("Distribution", "identifier"))
+    title: Optional[str] = Field(default=None, description="""A name given to the resource.""", json_schema_extra = _slot_meta("Distribution", "title"))
+    description: Optional[str] = Field(default=None, description="""Description may include but is not limited to: an abstract, a table of contents, a graphical representation, or a free-text account of the resource.""", json_schema_extra = _slot_meta("Distribution", "description"))
+    issued: Optional[date] = Field(default=None, description="""Date of formal issuance (e.g., publication) of the resource./""", json_schema_extra = _slot_meta("Distribution", "issued"))
+    version: Optional[str] = Field(default=None, description="""The version indicator (name or identifier) of a resource.""", json_schema_extra = _slot_meta("Distribution", "version"))
+    modified: Optional[date] = Field(default=None, description="""date on which the resource was changed.""", json_schema_extra = _slot_meta("Distribution", "modified"))
+    accessURL: Optional[str] = Field(default=None, description="""A URL of the resource that gives access to a distribution of the dataset. E.g., landing page, feed, SPARQL endpoint. """, json_schema_extra = _slot_meta("Distribution", "accessURL"))
+    format: Optional[str] = Field(default=None, description="""The file format, physical medium, or dimensions of the resource. """, json_schema_extra = _slot_meta("Distribution", "format"))
+
+
+class DataService(Resource):
+    """
+    A service that provides access to a dataset or a collection of datasets.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    servesDataset: Optional[list[str]] = Field(default=None, description="""A collection of data that this data service can distribute.""", json_schema_extra = _slot_meta("DataService", "servesDataset"))
+    endpointURL: Optional[str] = Field(default=None, description="""The root location or primary endpoint of the service (a Web-resolvable IRI).""", json_schema_extra = _slot_meta("DataService", "endpointURL"))
+
+
+class Metric(ConfiguredBaseModel):
+    """
+    A measurable aspect of data quality (e.g., accuracy, completeness).
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    identifier: str = Field(default=..., description="""An unambiguous reference to the resource within a given context.""", json_schema_extra = _slot_meta("Metric", "identifier"))
+    definition: Optional[str] = Field(default=None, description="""A statement or formal explanation of the meaning of a concept.""", json_schema_extra = _slot_meta("Metric", "definition"))
+    prefLabel: Optional[str] = Field(default=None, description="""The preferred lexical label for a resource, in a given language.""", json_schema_extra = _slot_meta("Metric", "prefLabel"))
+    expectedDataType: Optional[Any] = Field(default=None, description="""Represents the expected data type for the metric's observed value (e.g., xsd:boolean, xsd:double etc...) """, json_schema_extra = _slot_meta("Metric", "expectedDataType"))
+    inDimension: Optional[str] = Field(default=None, description="""Represents the expected data type for the metric's observed value (e.g., xsd:boolean, xsd:double etc...) """, json_schema_extra = _slot_meta("Metric", "inDimension"))
+
+
+class QualityMeasurement(ConfiguredBaseModel):
+    """
+    An observation of a metric applied to a specific resource.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    identifier: str = Field(default=..., description="""An unambiguous reference to the resource within a given context.""", json_schema_extra = _slot_meta("QualityMeasurement", "identifier"))
+    computedOn: str = Field(default=..., description="""Refers to the resource (e.g., a dataset, a linkset, a graph, a set of triples) on which the quality measurement is performed. In the DQV context, this property is generally expected to be used in statements in which objects are instances of dcat:Dataset or dcat:Distribution. """, json_schema_extra = _slot_meta("QualityMeasurement", "computedOn"))
+    isMeasurementOf: Optional[str] = Field(default=None, description="""Indicates the metric being observed.""", json_schema_extra = _slot_meta("QualityMeasurement", "isMeasurementOf"))
+    value: Optional[float] = Field(default=None, description="""Refers to values computed by metric.""", json_schema_extra = _slot_meta("QualityMeasurement", "value"))
+    generatedAtTime: Optional[date] = Field(default=None, description="""Generation is the completion of production of a new entity by an activity. This entity did not exist before generation and becomes available for usage after this generation.""", json_schema_extra = _slot_meta("QualityMeasurement", "generatedAtTime"))
+
+
+class Policy(ConfiguredBaseModel):
+    """
+    ' The Policy class has the following properties:
+    A Policy MUST have one uid property value (of type IRI [rfc3987]) to identify the Policy. A Policy MUST have at least one permission, prohibition, or obligation property values of type Rule. (See the Permission, Prohibition, and Obligation sections for more details.) A Policy MAY have none, one, or many profile property values (of type IRI [rfc3987]) to identify the ODRL Profile that this Policy conforms to. (See the ODRL Profiles section for more details.) A Policy MAY have none, one, or many inheritFrom property values (of type IRI [rfc3987]) to identify the parent Policy from which this child Policy inherits from. (See the ODRL Inheritance section for more details.) A Policy MAY have none or one conflict property values (of type ConflictTerm) for Conflict Strategy Preferences indicating how to handle Policy conflicts.(See the Policy Conflict Strategy section for more details.)
+    An ODRL Policy MAY also declare properties which are shared and common to all its Rules. Specifically; action properties, sub-properties of relation (such as target), and sub-properties of function (such as assigner and assignee). See section Compact Policy for validation requirements on these shared properties.
+    An ODRL Policy must either:
+    Only use terms defined in the ODRL Core Vocabulary [odrl-vocab], or Use an ODRL Profile that declares the supported vocabulary used by expressions in the Policy.
+    In the latter case, the profile property MUST be used to indicate the IRIs of the ODRL Profile(s). See the ODRL Profiles section for more details on mechanisms to define ODRL Profiles and conformance requirements. (The Examples in this document will use ODRL Profile identifiers for illustrative purposes only.)
+    An ODRL Policy MAY be subclassed to more precisely describe the context of use of the Policy that MAY include additional constraints that ODRL processors MUST understand. Additional Policy subclasses MAY be documented in the ODRL Common Vocabulary [odrl-vocab] or in ODRL Profiles. A Policy class MUST be disjoint will all Policy subclasses (except for Set). '
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    uid: str = Field(default=..., description="""Unique identifier for the policy or rule""", json_schema_extra = _slot_meta("Policy", "uid"))
+    title: Optional[str] = Field(default=None, description="""The title of the policy, not required for odrl compliance but very friendly for human readers (or AI agents). Recommended for the simple data catalog. If not provided the webpage will have the uid as title.""", json_schema_extra = _slot_meta("Policy", "title"))
+    description: Optional[str] = Field(default=None, description="""Description of the policy or rule""", json_schema_extra = _slot_meta("Policy", "description"))
+    obligation: Optional[list[Duty]] = Field(default=None, description="""Obligations in the policy""", json_schema_extra = _slot_meta("Policy", "obligation"))
+    permission: Optional[list[Permission]] = Field(default=None, description="""Permissions in the policy""", json_schema_extra = _slot_meta("Policy", "permission"))
+    prohibition: Optional[list[Prohibition]] = Field(default=None, description="""Prohibitions in the policy""", json_schema_extra = _slot_meta("Policy", "prohibition"))
+
+
+class Set(Policy):
+    """
+    ODRL Set policy, the default subclass of Policy, representing any combination of Rules
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+
+
+class Rule(ConfiguredBaseModel):
+    """
+    'The Rule class is the parent of the Permission, Prohibition, and Duty classes. The Rule class represents the common characteristics of these three classes. A Rule class MUST be disjoint with all other Rule subclasses.
+    The Rule class has the following properties:
+    A Rule MUST have one action property value of type Action. A Rule MAY have none or one relation sub-property values of type Asset. A Rule MAY have none, one or many function sub-property values of type Party. A Rule MAY have none, one or many failure sub-property values of type Rule. A Rule MAY have none, one or many constraint property values of type Constraint/LogicalConstraint. A Rule MAY have none or one uid property values (of type IRI [rfc3987]) to identify the Rule so it MAY be referenced by other Rules.
+    Note: The above property cardinalities reflect the normative ODRL Information Model. In some cases, repeat occurrences of some properties are also supported (as described in Policy Rule Composition and Compact Policy) but the normative atomic Policy is consistent with the above property cardinalities.
+    Explicit sub-properties of the abstract relation, relation and failure properties must be used, the choice depending on the subclass of Rule in question.'
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    uid: str = Field(default=..., description="""Unique identifier for the duty or rule""", json_schema_extra = _slot_meta("Rule", "uid"))
+    description: Optional[str] = Field(default=None, description="""Description of the rule""", json_schema_extra = _slot_meta("Rule", "description"))
+    action: str = Field(default=..., description="""The action to be performed""", json_schema_extra = _slot_meta("Rule", "action"))
+    assignee: Optional[list[PartyCollection]] = Field(default=None, description="""To express the recipient Party of the Rule. In this context it is recommended to specify the role of the party responsible (see also https://docs.internationaldataspaces.org/ids-knowledgebase/idsa-rulebook/idsa-rulebook/2.-guiding-principles/2.5-role_models#core-roles)""", json_schema_extra = _slot_meta("Rule", "assignee"))
+
+
+class Permission(Rule):
+    """
+    Grants the assignee the right to perform an action.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    duty: Optional[list[str]] = Field(default=None, description="""Duties attached to permissions""", json_schema_extra = _slot_meta("Permission", "duty"))
+
+
+class Prohibition(Rule):
+    """
+    Denies the assignee the right to perform an action.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    remedy: Optional[list[str]] = Field(default=None, description="""Remedies for prohibitions""", json_schema_extra = _slot_meta("Prohibition", "remedy"))
+
+
+class Duty(Rule):
+    """
+    An obligation attached to a permission or prohibition.
+    """
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    consequence: Optional[list[str]] = Field(default=None, description="""The consequence property (a sub-property of the failure property) is utilised to express the repercussions of not fulfilling an agreed Policy obligation or duty for a Permission. If either of these fails to be fulfilled, then this will result in the consequence Duties also becoming new requirements, meaning that the original obligation or duty, as well as the consequence Duties MUST all be fulfilled.""", json_schema_extra = _slot_meta("Duty", "consequence"))
+
+
+class Container(ConfiguredBaseModel):
+    linkml_meta: ClassVar[LinkMLMeta] = _ClassMeta()
+
+    datasets: Optional[list[Dataset]] = Field(default=None, json_schema_extra = _slot_meta("Container", "datasets"))
+    concepts: Optional[list[Concept]] = Field(default=None, json_schema_extra = _slot_meta("Container", "concepts"))
+    series: Optional[list[DatasetSeries]] = Field(default=None, json_schema_extra = _slot_meta("Container", "series"))
+    dataCatalog: DataCatalog = Field(default=..., json_schema_extra = _slot_meta("Container", "dataCatalog"))
+    distributions: Optional[list[Distribution]] = Field(default=None, json_schema_extra = _slot_meta("Container", "distributions"))
+    metrics: Optional[list[Metric]] = Field(default=None, json_schema_extra = _slot_meta("Container", "metrics"))
+    qualityMeasurements: Optional[list[QualityMeasurement]] = Field(default=None, json_schema_extra = _slot_meta("Container", "qualityMeasurements"))
+    dataServices: Optional[list[DataService]] = Field(default=None, json_schema_extra = _slot_meta("Container", "dataServices"))
+    policies: Optional[list[Policy]] = Field(default=None, json_schema_extra = _slot_meta("Container", "policies"))
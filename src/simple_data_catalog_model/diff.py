@@ -0,0 +1,208 @@
+"""Entity-level diff, patch and three-way merge of catalogs.
+
+Every identified entity of a ``Container`` (by ``identifier``, or ``uid`` for
+policies) gets a content fingerprint: a hash of its canonical JSON form, with
+``None`` slots left out and keys sorted, so it does not depend on slot order or
+on which optional slots were spelled out. Inlined objects, such as the
+distributions of a dataset, are part of the fingerprint of their owner.
+
+Comparing two snapshots is then one pass over each: entities are matched by
+``(section, identifier)`` and compared by fingerprint. The fingerprints of a
+snapshot can be kept and passed back in, so only the new snapshot is hashed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from pydantic import BaseModel
+
+from .datamodel import Container
+from .index import Key, identifier_of
+from .streaming import SECTIONS, SINGLE_VALUED, iter_container
+
+Fingerprints = dict[Key, str]
+
+OURS = "ours"
+THEIRS = "theirs"
+
+
+def fingerprint(item: BaseModel) -> str:
+    """Return a stable content hash of a model object."""
+    data = item.model_dump(mode="json", exclude_none=True)
+    text = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _entities(container: Container) -> dict[Key, BaseModel]:
+    entities: dict[Key, BaseModel] = {}
+    for section, item in iter_container(container):
+        key = (section, identifier_of(item))
+        if key in entities:
+            raise ValueError(f"duplicate {section} identifier {key[1]!r}")
+        entities[key] = item
+    return entities
+
+
+def fingerprints(container: Container) -> Fingerprints:
+    """Return the fingerprint of every entity of ``container``, in document order."""
+    return {key: fingerprint(item) for key, item in _entities(container).items()}
+
+
+@dataclass
+class ChangeSet:
+    """The entities added, removed and modified between two snapshots.
+
+    ``added`` and ``modified`` hold the new versions; ``removed`` holds keys.
+    """
+
+    added: list[tuple[str, BaseModel]] = field(default_factory=list)
+    removed: list[Key] = field(default_factory=list)
+    modified: list[tuple[str, BaseModel]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.modified)
+
+    @property
+    def upserts(self) -> list[tuple[str, BaseModel]]:
+        """Added and modified entities, e.g. for ``IncrementalValidator.apply(added=...)``."""
+        return self.added + self.modified
+
+    def summary(self) -> dict[str, int]:
+        return {"added": len(self.added), "removed": len(self.removed), "modified": len(self.modified)}
+
+
+def diff(old: Container, new: Container, old_fingerprints: Optional[Fingerprints] = None) -> ChangeSet:
+    """Compute the change set that turns ``old`` into ``new``."""
+    if old_fingerprints is None:
+        old_fingerprints = fingerprints(old)
+    changes = ChangeSet()
+    seen: set[Key] = set()
+    for key, item in _entities(new).items():
+        seen.add(key)
+        previous = old_fingerprints.get(key)
+        if previous is None:
+            changes.added.append((key[0], item))
+        elif previous != fingerprint(item):
+            changes.modified.append((key[0], item))
+    changes.removed = [key for key in old_fingerprints if key not in seen]
+    return changes
+
+
+def _build(sections: dict[str, list[BaseModel]]) -> Container:
+    data: dict[str, Any] = {}
+    for section in SECTIONS:
+        items = sections.get(section) or []
+        if section in SINGLE_VALUED:
+            if len(items) > 1:
+                raise ValueError(f"more than one {section} after applying changes")
+            data[section] = items[0] if items else None
+        elif items:
+            data[section] = items
+    return Container(**data)
+
+
+def _assemble(entities: Iterator[tuple[Key, BaseModel]]) -> Container:
+    sections: dict[str, list[BaseModel]] = {}
+    for (section, _identifier), item in entities:
+        sections.setdefault(section, []).append(item)
+    return _build(sections)
+
+
+def apply(container: Container, changes: ChangeSet) -> Container:
+    """Return a new ``Container`` with ``changes`` applied to ``container``.
+
+    Entities keep their position; added ones are appended to their section.
+    Raises ``KeyError`` when a removed or modified entity does not exist and
+    ``ValueError`` when an added one already does.
+    """
+    entities = _entities(container)
+    for key in changes.removed:
+        del entities[key]
+    for section, item in changes.modified:
+        key = (section, identifier_of(item))
+        if key not in entities:
+            raise KeyError(key)
+        entities[key] = item
+    for section, item in changes.added:
+        key = (section, identifier_of(item))
+        if key in entities:
+            raise ValueError(f"cannot add {section} {key[1]!r}, it already exists")
+        entities[key] = item
+    return _assemble(iter(entities.items()))
+
+
+@dataclass
+class Conflict:
+    """An entity changed differently on both sides; ``None`` means removed (or absent)."""
+
+    key: Key
+    base: Optional[BaseModel]
+    ours: Optional[BaseModel]
+    theirs: Optional[BaseModel]
+
+    def __str__(self) -> str:
+        section, identifier = self.key
+
+        def state(item: Optional[BaseModel]) -> str:
+            return "removed" if item is None else "modified"
+
+        if self.base is None:
+            return f"{section} {identifier}: added differently on both sides"
+        return f"{section} {identifier}: {state(self.ours)} in ours, {state(self.theirs)} in theirs"
+
+
+@dataclass
+class MergeResult:
+    container: Container
+    conflicts: list[Conflict]
+
+    @property
+    def clean(self) -> bool:
+        return not self.conflicts
+
+
+def _slots(entities: dict[Key, BaseModel]) -> dict[Key, tuple[Key, BaseModel]]:
+    # A single-valued section has one slot whatever its identifier, so that
+    # changing the identifier on both sides is a conflict, not two entities.
+    return {((key[0], "") if key[0] in SINGLE_VALUED else key): (key, item) for key, item in entities.items()}
+
+
+def merge(base: Container, ours: Container, theirs: Container, prefer: str = OURS) -> MergeResult:
+    """Three-way merge of two catalogs derived from ``base``.
+
+    An entity changed on one side only takes that side's version (a removal is
+    a change). Entities changed on both sides to the same content merge
+    cleanly; otherwise a :class:`Conflict` is reported and the ``prefer`` side
+    (``"ours"`` or ``"theirs"``) is kept. Entities keep the order of ``base``,
+    followed by additions from ours and then from theirs. A single-valued
+    section such as ``dataCatalog`` is one entity even if its identifier is
+    changed.
+    """
+    if prefer not in (OURS, THEIRS):
+        raise ValueError(f"prefer must be {OURS!r} or {THEIRS!r}")
+    sides = [_slots(_entities(c)) for c in (base, ours, theirs)]
+    hashes = [{slot: fingerprint(item) for slot, (_key, item) in side.items()} for side in sides]
+    order = dict.fromkeys(slot for side in sides for slot in side)
+    merged: list[tuple[Key, BaseModel]] = []
+    conflicts: list[Conflict] = []
+    for slot in order:
+        b, o, t = (h.get(slot) for h in hashes)
+        entries = [side.get(slot) for side in sides]
+        if o == t or t == b:
+            pick = 1
+        elif o == b:
+            pick = 2
+        else:
+            key = next(entry[0] for entry in entries if entry is not None)
+            conflicts.append(Conflict(key, *(entry and entry[1] for entry in entries)))
+            pick = 1 if prefer == OURS else 2
+        if entries[pick] is not None:
+            merged.append(entries[pick])
+    return MergeResult(_assemble(iter(merged)), conflicts)
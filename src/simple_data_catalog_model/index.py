@@ -0,0 +1,285 @@
+"""Identifier lookup and reverse references over a ``Container``.
+
+Cross-references in the model are plain identifier strings. :class:`CatalogIndex`
+keeps every entity in a hash map per ``Container`` slot and maintains the
+reverse side of each reference slot, so questions like "which datasets are in
+this series" or "which measurements were computed on this dataset" are a dict
+lookup instead of a scan. The index is updated in place by :meth:`add`,
+:meth:`remove` and :meth:`update`; it does not modify the ``Container`` it was
+built from, use :meth:`to_container` to get one back.
+
+Distributions inlined in a dataset (or series, or catalog) are found by
+:meth:`CatalogIndex.get` as ``"distributions"`` and are valid targets of
+references such as ``computedOn``, for as long as an entity holding them is
+indexed. Rules are indexed by ``uid`` through the policy that holds them, so
+a rule ``uid`` must be unique across policies.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional
+
+from pydantic import BaseModel
+
+from .datamodel import Container, Policy
+from .streaming import SECTIONS, SINGLE_VALUED, iter_container
+
+RESOURCES = ("dataCatalog", "datasets", "series", "dataServices")
+DATASETS = ("datasets", "series", "dataCatalog")
+RULE_LISTS = ("permission", "prohibition", "obligation")
+
+
+@dataclass(frozen=True)
+class Reference:
+    """A slot whose values are identifiers of entities in ``targets``."""
+
+    slot: str
+    sources: tuple[str, ...]
+    targets: tuple[str, ...]
+    # Inlined slots hold the referenced objects themselves; they get reverse
+    # edges but can never dangle.
+    inlined: bool = False
+
+
+REFERENCES = (
+    Reference("dataset", ("dataCatalog",), DATASETS),
+    Reference("inSeries", DATASETS, ("series",)),
+    Reference("distribution", DATASETS, ("distributions",), inlined=True),
+    Reference("theme", RESOURCES, ("concepts",)),
+    Reference("hasPolicy", RESOURCES, ("policies",)),
+    Reference("wasDerivedFrom", RESOURCES, RESOURCES),
+    Reference("servesDataset", ("dataServices",), DATASETS),
+    Reference("computedOn", ("qualityMeasurements",), RESOURCES + ("distributions",)),
+    Reference("isMeasurementOf", ("qualityMeasurements",), ("metrics",)),
+    Reference("duty", ("rules",), ("rules",)),
+    Reference("remedy", ("rules",), ("rules",)),
+    Reference("consequence", ("rules",), ("rules",)),
+)
+
+# Kinds that are indexed: every Container slot plus the rules nested in policies.
+KINDS = tuple(SECTIONS) + ("rules",)
+
+Key = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class DanglingReference:
+    """A reference whose target is not in the index."""
+
+    kind: str
+    identifier: str
+    slot: str
+    target: str
+
+    def __str__(self) -> str:
+        return f"{self.kind} {self.identifier}: {self.slot} -> {self.target} does not exist"
+
+
+def identifier_of(item: BaseModel) -> str:
+    """Return the identifying slot value of a model object (``identifier`` or ``uid``)."""
+    value = getattr(item, "identifier", None)
+    if value is None:
+        value = getattr(item, "uid", None)
+    if value is None:
+        raise ValueError(f"{type(item).__name__} has no identifier")
+    return value
+
+
+def _values(value: Any) -> Iterator[str]:
+    if value is None:
+        return
+    if isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _values(v)
+    elif isinstance(value, BaseModel):
+        yield identifier_of(value)
+    else:
+        yield value
+
+
+def iter_rules(policy: Policy) -> Iterator[BaseModel]:
+    """Yield the rules held directly by a policy."""
+    for attr in RULE_LISTS:
+        yield from getattr(policy, attr) or ()
+
+
+class CatalogIndex:
+    """Hash lookup by identifier and precomputed reverse references."""
+
+    def __init__(self, container: Optional[Container] = None):
+        self._items: dict[str, dict[str, BaseModel]] = {kind: {} for kind in KINDS}
+        # slot -> target identifier -> ordered set of referring (kind, identifier)
+        self._reverse: dict[str, dict[str, dict[Key, None]]] = {ref.slot: {} for ref in REFERENCES}
+        # rule uid -> uid of the policy that holds it
+        self._rule_policy: dict[str, str] = {}
+        self._references = {kind: [ref for ref in REFERENCES if kind in ref.sources] for kind in KINDS}
+        if container is not None:
+            for kind, item in iter_container(container):
+                self.add(kind, item)
+
+    def __len__(self) -> int:
+        return sum(len(items) for kind, items in self._items.items() if kind != "rules")
+
+    def __contains__(self, identifier: str) -> bool:
+        return any(identifier in items for items in self._items.values()) or identifier in self._reverse["distribution"]
+
+    def get(self, identifier: str, kind: Optional[str] = None) -> Optional[BaseModel]:
+        """Return the entity with ``identifier``, optionally only of one ``kind``."""
+        if kind is not None:
+            item = self._items[kind].get(identifier)
+            if item is None and kind == "distributions":
+                return self._inlined_distribution(identifier)
+            return item
+        for items in self._items.values():
+            if identifier in items:
+                return items[identifier]
+        return self._inlined_distribution(identifier)
+
+    def _inlined_distribution(self, identifier: str) -> Optional[BaseModel]:
+        # The first indexed entity that inlines it.
+        for kind, owner in self._reverse["distribution"].get(identifier, ()):
+            for distribution in self._items[kind][owner].distribution or ():
+                if distribution.identifier == identifier:
+                    return distribution
+        return None
+
+    def _exists(self, target: str, kinds: Iterable[str]) -> bool:
+        return any(
+            target in self._items[kind] or (kind == "distributions" and target in self._reverse["distribution"])
+            for kind in kinds
+        )
+
+    def entities(self, kind: str) -> Iterable[BaseModel]:
+        return self._items[kind].values()
+
+    def policy_of_rule(self, uid: str) -> Optional[Policy]:
+        policy_uid = self._rule_policy.get(uid)
+        return None if policy_uid is None else self._items["policies"][policy_uid]
+
+    # -- maintenance ------------------------------------------------------
+
+    def add(self, kind: str, item: BaseModel) -> None:
+        """Add ``item`` under ``kind``, replacing an entity with the same identifier."""
+        if kind == "rules":
+            raise ValueError("rules are indexed through the policy that holds them")
+        identifier = identifier_of(item)
+        if kind == "policies":
+            self._check_rules(identifier, item)
+        if identifier in self._items[kind]:
+            self.remove(kind, identifier)
+        if kind in SINGLE_VALUED:
+            for other in list(self._items[kind]):
+                self.remove(kind, other)
+        self._items[kind][identifier] = item
+        self._link(kind, identifier, item)
+        if kind == "policies":
+            for rule in iter_rules(item):
+                self._items["rules"][rule.uid] = rule
+                self._rule_policy[rule.uid] = identifier
+                self._link("rules", rule.uid, rule)
+
+    def _check_rules(self, identifier: str, policy: Policy) -> None:
+        seen: set[str] = set()
+        for rule in iter_rules(policy):
+            owner = self._rule_policy.get(rule.uid, identifier)
+            if rule.uid in seen or owner != identifier:
+                where = "twice in policy" if rule.uid in seen else f"in policies {owner!r} and"
+                raise ValueError(f"rule {rule.uid!r} appears {where} {identifier!r}")
+            seen.add(rule.uid)
+
+    def remove(self, kind: str, identifier: str) -> BaseModel:
+        """Remove and return the entity ``identifier`` of ``kind``."""
+        item = self._items[kind].pop(identifier)
+        self._unlink(kind, identifier, item)
+        if kind == "policies":
+            for rule in iter_rules(item):
+                if self._rule_policy.get(rule.uid) == identifier:
+                    del self._rule_policy[rule.uid]
+                    del self._items["rules"][rule.uid]
+                    self._unlink("rules", rule.uid, rule)
+        return item
+
+    def update(self, kind: str, item: BaseModel) -> None:
+        """Replace the stored entity with the same identifier as ``item``."""
+        identifier = identifier_of(item)
+        if identifier not in self._items[kind]:
+            raise KeyError(identifier)
+        self.add(kind, item)
+
+    def _link(self, kind: str, identifier: str, item: BaseModel) -> None:
+        key = (kind, identifier)
+        for ref in self._references[kind]:
+            edges = self._reverse[ref.slot]
+            for target in _values(getattr(item, ref.slot, None)):
+                edges.setdefault(target, {})[key] = None
+
+    def _unlink(self, kind: str, identifier: str, item: BaseModel) -> None:
+        key = (kind, identifier)
+        for ref in self._references[kind]:
+            edges = self._reverse[ref.slot]
+            for target in _values(getattr(item, ref.slot, None)):
+                referrers = edges.get(target)
+                if referrers is not None:
+                    referrers.pop(key, None)
+                    if not referrers:
+                        del edges[target]
+
+    # -- reverse references -------------------------------------------------
+
+    def referrers(self, target: str, slot: str) -> list[Key]:
+        """Return ``(kind, identifier)`` of every entity whose ``slot`` refers to ``target``."""
+        return list(self._reverse[slot].get(target, ()))
+
+    def _referring(self, target: str, slot: str, kinds: Iterable[str] = KINDS) -> list[BaseModel]:
+        return [self._items[kind][i] for kind, i in self._reverse[slot].get(target, ()) if kind in kinds]
+
+    def datasets_in_series(self, series: str) -> list[BaseModel]:
+        return self._referring(series, "inSeries")
+
+    def datasets_with_theme(self, concept: str) -> list[BaseModel]:
+        return self._referring(concept, "theme", DATASETS)
+
+    def resources_with_policy(self, policy: str) -> list[BaseModel]:
+        return self._referring(policy, "hasPolicy")
+
+    def catalogs_listing(self, dataset: str) -> list[BaseModel]:
+        return self._referring(dataset, "dataset")
+
+    def datasets_with_distribution(self, distribution: str) -> list[BaseModel]:
+        return self._referring(distribution, "distribution")
+
+    def services_serving(self, dataset: str) -> list[BaseModel]:
+        return self._referring(dataset, "servesDataset")
+
+    def measurements_on(self, resource: str) -> list[BaseModel]:
+        return self._referring(resource, "computedOn")
+
+    def measurements_of_metric(self, metric: str) -> list[BaseModel]:
+        return self._referring(metric, "isMeasurementOf")
+
+    # -- integrity ------------------------------------------------------------
+
+    def dangling(self) -> list[DanglingReference]:
+        """Return every reference whose target is not indexed, in one pass over the edges."""
+        found = []
+        for ref in REFERENCES:
+            if ref.inlined:
+                continue
+            for target, referrers in self._reverse[ref.slot].items():
+                if self._exists(target, ref.targets):
+                    continue
+                for kind, identifier in referrers:
+                    found.append(DanglingReference(kind, identifier, ref.slot, target))
+        return found
+
+    def to_container(self) -> Container:
+        """Build a ``Container`` holding the currently indexed entities."""
+        data: dict[str, Any] = {}
+        for kind in SECTIONS:
+            items = list(self._items[kind].values())
+            if kind in SINGLE_VALUED:
+                data[kind] = items[0] if items else None
+            elif items:
+                data[kind] = items
+        return Container(**data)
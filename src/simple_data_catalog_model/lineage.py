@@ -0,0 +1,364 @@
+"""Lineage and impact queries over the reference graph of a catalog.
+
+:class:`LineageGraph` turns the reference slots of a catalog into a compact
+graph: every catalog, dataset, series, distribution, concept, metric, quality
+measurement, data service and policy is a node numbered ``0 .. n-1``, and the
+edges (referring entity -> referenced entity, labelled with the slot) are kept
+twice in CSR form, as numpy offset and target arrays, once per direction. The
+slots followed are :data:`LINEAGE_SLOTS`: ``dataset``, ``inSeries``,
+``distribution``, ``theme``, ``hasPolicy``, ``servesDataset``, ``computedOn``
+and ``isMeasurementOf``. ``distribution`` is included so that a change to a
+``Distribution`` reaches the datasets that hold it. Inlined distributions
+become nodes of their own. References to entities that are not in the catalog
+are left out; :attr:`LineageGraph.dangling` counts them.
+
+:meth:`LineageGraph.traverse` runs a breadth-first search from many roots at
+once. The roots are processed in batches of 64, and a node carries one bit per
+root of its batch, so a level of the search is a handful of array operations
+shared by the whole batch instead of a walk per root. A search can follow the
+edges forwards (``"out"``: what the root refers to), backwards (``"in"``: what
+refers to the root) or both. It can be limited to ``depth`` levels and can stop
+at nodes of given kinds: they are reached but not expanded.
+:meth:`LineageGraph.impact` is the search used before changing an entity. It
+follows both directions and stops at the catalog and at the shared concepts,
+metrics and policies (:data:`HUBS`). Otherwise the catalog, which lists every
+dataset, or one common theme would put everything in the blast radius of every
+dataset. Results are kept in an LRU cache keyed by root and search parameters.
+
+The graph is a snapshot of the catalog it was built from. Build a new one after
+changing the catalog; the cache goes with it.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Collection, Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from .datamodel import Container
+from .index import REFERENCES, CatalogIndex, Key, identifier_of
+from .streaming import SECTIONS
+
+LINEAGE_SLOTS = (
+    "dataset",
+    "inSeries",
+    "distribution",
+    "theme",
+    "hasPolicy",
+    "servesDataset",
+    "computedOn",
+    "isMeasurementOf",
+)
+# Shared entities an impact search reports but does not cross.
+HUBS = ("dataCatalog", "concepts", "metrics", "policies")
+DIRECTIONS = ("in", "out", "both")
+KINDS = tuple(SECTIONS)
+
+_BATCH = 64
+Root = Union[Key, str]
+
+
+@dataclass(frozen=True)
+class Edge:
+    source: Key
+    slot: str
+    target: Key
+
+
+@dataclass
+class Subgraph:
+    """The nodes reached from ``root`` with their distance, and the edges between them."""
+
+    root: Key
+    nodes: dict[Key, int]
+    edges: list[Edge] = field(default_factory=list)
+
+    def to_dict(self, index: Optional[CatalogIndex] = None) -> dict[str, Any]:
+        """Return the subgraph as plain JSON data, with each entity's data when ``index`` is given."""
+        nodes = []
+        for (kind, identifier), depth in self.nodes.items():
+            node: dict[str, Any] = {"kind": kind, "identifier": identifier, "depth": depth}
+            item = None if index is None else index.get(identifier, kind)
+            if item is not None:
+                node["data"] = item.model_dump(mode="json", exclude_none=True)
+            nodes.append(node)
+        return {
+            "root": {"kind": self.root[0], "identifier": self.root[1]},
+            "nodes": nodes,
+            "edges": [
+                {"source": list(edge.source), "slot": edge.slot, "target": list(edge.target)} for edge in self.edges
+            ],
+        }
+
+
+@dataclass(frozen=True)
+class _Adjacency:
+    """Edges in CSR form: the edges of node ``i`` are ``offsets[i] .. offsets[i + 1]``."""
+
+    offsets: np.ndarray
+    targets: np.ndarray
+    slots: np.ndarray
+
+    @classmethod
+    def build(cls, n: int, sources: np.ndarray, targets: np.ndarray, slots: np.ndarray) -> _Adjacency:
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+        return cls(offsets, targets[order], slots[order])
+
+    def edges_of(self, nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the position in ``nodes`` of the source of each edge of ``nodes``, and the edge numbers."""
+        starts = self.offsets[nodes]
+        counts = self.offsets[nodes + 1] - starts
+        owners = np.repeat(np.arange(len(nodes)), counts)
+        # Edge numbers: start of the owner plus the position within its run.
+        firsts = np.cumsum(counts) - counts
+        return owners, starts[owners] + np.arange(counts.sum()) - firsts[owners]
+
+
+class LineageGraph:
+    """Reference graph of a catalog, with batched breadth-first search and cached results."""
+
+    def __init__(
+        self,
+        source: Union[Container, CatalogIndex],
+        slots: Iterable[str] = LINEAGE_SLOTS,
+        cache_size: int = 4096,
+    ):
+        self.index = source if isinstance(source, CatalogIndex) else CatalogIndex(source)
+        self.slots = tuple(slots)
+        self.dangling = 0
+        self._cache: OrderedDict[tuple, dict[Key, int]] = OrderedDict()
+        self._cache_size = cache_size
+
+        self._nodes: list[Key] = []
+        self._ids: dict[Key, int] = {}
+        for kind in KINDS:
+            for item in self.index.entities(kind):
+                self._node((kind, identifier_of(item)))
+
+        sources: list[int] = []
+        targets: list[int] = []
+        slot_numbers: list[int] = []
+        references = [ref for ref in REFERENCES if ref.slot in self.slots]
+        for number, ref in enumerate(references):
+            for kind in ref.sources:
+                if kind not in SECTIONS:
+                    continue
+                for item in self.index.entities(kind):
+                    source_id = self._ids[(kind, identifier_of(item))]
+                    value = getattr(item, ref.slot, None)
+                    for target in value if isinstance(value, list) else ([] if value is None else [value]):
+                        target_id = self._target(ref.targets, target, ref.inlined)
+                        if target_id is None:
+                            self.dangling += 1
+                            continue
+                        sources.append(source_id)
+                        targets.append(target_id)
+                        slot_numbers.append(number)
+        self._slot_names = tuple(ref.slot for ref in references)
+
+        n = len(self._nodes)
+        sources_array = np.array(sources, dtype=np.int32)
+        targets_array = np.array(targets, dtype=np.int32)
+        slots_array = np.array(slot_numbers, dtype=np.uint8)
+        self._out = _Adjacency.build(n, sources_array, targets_array, slots_array)
+        self._in = _Adjacency.build(n, targets_array, sources_array, slots_array)
+        self._kinds = np.array([KINDS.index(kind) for kind, _identifier in self._nodes], dtype=np.uint8)
+
+    def _node(self, key: Key) -> int:
+        number = self._ids.get(key)
+        if number is None:
+            number = self._ids[key] = len(self._nodes)
+            self._nodes.append(key)
+        return number
+
+    def _target(self, kinds: tuple[str, ...], target: Any, inlined: bool) -> Optional[int]:
+        if inlined:
+            # An inlined distribution is a node even when the Container does not list it.
+            return self._node((kinds[0], identifier_of(target)))
+        for kind in kinds:
+            number = self._ids.get((kind, target))
+            if number is not None:
+                return number
+        return None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._out.targets)
+
+    def __contains__(self, root: Root) -> bool:
+        try:
+            self._resolve(root)
+        except KeyError:
+            return False
+        return True
+
+    def _resolve(self, root: Root) -> int:
+        if isinstance(root, tuple):
+            return self._ids[root]
+        for kind in KINDS:
+            number = self._ids.get((kind, root))
+            if number is not None:
+                return number
+        raise KeyError(root)
+
+    # -- neighbours -----------------------------------------------------------------
+
+    def edges(self, root: Root, direction: str = "both") -> list[Edge]:
+        """Return the edges of one node: those it refers along (``out``) and is referred by (``in``)."""
+        node = np.array([self._resolve(root)])
+        found = []
+        if direction in ("out", "both"):
+            _owners, numbers = self._out.edges_of(node)
+            key = self._nodes[node[0]]
+            found += [Edge(key, self._slot_names[s], self._nodes[t])
+                      for t, s in zip(self._out.targets[numbers], self._out.slots[numbers])]
+        if direction in ("in", "both"):
+            _owners, numbers = self._in.edges_of(node)
+            key = self._nodes[node[0]]
+            found += [Edge(self._nodes[s], self._slot_names[slot], key)
+                      for s, slot in zip(self._in.targets[numbers], self._in.slots[numbers])]
+        return found
+
+    # -- search -----------------------------------------------------------------------
+
+    def traverse(
+        self,
+        roots: Sequence[Root],
+        depth: Optional[int] = None,
+        direction: str = "both",
+        stop: Collection[str] = (),
+    ) -> list[dict[Key, int]]:
+        """Return, for each root, the nodes it reaches mapped to their distance, in breadth-first order.
+
+        ``depth`` limits the number of edges followed (``None``: no limit).
+        Nodes of a kind in ``stop`` are reached but not expanded, unless they
+        are the root. Roots are keys ``(kind, identifier)`` or bare
+        identifiers; an unknown root raises ``KeyError``.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {DIRECTIONS}, not {direction!r}")
+        stop = frozenset(stop)
+        unknown = stop - set(KINDS)
+        if unknown:
+            raise ValueError(f"unknown kinds {sorted(unknown)}")
+        numbers = [self._resolve(root) for root in roots]
+        results: list[Optional[dict[Key, int]]] = []
+        missing: dict[int, list[int]] = {}
+        for position, number in enumerate(numbers):
+            cached = self._cache_get((number, depth, direction, stop))
+            results.append(cached)
+            if cached is None:
+                missing.setdefault(number, []).append(position)
+
+        pending = list(missing)
+        for start in range(0, len(pending), _BATCH):
+            batch = pending[start : start + _BATCH]
+            for number, reached in zip(batch, self._search(batch, depth, direction, stop)):
+                self._cache_put((number, depth, direction, stop), reached)
+                for position in missing[number]:
+                    results[position] = reached
+        # Copies, so callers cannot alter the cache.
+        return [dict(result) for result in results]
+
+    def reach(
+        self, root: Root, depth: Optional[int] = None, direction: str = "both", stop: Collection[str] = ()
+    ) -> dict[Key, int]:
+        """:meth:`traverse` for a single root."""
+        return self.traverse([root], depth, direction, stop)[0]
+
+    def impact(self, roots: Union[Root, Sequence[Root]], depth: Optional[int] = None) -> list[dict[Key, int]]:
+        """Return the blast radius of each root: attached entities in both directions, stopping at :data:`HUBS`."""
+        if isinstance(roots, (str, tuple)):
+            roots = [roots]
+        return self.traverse(roots, depth, "both", HUBS)
+
+    def _search(
+        self, batch: list[int], depth: Optional[int], direction: str, stop: frozenset[str]
+    ) -> list[dict[Key, int]]:
+        n = len(self._nodes)
+        visited = np.zeros(n, dtype=np.uint64)
+        frontier = np.zeros(n, dtype=np.uint64)
+        bits = np.left_shift(np.uint64(1), np.arange(len(batch), dtype=np.uint64))
+        frontier[batch] = bits
+        visited[batch] = bits
+        reached: list[dict[Key, int]] = [{self._nodes[number]: 0} for number in batch]
+        adjacencies = [adj for name, adj in (("out", self._out), ("in", self._in)) if direction in (name, "both")]
+        blocked = np.isin(self._kinds, [KINDS.index(kind) for kind in stop]) if stop else None
+
+        level = 0
+        while depth is None or level < depth:
+            if blocked is not None and level:
+                frontier[blocked] = 0
+            active = np.flatnonzero(frontier)
+            if not len(active):
+                break
+            level += 1
+            following = np.zeros(n, dtype=np.uint64)
+            for adjacency in adjacencies:
+                owners, numbers = adjacency.edges_of(active)
+                np.bitwise_or.at(following, adjacency.targets[numbers], frontier[active][owners])
+            following &= ~visited
+            visited |= following
+            new = np.flatnonzero(following)
+            for position, bit in enumerate(bits):
+                for number in new[(following[new] & bit) != 0].tolist():
+                    reached[position][self._nodes[number]] = level
+            frontier = following
+        return reached
+
+    def _cache_get(self, key: tuple) -> Optional[dict[Key, int]]:
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key: tuple, value: dict[Key, int]) -> None:
+        self._cache[key] = value
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    # -- export -----------------------------------------------------------------------
+
+    def subgraph(
+        self,
+        root: Root,
+        depth: Optional[int] = None,
+        direction: str = "both",
+        stop: Collection[str] = (),
+    ) -> Subgraph:
+        """Return the nodes reached from ``root`` and every edge between two of them."""
+        nodes = self.reach(root, depth, direction, stop)
+        numbers = np.array([self._ids[key] for key in nodes], dtype=np.int64)
+        inside = np.zeros(len(self._nodes), dtype=bool)
+        inside[numbers] = True
+        owners, edge_numbers = self._out.edges_of(numbers)
+        targets = self._out.targets[edge_numbers]
+        keep = inside[targets]
+        edges = [
+            Edge(self._nodes[source], self._slot_names[slot], self._nodes[target])
+            for source, slot, target in zip(
+                numbers[owners[keep]].tolist(), self._out.slots[edge_numbers[keep]].tolist(), targets[keep].tolist()
+            )
+        ]
+        return Subgraph(self._nodes[self._resolve(root)], nodes, edges)
+
+    def export(
+        self,
+        root: Root,
+        depth: Optional[int] = None,
+        direction: str = "both",
+        stop: Collection[str] = (),
+        data: bool = False,
+    ) -> dict[str, Any]:
+        """Return :meth:`subgraph` as JSON data, with the entities' own data when ``data`` is true."""
+        return self.subgraph(root, depth, direction, stop).to_dict(self.index if data else None)
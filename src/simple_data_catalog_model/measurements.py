@@ -0,0 +1,389 @@
+"""Columnar storage of ``QualityMeasurement`` time series.
+
+:class:`MeasurementStore` keeps measurements as NumPy columns instead of model
+objects: ``computedOn`` and ``isMeasurementOf`` are dictionary encoded into
+integer codes, ``value`` is a float column and ``generatedAtTime`` a
+``datetime64[D]`` column. Missing values are ``NaN`` and ``NaT``; missing
+metrics have code ``-1``. The ``inDimension`` of each known metric is kept in a
+lookup array, so measurements can be grouped by quality dimension without a
+join.
+
+Aggregations are computed with sorting and ``reduceat`` over whole columns and
+ignore measurements without a value, and, when a time window is given, without
+a date.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from .datamodel import Container, Metric, QualityMeasurement
+
+GROUPINGS = ("dataset", "metric", "dimension")
+
+By = Union[str, Sequence[str]]
+DateLike = Union[date, str, np.datetime64]
+
+
+class Vocabulary:
+    """Dictionary encoding of strings to dense integer codes."""
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+        for value in values:
+            self.code(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def get(self, value: str) -> int:
+        """Return the code of ``value``, or ``-1`` if it was never encoded."""
+        return self._codes.get(value, -1)
+
+    def encode(self, values: Sequence[Optional[str]]) -> np.ndarray:
+        """Encode a column of strings at once; ``None`` becomes ``-1``."""
+        codes, code = self._codes, self.code
+        return np.fromiter(
+            (-1 if v is None else codes[v] if v in codes else code(v) for v in values),
+            dtype=np.int32,
+            count=len(values),
+        )
+
+
+@dataclass
+class Aggregate:
+    """Per-group statistics; ``labels[i]`` names the group of row ``i`` of each array."""
+
+    labels: list
+    count: np.ndarray
+    mean: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    latest: np.ndarray
+    latest_date: np.ndarray
+
+    def as_dict(self) -> dict[Any, dict[str, Any]]:
+        return {
+            label: {
+                "count": int(self.count[i]),
+                "mean": float(self.mean[i]),
+                "min": float(self.min[i]),
+                "max": float(self.max[i]),
+                "latest": float(self.latest[i]),
+                "latest_date": _to_date(self.latest_date[i]),
+            }
+            for i, label in enumerate(self.labels)
+        }
+
+
+@dataclass
+class RollingMean:
+    """Rolling means per group over a daily axis: ``mean[i, j]`` is group ``labels[i]`` on ``dates[j]``."""
+
+    labels: list
+    dates: np.ndarray
+    mean: np.ndarray
+    count: np.ndarray
+
+
+def _to_date(value: np.datetime64) -> Optional[date]:
+    return None if np.isnat(value) else value.astype(object)
+
+
+def _day(value: Optional[DateLike]) -> Optional[np.datetime64]:
+    return None if value is None else np.datetime64(value, "D")
+
+
+class MeasurementStore:
+    """Column store of quality measurements with vectorized aggregation."""
+
+    def __init__(self, metrics: Iterable[Metric] = (), capacity: int = 1024):
+        self.resources = Vocabulary()
+        self.metrics = Vocabulary()
+        self.dimensions = Vocabulary()
+        # metric code -> dimension code (-1: unknown metric or no inDimension)
+        self._metric_dimension = np.empty(0, dtype=np.int32)
+        self._size = 0
+        self._identifier = np.empty(capacity, dtype=object)
+        self._resource = np.empty(capacity, dtype=np.int32)
+        self._metric = np.empty(capacity, dtype=np.int32)
+        self._value = np.empty(capacity, dtype=np.float64)
+        self._date = np.empty(capacity, dtype="datetime64[D]")
+        self.add_metrics(metrics)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # -- loading ----------------------------------------------------------------
+
+    @classmethod
+    def from_container(cls, container: Container) -> MeasurementStore:
+        store = cls(container.metrics or (), capacity=max(len(container.qualityMeasurements or ()), 1))
+        store.extend(container.qualityMeasurements or ())
+        return store
+
+    def add_metrics(self, metrics: Iterable[Metric]) -> None:
+        """Register metrics so their measurements can be grouped by ``inDimension``."""
+        metrics = list(metrics)
+        codes = [self.metrics.code(metric.identifier) for metric in metrics]
+        self._sync_dimensions()
+        for code, metric in zip(codes, metrics):
+            dimension = -1 if metric.inDimension is None else self.dimensions.code(metric.inDimension)
+            self._metric_dimension[code] = dimension
+
+    def extend(self, measurements: Iterable[QualityMeasurement]) -> None:
+        """Append ``QualityMeasurement`` objects."""
+        identifiers, computed_on, metrics, values, dates = [], [], [], [], []
+        for m in measurements:
+            identifiers.append(m.identifier)
+            computed_on.append(m.computedOn)
+            metrics.append(m.isMeasurementOf)
+            values.append(np.nan if m.value is None else m.value)
+            dates.append(m.generatedAtTime)
+        self.append(identifiers, computed_on, metrics, values, dates)
+
+    def append(
+        self,
+        identifiers: Sequence[str],
+        computed_on: Sequence[str],
+        metrics: Sequence[Optional[str]],
+        values: Union[Sequence[Optional[float]], np.ndarray],
+        dates: Union[Sequence[Optional[DateLike]], np.ndarray],
+    ) -> None:
+        """Bulk append equally long columns; ``NaN``/``None`` values and dates are missing."""
+        n = len(identifiers)
+        if not all(len(column) == n for column in (computed_on, metrics, values, dates)):
+            raise ValueError("all columns must have the same length")
+        if not isinstance(values, np.ndarray):
+            values = [np.nan if v is None else v for v in values]
+        if not isinstance(dates, np.ndarray):
+            dates = [np.datetime64("NaT") if d is None else d for d in dates]
+        values = np.asarray(values, dtype=np.float64)
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        self._reserve(n)
+        end = self._size + n
+        self._identifier[self._size:end] = identifiers
+        self._resource[self._size:end] = self.resources.encode(computed_on)
+        self._metric[self._size:end] = self.metrics.encode(metrics)
+        self._value[self._size:end] = values
+        self._date[self._size:end] = dates
+        self._size = end
+        self._sync_dimensions()
+
+    def _reserve(self, n: int) -> None:
+        needed = self._size + n
+        capacity = len(self._value)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity = max(2 * capacity, 1024)
+        for name in ("_identifier", "_resource", "_metric", "_value", "_date"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+    def _sync_dimensions(self) -> None:
+        missing = len(self.metrics) - len(self._metric_dimension)
+        if missing > 0:
+            self._metric_dimension = np.concatenate([self._metric_dimension, np.full(missing, -1, dtype=np.int32)])
+
+    # -- columns ----------------------------------------------------------------
+
+    @property
+    def identifiers(self) -> np.ndarray:
+        return self._identifier[: self._size]
+
+    @property
+    def resource_codes(self) -> np.ndarray:
+        return self._resource[: self._size]
+
+    @property
+    def metric_codes(self) -> np.ndarray:
+        return self._metric[: self._size]
+
+    @property
+    def dimension_codes(self) -> np.ndarray:
+        codes = self.metric_codes
+        return np.where(codes >= 0, self._metric_dimension[codes], -1)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._value[: self._size]
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self._date[: self._size]
+
+    # -- conversion -------------------------------------------------------------
+
+    def to_measurements(self) -> list[QualityMeasurement]:
+        """Return the stored rows as ``QualityMeasurement`` objects, in insertion order."""
+        resources = self.resources.values
+        metrics = self.metrics.values
+        measurements = []
+        for identifier, resource, metric, value, day in zip(
+            self.identifiers, self.resource_codes.tolist(), self.metric_codes.tolist(),
+            self.values.tolist(), self.dates.astype(object),
+        ):
+            measurements.append(
+                QualityMeasurement(
+                    identifier=identifier,
+                    computedOn=resources[resource],
+                    isMeasurementOf=None if metric < 0 else metrics[metric],
+                    value=None if value != value else value,
+                    generatedAtTime=day,
+                )
+            )
+        return measurements
+
+    # -- aggregation ------------------------------------------------------------
+
+    def _groups(self, by: By) -> tuple[np.ndarray, list]:
+        """Return a code per row (``-1``: no group) and the label of each code."""
+        names = (by,) if isinstance(by, str) else tuple(by)
+        columns = []
+        for name in names:
+            if name == "dataset":
+                columns.append((self.resource_codes, self.resources.values))
+            elif name == "metric":
+                columns.append((self.metric_codes, self.metrics.values))
+            elif name == "dimension":
+                columns.append((self.dimension_codes, self.dimensions.values))
+            else:
+                raise ValueError(f"cannot group by {name!r}, use one of {GROUPINGS}")
+        if len(columns) == 1:
+            return columns[0]
+        valid = np.logical_and.reduce([codes >= 0 for codes, _ in columns])
+        shape = tuple(max(len(labels), 1) for _, labels in columns)
+        combined = np.full(self._size, -1, dtype=np.int64)
+        combined[valid] = np.ravel_multi_index(tuple(codes[valid] for codes, _ in columns), shape)
+        used, combined[valid] = np.unique(combined[valid], return_inverse=True)
+        labels = [
+            tuple(labels[i] for (_, labels), i in zip(columns, index))
+            for index in zip(*np.unravel_index(used, shape))
+        ]
+        return combined, labels
+
+    def _selection(self, codes: np.ndarray, start: Optional[np.datetime64], end: Optional[np.datetime64]) -> np.ndarray:
+        mask = (codes >= 0) & ~np.isnan(self.values)
+        if start is not None or end is not None:
+            dates = self.dates
+            mask &= ~np.isnat(dates)
+            if start is not None:
+                mask &= dates >= start
+            if end is not None:
+                mask &= dates <= end
+        return mask
+
+    def aggregate(self, by: By = "dataset", start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> Aggregate:
+        """Count, mean, min, max and latest value per group, over ``[start, end]``.
+
+        ``by`` is ``"dataset"``, ``"metric"``, ``"dimension"`` or a sequence of
+        them. The latest value is the one with the most recent date; rows without
+        a date sort first and ties go to the last appended row.
+        """
+        codes, labels = self._groups(by)
+        mask = self._selection(codes, _day(start), _day(end))
+        groups = codes[mask]
+        values = self.values[mask]
+        dates = self.dates[mask]
+        # NaT sorts as the smallest integer, i.e. oldest.
+        order = np.lexsort((dates.view(np.int64), groups))
+        groups, values, dates = groups[order], values[order], dates[order]
+        if len(groups) == 0:
+            empty = np.empty(0)
+            return Aggregate([], np.empty(0, dtype=np.int64), empty, empty, empty, empty, np.empty(0, dtype="datetime64[D]"))
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        ends = np.r_[starts[1:], len(groups)] - 1
+        count = np.diff(np.r_[starts, len(groups)])
+        return Aggregate(
+            labels=[labels[g] for g in groups[starts]],
+            count=count,
+            mean=np.add.reduceat(values, starts) / count,
+            min=np.minimum.reduceat(values, starts),
+            max=np.maximum.reduceat(values, starts),
+            latest=values[ends],
+            latest_date=dates[ends],
+        )
+
+    def latest(self, by: By = "dataset", start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> dict[Any, float]:
+        """Return the most recent value per group."""
+        result = self.aggregate(by, start, end)
+        return dict(zip(result.labels, result.latest.tolist()))
+
+    def rolling_mean(
+        self,
+        window: int,
+        by: By = "dataset",
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> RollingMean:
+        """Mean per group and day over the ``window`` days ending on that day.
+
+        The daily axis runs from ``start`` to ``end`` (by default the first and
+        last measurement date); measurements up to ``window - 1`` days before
+        ``start`` contribute to the first days. Days without measurements in
+        their window are ``NaN``. An explicit ``start`` after an explicit
+        ``end`` raises ``ValueError``; an empty axis gives an empty result.
+        """
+        if window < 1:
+            raise ValueError("window must be at least one day")
+        codes, labels = self._groups(by)
+        start, end = _day(start), _day(end)
+        if start is not None and end is not None and start > end:
+            raise ValueError(f"start {start} is after end {end}")
+        mask = self._selection(codes, None, None) & ~np.isnat(self.dates)
+        if start is None or end is None:
+            dated = self.dates[mask]
+            if len(dated) == 0:
+                return _empty_rolling_mean()
+            start = dated.min() if start is None else start
+            end = dated.max() if end is None else end
+            if start > end:
+                # Only one bound was given and it lies beyond the measurements.
+                return _empty_rolling_mean()
+        first = start - np.timedelta64(window - 1, "D")
+        mask &= (self.dates >= first) & (self.dates <= end)
+        used, groups = np.unique(codes[mask], return_inverse=True)
+        days = int((end - first) / np.timedelta64(1, "D")) + 1
+        offsets = (self.dates[mask] - first).astype(np.int64)
+        cells = groups.reshape(-1) * days + offsets
+        size = len(used) * days
+        sums = np.bincount(cells, weights=self.values[mask], minlength=size).reshape(len(used), days)
+        counts = np.bincount(cells, minlength=size).reshape(len(used), days)
+        sums, counts = _window_sum(sums, window), _window_sum(counts, window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+        skip = window - 1
+        return RollingMean(
+            labels=[labels[g] for g in used],
+            dates=first + np.arange(skip, days),
+            mean=mean[:, skip:],
+            count=counts[:, skip:],
+        )
+
+
+def _empty_rolling_mean() -> RollingMean:
+    return RollingMean([], np.empty(0, dtype="datetime64[D]"), np.empty((0, 0)), np.empty((0, 0), dtype=np.int64))
+
+
+def _window_sum(table: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sum over ``window`` columns of every row."""
+    cumulative = np.cumsum(table, axis=1)
+    result = cumulative.copy()
+    if window < table.shape[1]:
+        result[:, window:] -= cumulative[:, :-window]
+    return result
@@ -0,0 +1,275 @@
+"""Access decisions over the ODRL policies of a catalog.
+
+:class:`PolicyEngine` compiles every ``Policy`` into lookup tables keyed by
+``(party, action)`` and answers "may this party perform this action on this
+resource" for the resources that point at policies through ``hasPolicy``.
+
+Decisions follow these rules:
+
+* a rule applies to a query when its ``action`` equals the requested action and
+  the party is one of its ``assignee`` values; a rule without assignees applies
+  to every party;
+* an applicable prohibition in any policy of the resource denies the request
+  (prohibitions take precedence over permissions);
+* otherwise an applicable permission permits it;
+* otherwise the policies say nothing about the request and the decision is
+  ``not_applicable``, which a gateway should treat as a denial.
+
+A permitting decision carries the duties of the permitting permissions and a
+denying one the remedies of the prohibitions, each closed transitively over
+``Duty.consequence``. Duty, remedy and consequence values are rule uids and are
+resolved across all policies of the catalog.
+
+Decisions are memoized per ``(resource, party, action)``. Replacing or removing
+a policy evicts exactly the decisions that used one of its rules, and changing a
+resource's ``hasPolicy`` evicts the decisions about that resource.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Union
+
+from pydantic import BaseModel
+
+from .datamodel import Container, PartyCollection, Policy
+from .index import CatalogIndex, Key, identifier_of, iter_rules
+
+PERMIT = "permit"
+DENY = "deny"
+NOT_APPLICABLE = "not_applicable"
+
+Party = Union[str, PartyCollection]
+Query = tuple[str, Party, str]
+
+# Rules without an assignee are stored under this party.
+ANY_PARTY = None
+
+
+@dataclass(frozen=True)
+class Decision:
+    """The answer to one ``(resource, party, action)`` query."""
+
+    resource: str
+    party: str
+    action: str
+    effect: str
+    policies: tuple[str, ...] = ()
+    # uids of the rules that produced the effect
+    rules: tuple[str, ...] = ()
+    duties: tuple[str, ...] = ()
+    remedies: tuple[str, ...] = ()
+
+    @property
+    def permitted(self) -> bool:
+        return self.effect == PERMIT
+
+
+@dataclass
+class CompiledPolicy:
+    """The rules of one policy indexed by ``(party, action)``."""
+
+    uid: str
+    permissions: dict[tuple[Optional[str], str], list[str]] = field(default_factory=dict)
+    prohibitions: dict[tuple[Optional[str], str], list[str]] = field(default_factory=dict)
+    # party -> obligation uids
+    obligations: dict[Optional[str], list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def compile(cls, policy: Policy) -> CompiledPolicy:
+        compiled = cls(policy.uid)
+        for attr, table in (("permission", compiled.permissions), ("prohibition", compiled.prohibitions)):
+            for rule in getattr(policy, attr) or ():
+                for party in rule.assignee or [ANY_PARTY]:
+                    table.setdefault((party, rule.action), []).append(rule.uid)
+        for rule in policy.obligation or ():
+            for party in rule.assignee or [ANY_PARTY]:
+                compiled.obligations.setdefault(party, []).append(rule.uid)
+        return compiled
+
+    def lookup(self, table: dict, party: str, action: str) -> list[str]:
+        return table.get((party, action), []) + table.get((ANY_PARTY, action), [])
+
+
+# PartyCollection members are str subclasses and hash like their values.
+_PARTIES = {member.value: member.value for member in PartyCollection}
+
+
+def party_value(party: Party) -> str:
+    """Return the ``PartyCollection`` value of ``party``; raises ``ValueError`` for unknown parties."""
+    try:
+        return _PARTIES[party]
+    except KeyError:
+        raise ValueError(f"{party!r} is not a PartyCollection value") from None
+
+
+class PolicyEngine:
+    """Compiled, memoizing evaluator of the ODRL policies of a catalog."""
+
+    def __init__(self, container: Optional[Container] = None, index: Optional[CatalogIndex] = None):
+        if index is None:
+            index = CatalogIndex(container)
+        elif container is not None:
+            raise ValueError("pass either a container or an index, not both")
+        self.index = index
+        self._compiled: dict[str, CompiledPolicy] = {}
+        for policy in index.entities("policies"):
+            self._compiled[policy.uid] = CompiledPolicy.compile(policy)
+        self._cache: dict[tuple[str, str, str], Decision] = {}
+        # ("policies", uid) or ("rules", unresolved uid) -> cached queries that used it
+        self._dependents: dict[Key, set[tuple[str, str, str]]] = {}
+        # resource -> cached queries about it
+        self._by_resource: dict[str, set[tuple[str, str, str]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # -- queries ----------------------------------------------------------------
+
+    def decide(self, resource: str, party: Party, action: str) -> Decision:
+        """Decide whether ``party`` may perform ``action`` on ``resource``."""
+        key = (resource, party_value(party), action)
+        decision = self._cache.get(key)
+        if decision is not None:
+            self.hits += 1
+            return decision
+        self.misses += 1
+        decision, used = self._evaluate(*key)
+        self._cache[key] = decision
+        self._by_resource.setdefault(resource, set()).add(key)
+        for dependency in used:
+            self._dependents.setdefault(dependency, set()).add(key)
+        return decision
+
+    def decide_many(self, queries: Iterable[Query]) -> list[Decision]:
+        """Decide a batch of ``(resource, party, action)`` queries, in order.
+
+        Repeated queries in the batch are evaluated once.
+        """
+        batch: dict[tuple[str, str, str], Optional[Decision]] = {}
+        keys = []
+        for resource, party, action in queries:
+            key = (resource, party_value(party), action)
+            keys.append(key)
+            batch[key] = None
+        for key in batch:
+            batch[key] = self.decide(*key)
+        return [batch[key] for key in keys]
+
+    def permitted(self, resource: str, party: Party, action: str) -> bool:
+        return self.decide(resource, party, action).permitted
+
+    def obligations(self, resource: str, party: Party) -> tuple[str, ...]:
+        """Return the policy-level obligations of ``party`` for ``resource``, with their consequences."""
+        party = party_value(party)
+        found: list[str] = []
+        for policy in self._policies_of(resource):
+            compiled = self._compiled[policy]
+            found += compiled.obligations.get(party, []) + compiled.obligations.get(ANY_PARTY, [])
+        return self._closure(found)[0]
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self._dependents.clear()
+        self._by_resource.clear()
+
+    # -- changes ----------------------------------------------------------------
+
+    def update_policy(self, policy: Policy) -> None:
+        """Add or replace ``policy`` and evict the decisions that depended on it."""
+        self._evict(("policies", policy.uid))
+        for rule in iter_rules(policy):
+            # The rule may have been held by another policy, or named in a
+            # duty chain before it existed.
+            owner = self.index.policy_of_rule(rule.uid)
+            if owner is not None:
+                self._evict(("policies", owner.uid))
+            self._evict(("rules", rule.uid))
+        self.index.add("policies", policy)
+        self._compiled[policy.uid] = CompiledPolicy.compile(policy)
+        self._evict_referrers(policy.uid)
+
+    def remove_policy(self, uid: str) -> Policy:
+        self._evict(("policies", uid))
+        self._evict_referrers(uid)
+        del self._compiled[uid]
+        return self.index.remove("policies", uid)
+
+    def update_resource(self, kind: str, item: BaseModel) -> None:
+        """Add or replace a resource (e.g. after its ``hasPolicy`` changed)."""
+        self.index.add(kind, item)
+        self._evict_resource(identifier_of(item))
+
+    def remove_resource(self, kind: str, identifier: str) -> BaseModel:
+        self._evict_resource(identifier)
+        return self.index.remove(kind, identifier)
+
+    # -- internals --------------------------------------------------------------
+
+    def _policies_of(self, resource: str) -> list[str]:
+        item = self.index.get(resource)
+        if item is None:
+            return []
+        uid = getattr(item, "hasPolicy", None)
+        return [uid] if uid in self._compiled else []
+
+    def _evaluate(self, resource: str, party: str, action: str) -> tuple[Decision, set[Key]]:
+        policies = self._policies_of(resource)
+        permissions: list[str] = []
+        prohibitions: list[str] = []
+        for uid in policies:
+            compiled = self._compiled[uid]
+            permissions += compiled.lookup(compiled.permissions, party, action)
+            prohibitions += compiled.lookup(compiled.prohibitions, party, action)
+        used = {("policies", uid) for uid in policies}
+        if prohibitions:
+            remedies, chain = self._closure(self._links(prohibitions, "remedy"))
+            used |= chain
+            decision = Decision(resource, party, action, DENY, tuple(policies), tuple(prohibitions), remedies=remedies)
+        elif permissions:
+            duties, chain = self._closure(self._links(permissions, "duty"))
+            used |= chain
+            decision = Decision(resource, party, action, PERMIT, tuple(policies), tuple(permissions), duties=duties)
+        else:
+            decision = Decision(resource, party, action, NOT_APPLICABLE, tuple(policies))
+        return decision, used
+
+    def _links(self, uids: Iterable[str], slot: str) -> list[str]:
+        found = []
+        for uid in uids:
+            found.extend(getattr(self.index.get(uid, "rules"), slot, None) or ())
+        return found
+
+    def _closure(self, uids: Iterable[str]) -> tuple[tuple[str, ...], set[Key]]:
+        """Close duty uids over ``consequence``.
+
+        Returns the duties in first-seen order and what they were resolved from:
+        the policies holding them, and the uids that could not be resolved. Those
+        are kept in the result so a gateway can still report them.
+        """
+        seen: dict[str, None] = {}
+        used: set[Key] = set()
+        stack = list(reversed(list(uids)))
+        while stack:
+            uid = stack.pop()
+            if uid in seen:
+                continue
+            seen[uid] = None
+            policy = self.index.policy_of_rule(uid)
+            used.add(("rules", uid) if policy is None else ("policies", policy.uid))
+            consequences = getattr(self.index.get(uid, "rules"), "consequence", None) or ()
+            stack.extend(reversed(consequences))
+        return tuple(seen), used
+
+    def _evict(self, dependency: Key) -> None:
+        self._drop(self._dependents.pop(dependency, ()))
+
+    def _drop(self, keys: Iterable[tuple[str, str, str]]) -> None:
+        for key in keys:
+            self._cache.pop(key, None)
+
+    def _evict_referrers(self, uid: str) -> None:
+        for _kind, identifier in self.index.referrers(uid, "hasPolicy"):
+            self._evict_resource(identifier)
+
+    def _evict_resource(self, identifier: str) -> None:
+        self._drop(self._by_resource.pop(identifier, ()))
@@ -0,0 +1,298 @@
+"""Incremental AsciiDoc pages for the entities of a catalog.
+
+:func:`build_pages` writes one page per catalog, dataset, series, data service,
+concept, metric and policy into the ``pages`` directory of an Antora module,
+plus the module's ``nav.adoc``. A page shows the entity itself and its
+neighbours in the reference graph: the entities it refers to and the entities
+that refer to it (a concept page lists the datasets themed with it, a dataset
+page the measurements computed on it).
+
+Every page is rendered from a :class:`PageData` value holding exactly what
+appears on the page, neighbour labels included. Its hash is recorded in a
+manifest next to the pages; on the next build, a page whose hash is unchanged
+and whose file still exists is skipped, so a change to an entity re-renders its
+own page and the pages of the neighbours that show it. Pages of entities that
+are gone are deleted. Rendering and writing are spread over a process pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+from .datamodel import Container
+from .index import REFERENCES, CatalogIndex, identifier_of
+
+# Bump when the page layout changes, so every page is rendered again.
+RENDER_VERSION = 1
+MANIFEST = ".pages-manifest.json"
+
+# kind -> (directory under pages/, heading of the kind in the navigation)
+PAGE_KINDS = {
+    "dataCatalog": ("catalog", "Catalog"),
+    "datasets": ("datasets", "Datasets"),
+    "series": ("series", "Dataset series"),
+    "dataServices": ("services", "Data services"),
+    "concepts": ("concepts", "Concepts"),
+    "metrics": ("metrics", "Metrics"),
+    "policies": ("policies", "Policies"),
+}
+
+# Slots rendered as links or headings rather than as attributes.
+_SKIPPED = {"identifier", "uid", "title", "prefLabel", "description"} | {
+    ref.slot for ref in REFERENCES if not ref.inlined
+}
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+
+def page_path(kind: str, identifier: str) -> str:
+    """Path of the page of an entity, relative to the module's ``pages`` directory.
+
+    An identifier that is not a safe file name (such as a CURIE) is sanitised
+    and gets a short hash of the identifier appended, so that ``ex:a`` and
+    ``ex-a`` get different pages.
+    """
+    directory, _heading = PAGE_KINDS[kind]
+    name = _UNSAFE.sub("-", identifier).strip("-") or "_"
+    if name != identifier:
+        name += "-" + hashlib.blake2b(identifier.encode("utf-8"), digest_size=4).hexdigest()
+    return f"{directory}/{name}.adoc"
+
+
+def label_of(kind: str, item: BaseModel) -> str:
+    if kind == "qualityMeasurements":
+        value = "n/a" if item.value is None else f"{item.value:g}"
+        label = f"{item.isMeasurementOf or identifier_of(item)} = {value}"
+        return label if item.generatedAtTime is None else f"{label} ({item.generatedAtTime})"
+    return getattr(item, "title", None) or getattr(item, "prefLabel", None) or identifier_of(item)
+
+
+@dataclass(frozen=True)
+class Link:
+    slot: str
+    kind: str
+    identifier: str
+    label: str
+    # Page of the target, or ``None`` when it has none (or does not exist).
+    page: Optional[str]
+
+
+@dataclass
+class PageData:
+    """Everything shown on one page."""
+
+    kind: str
+    identifier: str
+    label: str
+    data: dict[str, Any]
+    outgoing: list[Link] = field(default_factory=list)
+    incoming: list[Link] = field(default_factory=list)
+
+    def digest(self) -> str:
+        payload = [RENDER_VERSION, self.kind, self.label, self.data,
+                   [list(vars(link).values()) for link in self.outgoing + self.incoming]]
+        text = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class PageReport:
+    regenerated: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+    def summary(self) -> dict[str, int]:
+        return {"regenerated": len(self.regenerated), "skipped": len(self.skipped), "deleted": len(self.deleted)}
+
+
+# -- page data ------------------------------------------------------------------
+
+
+def _link(index: CatalogIndex, slot: str, kinds: tuple[str, ...], identifier: str) -> Link:
+    for kind in kinds:
+        item = index.get(identifier, kind)
+        if item is not None:
+            page = page_path(kind, identifier) if kind in PAGE_KINDS else None
+            return Link(slot, kind, identifier, label_of(kind, item), page)
+    return Link(slot, kinds[0], identifier, identifier, None)
+
+
+def page_data(index: CatalogIndex, kind: str, item: BaseModel) -> PageData:
+    identifier = identifier_of(item)
+    page = PageData(kind, identifier, label_of(kind, item), item.model_dump(mode="json", exclude_none=True))
+    for ref in REFERENCES:
+        if ref.inlined or kind not in ref.sources:
+            continue
+        value = getattr(item, ref.slot, None)
+        for target in value if isinstance(value, list) else ([] if value is None else [value]):
+            page.outgoing.append(_link(index, ref.slot, ref.targets, target))
+    for ref in REFERENCES:
+        if ref.inlined or kind not in ref.targets:
+            continue
+        for source_kind, source in index.referrers(identifier, ref.slot):
+            if source_kind == "rules":
+                continue
+            page.incoming.append(_link(index, ref.slot, (source_kind,), source))
+    return page
+
+
+def iter_pages(index: CatalogIndex) -> Iterator[tuple[str, PageData]]:
+    """Yield ``(path, page)`` for every entity that gets a page.
+
+    Raises ``ValueError`` if two entities would share a page.
+    """
+    owners: dict[str, str] = {}
+    for kind in PAGE_KINDS:
+        for item in index.entities(kind):
+            identifier = identifier_of(item)
+            path = page_path(kind, identifier)
+            if path in owners:
+                raise ValueError(f"{identifier!r} and {owners[path]!r} would share the page {path}")
+            owners[path] = identifier
+            yield path, page_data(index, kind, item)
+
+
+# -- rendering ------------------------------------------------------------------
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("|", "\\|")
+
+
+def _attributes(data: Any, name: str) -> Iterator[tuple[str, str]]:
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from _attributes(value, f"{name}.{key}" if name else key)
+    elif isinstance(data, list):
+        if all(not isinstance(v, (dict, list)) for v in data):
+            yield name, ", ".join(map(str, data))
+        else:
+            for i, value in enumerate(data):
+                yield from _attributes(value, f"{name}[{i}]")
+    else:
+        yield name, str(data)
+
+
+def _xref(link: Link) -> str:
+    return f"xref:{link.page}[{link.label}]" if link.page else f"{link.label} (`{link.identifier}`)"
+
+
+def render(page: PageData) -> str:
+    """Render a page as AsciiDoc."""
+    lines = [f"= {page.label}", f":page-kind: {page.kind}", f":page-identifier: {page.identifier}", ""]
+    description = page.data.get("description")
+    if description:
+        lines += [str(description), ""]
+    lines += ['[cols="1,3"]', "|===", f"| identifier | `{page.identifier}`"]
+    for key, value in page.data.items():
+        if key not in _SKIPPED:
+            lines += [f"| {name} | {_escape(text)}" for name, text in _attributes(value, key)]
+    lines += ["|===", ""]
+    for heading, links in (("References", page.outgoing), ("Referenced by", page.incoming)):
+        if links:
+            lines += [f"== {heading}", ""]
+            lines += [f"* {link.slot}: {_xref(link)}" for link in links]
+            lines.append("")
+    return "\n".join(lines)
+
+
+def render_nav(pages: dict[str, PageData]) -> str:
+    lines = []
+    for kind, (_directory, heading) in PAGE_KINDS.items():
+        entries = sorted((p.label, path) for path, p in pages.items() if p.kind == kind)
+        if entries:
+            lines.append(f"* {heading}")
+            lines += [f"** xref:{path}[{label}]" for label, path in entries]
+    return "\n".join(lines) + "\n"
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _render_batch(root: str, batch: list[tuple[str, PageData]]) -> int:
+    for path, page in batch:
+        _write(Path(root) / path, render(page))
+    return len(batch)
+
+
+# -- building -------------------------------------------------------------------
+
+
+def _load_manifest(path: Path) -> dict[str, str]:
+    try:
+        with open(path, encoding="utf-8") as stream:
+            manifest = json.load(stream)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return manifest.get("pages", {}) if manifest.get("version") == RENDER_VERSION else {}
+
+
+def build_pages(
+    source: Union[Container, CatalogIndex],
+    module: Union[str, Path],
+    workers: Optional[int] = None,
+    batch_size: int = 64,
+    force: bool = False,
+) -> PageReport:
+    """Bring the entity pages under the Antora module directory ``module`` up to date.
+
+    Only pages whose content changed since the previous build (or whose file
+    is missing) are rendered, on ``workers`` processes (default: all CPUs;
+    ``1`` renders in the calling process). ``force`` renders every page.
+    """
+    module = Path(module)
+    root = module / "pages"
+    index = source if isinstance(source, CatalogIndex) else CatalogIndex(source)
+    previous = {} if force else _load_manifest(module / MANIFEST)
+    pages = dict(iter_pages(index))
+    hashes = {path: page.digest() for path, page in pages.items()}
+
+    report = PageReport()
+    stale: list[tuple[str, PageData]] = []
+    for path, digest in hashes.items():
+        if previous.get(path) == digest and (root / path).exists():
+            report.skipped.append(path)
+        else:
+            stale.append((path, pages[path]))
+            report.regenerated.append(path)
+    for path in previous:
+        if path not in hashes:
+            (root / path).unlink(missing_ok=True)
+            report.deleted.append(path)
+
+    batches = [stale[i : i + batch_size] for i in range(0, len(stale), batch_size)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(batches) <= 1:
+        for batch in batches:
+            _render_batch(str(root), batch)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: set[Future] = set()
+            for batch in batches:
+                # Bound the batches in flight so pickled pages do not pile up.
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(pool.submit(_render_batch, str(root), batch))
+            for future in pending:
+                future.result()
+
+    nav = render_nav(pages)
+    nav_path = module / "nav.adoc"
+    if not nav_path.exists() or nav_path.read_text(encoding="utf-8") != nav:
+        _write(nav_path, nav)
+    _write(module / MANIFEST, json.dumps({"version": RENDER_VERSION, "pages": hashes}, indent=1, sort_keys=True))
+    return report
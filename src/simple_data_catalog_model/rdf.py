@@ -0,0 +1,384 @@
+"""Direct N-Triples / Turtle serialization of catalog entities.
+
+Triples are generated straight from model objects using the ``class_uri``,
+``slot_uri`` and prefix declarations of ``data-catalog.yaml``, without building
+an rdflib ``Graph``. The output matches what ``linkml-convert`` produces for the
+same ``Container``: inlined objects without an identifier become blank nodes,
+references become IRIs and every top-level entity is linked from a
+``sdcdc:Container`` blank node.
+
+The serializer emits all triples of a subject together, nested objects before
+the object that holds them and the container link last. :func:`iter_records_from_ntriples`
+relies on that order to rebuild each entity as soon as its container link is
+read, so a round trip through N-Triples runs in memory bounded by the largest
+entity. Input in any other order can be read with ``ordered=False``, which
+buffers all triples until the end.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Optional, Union
+
+import yaml
+from pydantic import BaseModel
+
+from .datamodel import Container
+from .streaming import SECTIONS, Record, iter_container
+
+SCHEMA_PATH = Path(__file__).with_name("data-catalog.yaml")
+
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+_TYPE = f"<{RDF_TYPE}>"
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+# linkml type -> XSD datatype of the literal; ``None`` means a plain string.
+DATATYPES = {
+    "string": None,
+    "date": XSD + "date",
+    "datetime": XSD + "dateTime",
+    "float": XSD + "float",
+    "double": XSD + "double",
+    "integer": XSD + "integer",
+    "boolean": XSD + "boolean",
+}
+IRI_TYPES = {"uri", "uriorcurie", "Any"}
+
+Triple = tuple[str, str, str]
+
+
+@dataclass
+class SlotMapping:
+    name: str
+    uri: str
+    range: str
+    multivalued: bool = False
+    # "literal", "iri" (reference or IRI valued) or "object" (inlined class)
+    kind: str = "literal"
+    datatype: Optional[str] = None
+    identifier: bool = False
+
+
+@dataclass
+class ClassMapping:
+    name: str
+    uri: str
+    slots: dict[str, SlotMapping] = field(default_factory=dict)
+    by_uri: dict[str, list[SlotMapping]] = field(default_factory=dict)
+
+    @property
+    def identifier(self) -> Optional[SlotMapping]:
+        return next((s for s in self.slots.values() if s.identifier), None)
+
+
+class RDFSchema:
+    """``class_uri``/``slot_uri`` mappings and prefixes read from the LinkML schema."""
+
+    def __init__(self, path: Union[str, Path] = SCHEMA_PATH):
+        with open(path, encoding="utf-8") as f:
+            schema = yaml.safe_load(f)
+        self.prefixes: dict[str, str] = dict(schema["prefixes"])
+        self.default_prefix: str = schema.get("default_prefix", "")
+        # longest namespace first, so compaction picks the most specific prefix
+        self._namespaces = sorted(((ns, p) for p, ns in self.prefixes.items()), key=lambda x: -len(x[0]))
+        self._raw = schema["classes"]
+        self.enums = set(schema.get("enums") or ())
+        self.classes: dict[str, ClassMapping] = {}
+        for name in self._raw:
+            self.classes[name] = self._class(name)
+        self.class_by_uri = {c.uri: c for c in self.classes.values()}
+
+    def _attributes(self, name: str) -> dict[str, dict]:
+        cls = self._raw[name] or {}
+        attrs = dict(self._attributes(cls["is_a"])) if cls.get("is_a") else {}
+        attrs.update({k: v or {} for k, v in (cls.get("attributes") or {}).items()})
+        return attrs
+
+    def _has_identifier(self, name: str) -> bool:
+        return any(a.get("identifier") for a in self._attributes(name).values())
+
+    def _class(self, name: str) -> ClassMapping:
+        cls = self._raw[name] or {}
+        mapping = ClassMapping(name, self.expand(cls.get("class_uri") or f"{self.default_prefix}:{name}"))
+        for slot_name, attr in self._attributes(name).items():
+            rng = attr.get("range", "string")
+            slot = SlotMapping(
+                name=slot_name,
+                uri=self.expand(attr.get("slot_uri") or f"{self.default_prefix}:{slot_name}"),
+                range=rng,
+                multivalued=bool(attr.get("multivalued")),
+                identifier=bool(attr.get("identifier")),
+            )
+            if rng in self._raw and rng != "Any":
+                inlined = attr.get("inlined", attr.get("inlined_as_list"))
+                if inlined is None:
+                    inlined = not self._has_identifier(rng)
+                slot.kind = "object" if inlined else "iri"
+            elif rng in IRI_TYPES:
+                slot.kind = "iri"
+            elif rng not in self.enums:
+                slot.datatype = DATATYPES[rng]
+            mapping.slots[slot_name] = slot
+            mapping.by_uri.setdefault(slot.uri, []).append(slot)
+        return mapping
+
+    def expand(self, curie: str) -> str:
+        prefix, sep, local = curie.partition(":")
+        if not sep:
+            return self.prefixes[self.default_prefix] + curie
+        if prefix in self.prefixes and not local.startswith("//"):
+            return self.prefixes[prefix] + local
+        return curie
+
+    def compact(self, iri: str) -> str:
+        for ns, prefix in self._namespaces:
+            if iri.startswith(ns) and len(iri) > len(ns):
+                return f"{prefix}:{iri[len(ns):]}"
+        return iri
+
+
+@lru_cache(maxsize=None)
+def default_schema() -> RDFSchema:
+    return RDFSchema()
+
+
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+def literal(value: str, datatype: Optional[str] = None) -> str:
+    """Return an N-Triples literal term."""
+    text = f'"{value.translate(_ESCAPES)}"'
+    return text if datatype is None else f"{text}^^<{datatype}>"
+
+
+def _lexical(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _entities(source: Union[Container, Iterable[Union[Record, tuple[str, BaseModel]]]]) -> Iterator[tuple[str, BaseModel]]:
+    if isinstance(source, Container):
+        yield from iter_container(source)
+        return
+    for entry in source:
+        if isinstance(entry, Record):
+            yield entry.section, entry.item
+        else:
+            yield entry
+
+
+class TripleWriter:
+    """Generate the triples of catalog entities, one entity at a time."""
+
+    def __init__(self, schema: Optional[RDFSchema] = None, container_node: str = "_:container"):
+        self.schema = schema or default_schema()
+        self.container_node = container_node
+        self._blank = itertools.count()
+        container = self.schema.classes["Container"]
+        self._links = {name: f"<{slot.uri}>" for name, slot in container.slots.items()}
+        self._container_type = f"<{container.uri}>"
+
+    def triples(self, source) -> Iterator[Triple]:
+        """Yield the triples of a ``Container`` or of ``(section, item)`` records."""
+        yield self.container_node, _TYPE, self._container_type
+        for section, item in _entities(source):
+            subject = self._subject(item)
+            yield from self._node(item, subject)
+            yield self.container_node, self._links[section], subject
+
+    def entity(self, item: BaseModel) -> tuple[str, list[Triple]]:
+        """Return the subject and triples of one entity, without its container link."""
+        subject = self._subject(item)
+        return subject, list(self._node(item, subject))
+
+    def _subject(self, item: BaseModel) -> str:
+        mapping = self.schema.classes[type(item).__name__]
+        id_slot = mapping.identifier
+        if id_slot is None:
+            return f"_:b{next(self._blank)}"
+        return f"<{self.schema.expand(getattr(item, id_slot.name))}>"
+
+    def _node(self, item: BaseModel, subject: str) -> Iterator[Triple]:
+        mapping = self.schema.classes[type(item).__name__]
+        own = [(subject, _TYPE, f"<{mapping.uri}>")]
+        for slot in mapping.slots.values():
+            value = getattr(item, slot.name, None)
+            if value is None or slot.identifier:
+                continue
+            for v in value if isinstance(value, list) else (value,):
+                if isinstance(v, BaseModel):
+                    child = self._subject(v)
+                    yield from self._node(v, child)
+                    own.append((subject, f"<{slot.uri}>", child))
+                elif slot.kind == "literal":
+                    own.append((subject, f"<{slot.uri}>", literal(_lexical(v), slot.datatype)))
+                else:
+                    own.append((subject, f"<{slot.uri}>", f"<{self.schema.expand(v)}>"))
+        yield from own
+
+
+def iter_triples(source, schema: Optional[RDFSchema] = None) -> Iterator[Triple]:
+    """Yield ``(subject, predicate, object)`` as N-Triples terms."""
+    return TripleWriter(schema).triples(source)
+
+
+def iter_ntriples(source, schema: Optional[RDFSchema] = None) -> Iterator[str]:
+    """Yield N-Triples lines (with trailing newline) for a catalog."""
+    for s, p, o in iter_triples(source, schema):
+        yield f"{s} {p} {o} .\n"
+
+
+_PN_LOCAL = re.compile(r"^[A-Za-z0-9_](?:[A-Za-z0-9_\-.]*[A-Za-z0-9_\-])?$")
+
+
+def iter_turtle(source, schema: Optional[RDFSchema] = None) -> Iterator[str]:
+    """Yield Turtle text for a catalog, one subject block per chunk."""
+    schema = schema or default_schema()
+
+    def term(t: str) -> str:
+        if t.startswith("<"):
+            curie = schema.compact(t[1:-1])
+            prefix, _, local = curie.partition(":")
+            if prefix in schema.prefixes and _PN_LOCAL.match(local):
+                return curie
+            return t
+        if t.startswith('"') and "^^<" in t:
+            lex, _, dt = t.rpartition("^^")
+            return f"{lex}^^{term(dt)}"
+        return t
+
+    yield "".join(f"@prefix {p}: <{ns}> .\n" for p, ns in schema.prefixes.items())
+    for subject, group in itertools.groupby(iter_triples(source, schema), key=lambda t: t[0]):
+        lines = [
+            f"{'a' if p == _TYPE else term(p)} {term(o)}"
+            for _, p, o in group
+        ]
+        yield f"\n{term(subject)} " + " ;\n    ".join(lines) + " .\n"
+
+
+def write_ntriples(source, target: IO[str], schema: Optional[RDFSchema] = None) -> int:
+    n = 0
+    for line in iter_ntriples(source, schema):
+        target.write(line)
+        n += 1
+    return n
+
+
+def write_turtle(source, target: IO[str], schema: Optional[RDFSchema] = None) -> None:
+    for chunk in iter_turtle(source, schema):
+        target.write(chunk)
+
+
+# -- parsing ----------------------------------------------------------------
+
+_TRIPLE = re.compile(
+    r'\s*(<[^>]*>|_:\S+)\s+<([^>]*)>\s+'
+    r'(<[^>]*>|_:\S+|"(?:[^"\\]|\\.)*"(?:\^\^<[^>]*>|@[A-Za-z0-9\-]+)?)\s*\.\s*$'
+)
+_UNESCAPE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+_SIMPLE_ESCAPES = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f", '"': '"', "'": "'", "\\": "\\"}
+
+
+def _unescape(match: re.Match) -> str:
+    code = match.group(1) or match.group(2)
+    return chr(int(code, 16)) if code else _SIMPLE_ESCAPES[match.group(3)]
+
+
+def parse_literal(term: str) -> str:
+    end = term.rfind('"')
+    return _UNESCAPE.sub(_unescape, term[1:end])
+
+
+class TripleReader:
+    """Rebuild catalog entities from N-Triples produced by :class:`TripleWriter`."""
+
+    def __init__(self, schema: Optional[RDFSchema] = None, ordered: bool = True):
+        self.schema = schema or default_schema()
+        self.ordered = ordered
+        container = self.schema.classes["Container"]
+        self._sections = {slot.uri: name for name, slot in container.slots.items()}
+        self._container_type = container.uri
+        self._nodes: dict[str, list[tuple[str, str]]] = {}
+        self._counts: dict[str, int] = {}
+
+    def records(self, lines: Iterable[str]) -> Iterator[Record]:
+        pending = []
+        for lineno, line in enumerate(lines, 1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            m = _TRIPLE.match(line)
+            if m is None:
+                raise ValueError(f"line {lineno}: not an N-Triples statement")
+            s, p, o = m.groups()
+            section = self._sections.get(p)
+            if section is not None:
+                if self.ordered:
+                    yield self._record(section, o, lineno)
+                else:
+                    pending.append((section, o, lineno))
+            elif not (p == RDF_TYPE and o == f"<{self._container_type}>"):
+                self._nodes.setdefault(s, []).append((p, o))
+        for section, o, lineno in pending:
+            yield self._record(section, o, lineno)
+        self._nodes.clear()
+
+    def _record(self, section: str, subject: str, lineno: int) -> Record:
+        cls = SECTIONS[section]
+        data = self._data(subject, self.schema.classes[cls.__name__])
+        index = self._counts.get(section, 0)
+        self._counts[section] = index + 1
+        return Record(section, index, lineno, cls.model_validate(data))
+
+    def _data(self, subject: str, mapping: ClassMapping) -> dict[str, Any]:
+        statements = self._nodes.pop(subject, []) if self.ordered else self._nodes.get(subject, [])
+        for p, o in statements:
+            if p == RDF_TYPE:
+                mapping = self.schema.class_by_uri.get(o[1:-1], mapping)
+        data: dict[str, Any] = {}
+        id_slot = mapping.identifier
+        if id_slot is not None and subject.startswith("<"):
+            data[id_slot.name] = self.schema.compact(subject[1:-1])
+        for p, o in statements:
+            if p == RDF_TYPE:
+                continue
+            slot = self._slot(mapping, p, o)
+            if slot.kind == "object":
+                value: Any = self._data(o, self.schema.classes[slot.range])
+            elif o.startswith('"'):
+                value = parse_literal(o)
+            else:
+                value = self.schema.compact(o[1:-1])
+            if slot.multivalued:
+                data.setdefault(slot.name, []).append(value)
+            else:
+                data[slot.name] = value
+        return data
+
+    def _slot(self, mapping: ClassMapping, predicate: str, obj: str) -> SlotMapping:
+        candidates = mapping.by_uri.get(predicate, ())
+        # Some slots share a slot_uri (e.g. theme/modified), so pick by object term.
+        for slot in candidates:
+            if obj.startswith('"'):
+                datatype = obj.rpartition("^^<")[2][:-1] if "^^<" in obj else None
+                if slot.kind == "literal" and slot.datatype == datatype:
+                    return slot
+            elif obj.startswith("_:"):
+                if slot.kind == "object":
+                    return slot
+            elif slot.kind == "iri" or (slot.kind == "object" and obj in self._nodes):
+                return slot
+        raise ValueError(f"{mapping.name} has no slot for <{predicate}> {obj}")
+
+
+def iter_records_from_ntriples(
+    lines: Iterable[str], schema: Optional[RDFSchema] = None, ordered: bool = True
+) -> Iterator[Record]:
+    """Yield a validated :class:`~.streaming.Record` per container-linked entity."""
+    return TripleReader(schema, ordered).records(lines)
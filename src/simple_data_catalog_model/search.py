@@ -0,0 +1,445 @@
+"""Keyword search over a catalog with facets and concept expansion.
+
+:class:`SearchIndex` is an inverted index over the text slots of catalog
+entities, ranked with BM25. Each indexed entity is a document whose fields are
+weighted as in :data:`FIELDS`:
+
+* catalogs, datasets, series and data services: title and description, with
+  facets ``theme``, ``status``, ``publisher`` and ``format``;
+* distributions: title and description, with facet ``format``;
+* concepts: prefLabel, altLabel and definition;
+* metrics: prefLabel and definition, with facet ``dimension``.
+
+``publisher`` is ``Agent.name``, ``format`` of a dataset is the formats of its
+inlined distributions, ``dimension`` is ``Metric.inDimension``. Facets are
+stored as postings of reserved terms (``FACET_MARK`` + facet + ``FACET_MARK`` +
+value), so filtering is a postings intersection.
+
+A query term that is a label of a concept is expanded: the other labels of the
+concept are added to the query and resources themed with the concept match as
+well, so ``"juice"`` finds datasets themed with the concept whose altLabel is
+"juice".
+
+:meth:`SearchIndex.save` writes the postings as ``.npy`` arrays and the document
+table as JSON; :meth:`SearchIndex.open` memory-maps the arrays. Every save
+writes a new generation of array files (``terms.<generation>.npy`` ...) and then
+replaces ``documents.json``, which names the generation, in one rename; a save
+that is interrupted leaves the previous index intact. An opened index can still
+be updated: removed documents are masked out of the mapped postings and new
+ones are kept in memory until the next :meth:`save`.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+from .datamodel import Container
+from .index import Key, identifier_of
+from .streaming import iter_container
+
+FORMAT_VERSION = 2
+ARRAYS = ("terms", "offsets", "docs", "weights")
+
+FACETS = ("theme", "status", "publisher", "format", "dimension")
+FACET_MARK = "\x1f"
+# Reserved pseudo-facet: concept label tokens -> concepts, used for expansion.
+LABEL = "label"
+
+RESOURCES = ("dataCatalog", "datasets", "series", "dataServices")
+# kind -> ((slot, weight), ...)
+FIELDS: dict[str, tuple[tuple[str, float], ...]] = {
+    **{kind: (("title", 3.0), ("description", 1.0)) for kind in RESOURCES},
+    "distributions": (("title", 3.0), ("description", 1.0)),
+    "concepts": (("prefLabel", 3.0), ("altLabel", 2.0), ("definition", 1.0)),
+    "metrics": (("prefLabel", 3.0), ("definition", 1.0)),
+}
+
+# BM25 parameters and the weight of terms and themes added by concept expansion.
+K1 = 1.2
+B = 0.75
+EXPANSION_WEIGHT = 0.5
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+def facet_term(facet: str, value: str) -> str:
+    return f"{FACET_MARK}{facet}{FACET_MARK}{value}"
+
+
+@dataclass
+class Document:
+    """The indexed form of one entity."""
+
+    kind: str
+    identifier: str
+    title: Optional[str]
+    length: float
+    facets: dict[str, list[str]] = field(default_factory=dict)
+    # Label tokens of a concept, added to queries that hit one of them.
+    labels: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Hit:
+    kind: str
+    identifier: str
+    title: Optional[str]
+    score: float
+
+
+@dataclass
+class SearchResult:
+    """Ranked hits and facet counts over every matching document (not just ``hits``)."""
+
+    hits: list[Hit]
+    total: int
+    facets: dict[str, Counter]
+
+
+def _facet_values(kind: str, item: BaseModel) -> dict[str, list[str]]:
+    facets: dict[str, list[str]] = {}
+    if kind in RESOURCES:
+        facets["theme"] = list(item.theme or ())
+        facets["status"] = [item.status] if item.status else []
+        name = item.publisher.name if item.publisher is not None else None
+        facets["publisher"] = [name] if name else []
+        facets["format"] = list(dict.fromkeys(d.format for d in item.distribution or () if d.format))
+    elif kind == "distributions":
+        facets["format"] = [item.format] if item.format else []
+    elif kind == "metrics":
+        facets["dimension"] = [item.inDimension] if item.inDimension else []
+    return {facet: values for facet, values in facets.items() if values}
+
+
+def analyze(kind: str, item: BaseModel) -> tuple[Document, dict[str, float]]:
+    """Return the document of ``item`` and its weighted term frequencies."""
+    terms: dict[str, float] = {}
+    length = 0.0
+    for slot, weight in FIELDS[kind]:
+        tokens = tokenize(getattr(item, slot, None))
+        length += weight * len(tokens)
+        for token, count in Counter(tokens).items():
+            terms[token] = terms.get(token, 0.0) + weight * count
+    facets = _facet_values(kind, item)
+    for facet, values in facets.items():
+        for value in values:
+            terms[facet_term(facet, value)] = 1.0
+    labels: list[str] = []
+    if kind == "concepts":
+        labels = list(dict.fromkeys(tokenize(item.prefLabel) + tokenize(item.altLabel)))
+        for token in labels:
+            terms[facet_term(LABEL, token)] = 1.0
+    title = getattr(item, "title", None) or getattr(item, "prefLabel", None)
+    document = Document(kind, identifier_of(item), title, length, facets, labels)
+    return document, terms
+
+
+class _Segment:
+    """Immutable postings read from disk: sorted terms, CSR offsets, doc ids and weights."""
+
+    def __init__(self, path: Path, generation: int, mmap: bool = True):
+        mode = "r" if mmap else None
+        self.terms = np.load(_array_path(path, "terms", generation), mmap_mode=mode)
+        self.offsets = np.load(_array_path(path, "offsets", generation), mmap_mode=mode)
+        self.docs = np.load(_array_path(path, "docs", generation), mmap_mode=mode)
+        self.weights = np.load(_array_path(path, "weights", generation), mmap_mode=mode)
+
+    def postings(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        i = int(np.searchsorted(self.terms, term))
+        if i == len(self.terms) or self.terms[i] != term:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        return self.docs[start:end], self.weights[start:end]
+
+
+class SearchIndex:
+    """Incrementally maintained, persistable inverted index over catalog entities."""
+
+    def __init__(self, container: Optional[Container] = None):
+        self._documents: list[Optional[Document]] = []
+        self._ids: dict[Key, int] = {}
+        self._segment: Optional[_Segment] = None
+        # documents below this id live in the segment, the rest in memory
+        self._segment_size = 0
+        self._alive = np.empty(0, dtype=bool)
+        self._postings: dict[str, dict[int, float]] = {}
+        self._terms: dict[int, dict[str, float]] = {}
+        self._total_length = 0.0
+        self._count = 0
+        self._length_cache: Optional[np.ndarray] = None
+        if container is not None:
+            self.add_container(container)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._ids
+
+    # -- maintenance ------------------------------------------------------------
+
+    def add_container(self, container: Container) -> None:
+        for kind, item in iter_container(container):
+            if kind in FIELDS:
+                self.add(kind, item)
+
+    def add(self, kind: str, item: BaseModel) -> None:
+        """Index ``item``, replacing the document of an entity with the same identifier."""
+        if kind not in FIELDS:
+            raise ValueError(f"{kind!r} entities are not searchable")
+        document, terms = analyze(kind, item)
+        key = (kind, document.identifier)
+        if key in self._ids:
+            self.remove(*key)
+        doc = len(self._documents)
+        self._documents.append(document)
+        self._ids[key] = doc
+        self._terms[doc] = terms
+        for term, weight in terms.items():
+            self._postings.setdefault(term, {})[doc] = weight
+        self._total_length += document.length
+        self._count += 1
+        self._length_cache = None
+
+    def remove(self, kind: str, identifier: str) -> None:
+        doc = self._ids.pop((kind, identifier))
+        document = self._documents[doc]
+        self._documents[doc] = None
+        self._total_length -= document.length
+        self._count -= 1
+        self._length_cache = None
+        if doc < self._segment_size:
+            self._alive[doc] = False
+            return
+        for term in self._terms.pop(doc):
+            postings = self._postings[term]
+            del postings[doc]
+            if not postings:
+                del self._postings[term]
+
+    # -- querying ---------------------------------------------------------------
+
+    def _lookup(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        docs, weights = [], []
+        if self._segment is not None:
+            d, w = self._segment.postings(term)
+            alive = self._alive[d]
+            docs.append(np.asarray(d[alive], dtype=np.int64))
+            weights.append(np.asarray(w[alive], dtype=np.float64))
+        postings = self._postings.get(term)
+        if postings:
+            docs.append(np.fromiter(postings.keys(), dtype=np.int64, count=len(postings)))
+            weights.append(np.fromiter(postings.values(), dtype=np.float64, count=len(postings)))
+        if not docs:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        return np.concatenate(docs), np.concatenate(weights)
+
+    def expand(self, tokens: Iterable[str]) -> tuple[dict[str, float], list[str]]:
+        """Return weighted query terms and the concepts the tokens are labels of."""
+        terms: dict[str, float] = {}
+        for token in tokens:
+            terms[token] = max(terms.get(token, 0.0), 1.0)
+        concepts: dict[str, None] = {}
+        for token in list(terms):
+            for doc in self._lookup(facet_term(LABEL, token))[0].tolist():
+                concept = self._documents[doc]
+                concepts[concept.identifier] = None
+                for label in concept.labels:
+                    terms.setdefault(label, EXPANSION_WEIGHT)
+        return terms, list(concepts)
+
+    def search(
+        self,
+        query: str = "",
+        filters: Optional[Mapping[str, Union[str, Iterable[str]]]] = None,
+        kinds: Optional[Iterable[str]] = None,
+        limit: Optional[int] = 10,
+        expand: bool = True,
+    ) -> SearchResult:
+        """Rank the documents matching ``query``.
+
+        ``filters`` maps facet names to a value or a list of values (any of
+        which may match); documents must match every facet. ``kinds`` restricts
+        the result to entity kinds. A query without tokens returns all matching
+        documents with score ``0``.
+        """
+        tokens = tokenize(query)
+        if expand:
+            terms, concepts = self.expand(tokens)
+        else:
+            terms, concepts = dict.fromkeys(tokens, 1.0), []
+        n = len(self._documents)
+        scores = np.zeros(n)
+        matched = np.zeros(n, dtype=bool)
+        average = self._total_length / self._count if self._count else 1.0
+        lengths = self._lengths()
+        for term, query_weight in terms.items():
+            docs, tf = self._lookup(term)
+            if len(docs) == 0:
+                continue
+            idf = math.log(1 + (self._count - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = K1 * (1 - B + B * lengths[docs] / average)
+            scores[docs] += query_weight * idf * tf * (K1 + 1) / (tf + norm)
+            matched[docs] = True
+        for concept in concepts:
+            docs, _ = self._lookup(facet_term("theme", concept))
+            if len(docs):
+                idf = math.log(1 + (self._count - len(docs) + 0.5) / (len(docs) + 0.5))
+                scores[docs] += EXPANSION_WEIGHT * idf
+                matched[docs] = True
+        if not tokens:
+            matched[:] = [d is not None for d in self._documents]
+        for facet, values in (filters or {}).items():
+            if facet not in FACETS:
+                raise ValueError(f"unknown facet {facet!r}, use one of {FACETS}")
+            allowed = np.zeros(n, dtype=bool)
+            for value in [values] if isinstance(values, str) else values:
+                allowed[self._lookup(facet_term(facet, value))[0]] = True
+            matched &= allowed
+        if kinds is not None:
+            kinds = frozenset(kinds)
+            matched &= [d is not None and d.kind in kinds for d in self._documents]
+        found = np.flatnonzero(matched)
+        # Highest score first; equal scores in indexing order.
+        found = found[np.argsort(-scores[found], kind="stable")]
+        facets: dict[str, Counter] = {facet: Counter() for facet in FACETS}
+        for doc in found.tolist():
+            for facet, values in self._documents[doc].facets.items():
+                facets[facet].update(values)
+        hits = []
+        for doc in found[:limit].tolist():
+            document = self._documents[doc]
+            hits.append(Hit(document.kind, document.identifier, document.title, float(scores[doc])))
+        return SearchResult(hits, len(found), {facet: counts for facet, counts in facets.items() if counts})
+
+    def _lengths(self) -> np.ndarray:
+        if self._length_cache is None:
+            self._length_cache = np.fromiter(
+                (0.0 if d is None else d.length for d in self._documents),
+                dtype=np.float64,
+                count=len(self._documents),
+            )
+        return self._length_cache
+
+    # -- persistence ------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index to the directory ``path``, dropping removed documents.
+
+        The new arrays are written under a fresh generation number and become
+        visible when ``documents.json`` is replaced, so readers and crashes see
+        either the old index or the new one, never a mix.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        previous = _generation(path)
+        generation = (previous or 0) + 1
+        alive = [doc for doc, d in enumerate(self._documents) if d is not None]
+        renumber = np.full(len(self._documents) + 1, -1, dtype=np.int64)
+        renumber[alive] = np.arange(len(alive))
+        terms: list[np.ndarray] = []
+        docs: list[np.ndarray] = []
+        weights: list[np.ndarray] = []
+        if self._segment is not None:
+            segment = self._segment
+            counts = np.diff(np.asarray(segment.offsets))
+            term_of = np.repeat(np.arange(len(segment.terms)), counts)
+            keep = self._alive[segment.docs]
+            terms.append(np.asarray(segment.terms)[term_of[keep]])
+            docs.append(renumber[np.asarray(segment.docs)[keep]])
+            weights.append(np.asarray(segment.weights)[keep])
+        for term, postings in self._postings.items():
+            terms.append(np.full(len(postings), term, dtype=object))
+            docs.append(renumber[np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))])
+            weights.append(np.fromiter(postings.values(), dtype=np.float32, count=len(postings)))
+        all_terms = np.concatenate(terms).astype(str) if terms else np.empty(0, dtype=str)
+        all_docs = np.concatenate(docs) if docs else np.empty(0, dtype=np.int64)
+        all_weights = np.concatenate(weights) if weights else np.empty(0, dtype=np.float32)
+        vocabulary, term_index = np.unique(all_terms, return_inverse=True)
+        order = np.lexsort((all_docs, term_index))
+        offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_index, minlength=len(vocabulary)), out=offsets[1:])
+        _write_array(_array_path(path, "terms", generation), vocabulary)
+        _write_array(_array_path(path, "offsets", generation), offsets)
+        _write_array(_array_path(path, "docs", generation), all_docs[order].astype(np.int32))
+        _write_array(_array_path(path, "weights", generation), all_weights[order].astype(np.float32))
+        meta = {
+            "version": FORMAT_VERSION,
+            "generation": generation,
+            "documents": [
+                [d.kind, d.identifier, d.title, d.length, d.facets, d.labels]
+                for d in (self._documents[doc] for doc in alive)
+            ],
+        }
+        tmp = path / "documents.json.tmp"
+        with open(tmp, "w", encoding="utf-8") as stream:
+            json.dump(meta, stream, ensure_ascii=False)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(tmp, path / "documents.json")
+        _remove_stale(path, generation)
+
+    @classmethod
+    def open(cls, path: Union[str, Path], mmap: bool = True) -> SearchIndex:
+        """Open an index written by :meth:`save`, memory-mapping its postings."""
+        path = Path(path)
+        with open(path / "documents.json", encoding="utf-8") as stream:
+            meta = json.load(stream)
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} has search index format {meta.get('version')}, expected {FORMAT_VERSION}")
+        index = cls()
+        index._segment = _Segment(path, meta["generation"], mmap)
+        index._documents = [Document(*row) for row in meta["documents"]]
+        index._ids = {(d.kind, d.identifier): doc for doc, d in enumerate(index._documents)}
+        index._segment_size = len(index._documents)
+        index._alive = np.ones(len(index._documents), dtype=bool)
+        index._total_length = sum(d.length for d in index._documents)
+        index._count = len(index._documents)
+        return index
+
+
+def _array_path(path: Path, name: str, generation: int) -> Path:
+    return path / f"{name}.{generation}.npy"
+
+
+def _generation(path: Path) -> Optional[int]:
+    try:
+        with open(path / "documents.json", encoding="utf-8") as stream:
+            return json.load(stream).get("generation")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_array(path: Path, array: np.ndarray) -> None:
+    with open(path, "wb") as stream:
+        np.save(stream, array)
+        stream.flush()
+        os.fsync(stream.fileno())
+
+
+def _remove_stale(path: Path, generation: int) -> None:
+    # Arrays of other generations: the previous index, or a save that was
+    # interrupted. An index opened from them keeps its memory maps on POSIX;
+    # where open files cannot be removed they are left for the next save.
+    current = {_array_path(path, name, generation).name for name in ARRAYS}
+    for name in ARRAYS:
+        for stale in path.glob(f"{name}.*.npy"):
+            if stale.name not in current:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
@@ -0,0 +1,226 @@
+"""Incremental SHACL validation of a catalog.
+
+The shapes in ``data-catalog.shacl.ttl`` (generated from the schema with
+``gen-shacl``) are parsed and harvested by pySHACL once per process and reused
+for every validation run.
+
+:class:`IncrementalValidator` keeps the triples of every entity and a persistent
+validation report. When entities are added, replaced or removed, only the
+changed entities and the entities that refer to them are validated again. They
+are validated on a small graph that holds their own triples and the
+``rdf:type`` of every node they point to, which is all the generated shapes look
+at (``sh:datatype``, ``sh:nodeKind``, ``sh:class`` and cardinalities). The
+``sdcdc:Container`` node is not validated.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import rdflib
+from pydantic import BaseModel
+from pyshacl import Validator
+from pyshacl.shapes_graph import ShapesGraph
+from rdflib import RDF, BNode, Literal, URIRef
+
+from .datamodel import Container
+from .index import REFERENCES, CatalogIndex, Key, identifier_of, iter_rules
+from .rdf import RDFSchema, TripleWriter, parse_literal
+from .streaming import iter_container
+
+try:  # pySHACL >= 0.30 only accepts its own data graph wrapper
+    from pyshacl.graph_abstraction import DataGraph
+except ImportError:  # pragma: no cover
+    DataGraph = None
+
+SHAPES_PATH = Path(__file__).with_name("data-catalog.shacl.ttl")
+
+SH = rdflib.Namespace("http://www.w3.org/ns/shacl#")
+
+
+@lru_cache(maxsize=None)
+def load_shapes(path: Union[str, Path] = SHAPES_PATH) -> ShapesGraph:
+    """Parse a SHACL shapes file and harvest its shapes; cached per path."""
+    shapes = ShapesGraph(rdflib.Graph().parse(path, format="turtle"))
+    shapes.shapes  # harvesting is lazy, do it now so every run reuses the result
+    return shapes
+
+
+@dataclass(frozen=True)
+class ShaclResult:
+    """One ``sh:result`` of a validation report, attributed to a catalog entity."""
+
+    entity: Key
+    focus: str
+    path: Optional[str]
+    value: Optional[str]
+    component: str
+    severity: str
+    message: Optional[str]
+
+    def __str__(self) -> str:
+        kind, identifier = self.entity
+        path = f" {self.path}" if self.path else ""
+        return f"{kind} {identifier}{path}: {self.message or self.component}"
+
+
+def _rdflib_term(term: str):
+    if term.startswith("<"):
+        return URIRef(term[1:-1])
+    if term.startswith("_:"):
+        return BNode(term[2:])
+    datatype = term.rpartition("^^<")[2][:-1] if "^^<" in term else None
+    return Literal(parse_literal(term), datatype=datatype and URIRef(datatype))
+
+
+def validate_graph(graph: rdflib.Graph, shapes: ShapesGraph) -> rdflib.Graph:
+    """Validate ``graph`` with pre-harvested ``shapes`` and return the report graph."""
+    data = DataGraph.from_rdflib(graph) if DataGraph is not None else graph
+    validator = Validator(data, shacl_graph=shapes.graph)
+    # The constructor wraps shacl_graph in a new ShapesGraph that would harvest
+    # the shapes again on every run. Swap in the harvested one; pySHACL is pinned
+    # to releases where Validator.run reads it, and test_shacl checks that.
+    validator.shacl_graph = shapes
+    _conforms, report, _text = validator.run()
+    return report
+
+
+class IncrementalValidator:
+    """Keep a SHACL validation report up to date as catalog entities change."""
+
+    def __init__(
+        self,
+        container: Optional[Container] = None,
+        shapes: Union[str, Path, ShapesGraph] = SHAPES_PATH,
+        schema: Optional[RDFSchema] = None,
+    ):
+        self.shapes = shapes if isinstance(shapes, ShapesGraph) else load_shapes(shapes)
+        self.index = CatalogIndex()
+        self._writer = TripleWriter(schema)
+        self._triples: dict[Key, list[tuple]] = {}
+        self._types: dict[URIRef, Counter] = {}
+        self._results: dict[Key, list[ShaclResult]] = {}
+        if container is not None:
+            self.apply(added=iter_container(container))
+
+    @property
+    def results(self) -> list[ShaclResult]:
+        return [r for results in self._results.values() for r in results]
+
+    @property
+    def conforms(self) -> bool:
+        return not any(r.severity == str(SH.Violation) for r in self.results)
+
+    def results_for(self, kind: str, identifier: str) -> list[ShaclResult]:
+        return list(self._results.get((kind, identifier), ()))
+
+    def apply(
+        self,
+        added: Iterable[tuple[str, BaseModel]] = (),
+        removed: Iterable[tuple[str, str]] = (),
+    ) -> list[Key]:
+        """Apply a change set and re-validate what it affects.
+
+        ``added`` holds ``(section, item)`` pairs; an item whose identifier is
+        already present replaces the old version. ``removed`` holds
+        ``(section, identifier)`` pairs. Returns the re-validated entities.
+        """
+        dirty: dict[Key, None] = {}
+        for kind, identifier in removed:
+            item = self._drop(kind, identifier)
+            self._mark_referrers(item, dirty)
+        for kind, item in added:
+            identifier = identifier_of(item)
+            if self.index.get(identifier, kind) is not None:
+                self._mark_referrers(self._drop(kind, identifier), dirty)
+            self.index.add(kind, item)
+            self._store((kind, identifier), item)
+            dirty[(kind, identifier)] = None
+            self._mark_referrers(item, dirty)
+        keys = [key for key in dirty if key in self._triples]
+        for key in dirty:
+            if key not in self._triples:
+                self._results.pop(key, None)
+        self._validate(keys)
+        return keys
+
+    def validate_all(self) -> list[ShaclResult]:
+        """Re-validate every entity at once and return the full report."""
+        self._validate(list(self._triples))
+        return self.results
+
+    def _store(self, key: Key, item: BaseModel) -> None:
+        _subject, triples = self._writer.entity(item)
+        converted = [tuple(_rdflib_term(t) for t in triple) for triple in triples]
+        self._triples[key] = converted
+        for s, p, o in converted:
+            if p == RDF.type and isinstance(s, URIRef):
+                self._types.setdefault(s, Counter())[o] += 1
+
+    def _drop(self, kind: str, identifier: str) -> BaseModel:
+        key = (kind, identifier)
+        for s, p, o in self._triples.pop(key, ()):
+            if p == RDF.type and isinstance(s, URIRef):
+                types = self._types[s]
+                types[o] -= 1
+                if types[o] <= 0:
+                    del types[o]
+                if not types:
+                    del self._types[s]
+        self._results.pop(key, None)
+        return self.index.remove(kind, identifier)
+
+    def _mark_referrers(self, item: BaseModel, dirty: dict[Key, None]) -> None:
+        targets = [identifier_of(item)]
+        if hasattr(item, "permission"):
+            targets.extend(rule.uid for rule in iter_rules(item))
+        for target in targets:
+            for ref in REFERENCES:
+                for kind, identifier in self.index.referrers(target, ref.slot):
+                    if kind == "rules":
+                        policy = self.index.policy_of_rule(identifier)
+                        if policy is None:
+                            continue
+                        kind, identifier = "policies", policy.uid
+                    dirty[(kind, identifier)] = None
+
+    def _validate(self, keys: list[Key]) -> None:
+        if not keys:
+            return
+        graph = rdflib.Graph()
+        owned: dict[rdflib.term.Node, Key] = {}
+        for key in keys:
+            for triple in self._triples[key]:
+                graph.add(triple)
+                owned[triple[0]] = key
+        # The neighbourhood: types of the nodes the validated entities refer to.
+        for _s, p, o in list(graph):
+            if p != RDF.type and isinstance(o, URIRef) and o not in owned:
+                for t in self._types.get(o, ()):
+                    graph.add((o, RDF.type, t))
+        report = validate_graph(graph, self.shapes)
+        fresh: dict[Key, list[ShaclResult]] = {key: [] for key in keys}
+        for node in report.objects(None, SH.result):
+            focus = report.value(node, SH.focusNode)
+            key = owned.get(focus)
+            if key is None:
+                continue
+            path = report.value(node, SH.resultPath)
+            value = report.value(node, SH.value)
+            message = report.value(node, SH.resultMessage)
+            fresh[key].append(
+                ShaclResult(
+                    entity=key,
+                    focus=focus.n3(),
+                    path=path.n3() if path is not None else None,
+                    value=value.n3() if value is not None else None,
+                    component=str(report.value(node, SH.sourceConstraintComponent)),
+                    severity=str(report.value(node, SH.resultSeverity)),
+                    message=str(message) if message is not None else None,
+                )
+            )
+        self._results.update(fresh)
@@ -0,0 +1,412 @@
+"""Memory-mapped binary snapshots of a catalog.
+
+A snapshot file holds a whole ``Container`` in a form that can be opened without
+parsing it:
+
+* a header with a magic number, the format version and the digest of
+  ``data-catalog.yaml``; a snapshot written for another schema is rejected
+  with :class:`StaleSnapshotError`;
+* a string table: every distinct string of the catalog (identifiers, labels,
+  enum values such as ``PartyCollection`` members, the prefixes and local
+  parts of CURIEs) stored once, sorted, as an offsets array and a UTF-8 blob;
+* per ``Container`` slot, a fixed-layout entity table in document order with
+  rows ``(identifier, offset, length)`` of ``uint32``/``uint64``/``uint32``,
+  and an offset index: the row numbers sorted by identifier;
+* the entity records: a tagged binary encoding of each entity in which every
+  string is a string table reference.
+
+:meth:`Snapshot.open` memory-maps the file. Strings are decoded and entities
+are materialized when first accessed, then cached; looking one up by identifier
+is a binary search in the string table and one in the offset index.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+from .datamodel import Container
+from .index import identifier_of
+from .streaming import SECTIONS, SINGLE_VALUED, iter_container
+from .util import gc_paused
+
+FORMAT_VERSION = 1
+MAGIC = b"SDCSNAP\x00"
+SCHEMA_PATH = Path(__file__).with_name("data-catalog.yaml")
+
+# magic, format version, schema digest, directory offset, directory length
+_HEADER = struct.Struct("<8sI16sQQ")
+_ROW = np.dtype([("identifier", "<u4"), ("offset", "<u8"), ("length", "<u4")])
+
+# Value tags of the record encoding.
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _CURIE, _LIST, _DICT, _DATE = range(10)
+_U32 = struct.Struct("<I")
+_CURIE_REF = struct.Struct("<II")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_I32 = struct.Struct("<i")
+
+# ``prefix:local`` with a prefix as declared in the schema; not ``http://...``.
+_CURIE_RE = re.compile(r"([A-Za-z_][\w.-]*):(?!//)(.+)", re.S)
+
+PathLike = Union[str, Path]
+
+
+class StaleSnapshotError(ValueError):
+    """The snapshot was written for another format or schema version."""
+
+
+@lru_cache(maxsize=None)
+def schema_digest() -> bytes:
+    """Digest of ``data-catalog.yaml``, the schema version snapshots are tied to."""
+    return hashlib.blake2b(SCHEMA_PATH.read_bytes(), digest_size=16).digest()
+
+
+# -- writing --------------------------------------------------------------------
+
+
+def _strings(value: Any, found: set[str]) -> None:
+    if isinstance(value, str):
+        match = _CURIE_RE.fullmatch(value)
+        if match:
+            found.update(match.groups())
+        else:
+            found.add(value)
+    elif isinstance(value, dict):
+        found.update(value)
+        for v in value.values():
+            _strings(v, found)
+    elif isinstance(value, list):
+        for v in value:
+            _strings(v, found)
+
+
+def _encode(value: Any, ids: dict[str, int], out: bytearray) -> None:
+    # bool before int: bool is a subclass of int.
+    if value is None:
+        out.append(_NONE)
+    elif value is True or value is False:
+        out.append(_TRUE if value else _FALSE)
+    elif isinstance(value, str):
+        match = _CURIE_RE.fullmatch(value)
+        if match:
+            out.append(_CURIE)
+            out += _CURIE_REF.pack(ids[match.group(1)], ids[match.group(2)])
+        else:
+            out.append(_STR)
+            out += _U32.pack(ids[value])
+    elif isinstance(value, int):
+        out.append(_INT)
+        out += _I64.pack(value)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, date):
+        out.append(_DATE)
+        out += _I32.pack(value.toordinal())
+    elif isinstance(value, list):
+        out.append(_LIST)
+        out += _U32.pack(len(value))
+        for v in value:
+            _encode(v, ids, out)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        out += _U32.pack(len(value))
+        for k, v in value.items():
+            out += _U32.pack(ids[k])
+            _encode(v, ids, out)
+    else:
+        raise TypeError(f"cannot store {type(value).__name__} in a snapshot")
+
+
+def _align(stream, size: int = 8) -> None:
+    stream.write(b"\x00" * (-stream.tell() % size))
+
+
+def write_snapshot(container: Container, path: PathLike) -> None:
+    """Write ``container`` to the snapshot file ``path``, replacing it atomically."""
+    path = Path(path)
+    sections: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+    found: set[str] = set()
+    for section, item in iter_container(container):
+        identifier = identifier_of(item)
+        data = item.model_dump(mode="python", exclude_none=True)
+        sections.setdefault(section, []).append((identifier, data))
+        found.add(identifier)
+        _strings(data, found)
+    strings = sorted(found)
+    ids = {s: i for i, s in enumerate(strings)}
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as stream:
+        stream.write(b"\x00" * _HEADER.size)
+        directory: dict[str, Any] = {"sections": {}}
+
+        blobs = [s.encode("utf-8") for s in strings]
+        offsets = np.zeros(len(blobs) + 1, dtype="<u8")
+        np.cumsum([len(b) for b in blobs], out=offsets[1:])
+        _align(stream)
+        directory["strings"] = [stream.tell(), len(strings)]
+        stream.write(offsets.tobytes())
+        stream.write(b"".join(blobs))
+
+        for section, entities in sections.items():
+            rows = np.zeros(len(entities), dtype=_ROW)
+            record = bytearray()
+            for row, (identifier, data) in enumerate(entities):
+                start = stream.tell()
+                record.clear()
+                _encode(data, ids, record)
+                stream.write(record)
+                rows[row] = (ids[identifier], start, len(record))
+            _align(stream)
+            table = stream.tell()
+            stream.write(rows.tobytes())
+            order = np.argsort(rows["identifier"], kind="stable").astype("<u4")
+            _align(stream)
+            index = stream.tell()
+            stream.write(order.tobytes())
+            directory["sections"][section] = [table, index, len(entities)]
+
+        meta = json.dumps(directory).encode("utf-8")
+        where = stream.tell()
+        stream.write(meta)
+        stream.seek(0)
+        stream.write(_HEADER.pack(MAGIC, FORMAT_VERSION, schema_digest(), where, len(meta)))
+    os.replace(tmp, path)
+
+
+# -- reading --------------------------------------------------------------------
+
+
+class _Strings:
+    """The string table; decodes entries on first access."""
+
+    def __init__(self, buffer: memoryview, offset: int, count: int):
+        self._offsets = np.frombuffer(buffer, dtype="<u8", count=count + 1, offset=offset)
+        self._blob = offset + 8 * (count + 1)
+        self._buffer = buffer
+        self._cache: list[Optional[str]] = [None] * count
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __getitem__(self, i: int) -> str:
+        s = self._cache[i]
+        if s is None:
+            start = self._blob + int(self._offsets[i])
+            end = self._blob + int(self._offsets[i + 1])
+            s = self._cache[i] = str(self._buffer[start:end], "utf-8")
+        return s
+
+    def load(self) -> None:
+        """Decode every string at once."""
+        blob = bytes(self._buffer[self._blob : self._blob + int(self._offsets[-1])])
+        bounds = self._offsets.tolist()
+        self._cache[:] = [str(blob[a:b], "utf-8") for a, b in zip(bounds, bounds[1:])]
+
+    def find(self, s: str) -> Optional[int]:
+        i = bisect.bisect_left(self, s)
+        return i if i < len(self) and self[i] == s else None
+
+
+class SectionView(Mapping[str, BaseModel]):
+    """The entities of one ``Container`` slot by identifier, in document order."""
+
+    def __init__(self, snapshot: Snapshot, section: str, table: int, index: int, count: int):
+        self._snapshot = snapshot
+        self.section = section
+        self._rows = np.frombuffer(snapshot._buffer, dtype=_ROW, count=count, offset=table)
+        self._order = np.frombuffer(snapshot._buffer, dtype="<u4", count=count, offset=index)
+        self._sorted_ids: Optional[np.ndarray] = None
+        self._cache: dict[int, BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[str]:
+        strings = self._snapshot._strings
+        for identifier in self._rows["identifier"].tolist():
+            yield strings[identifier]
+
+    def _row(self, identifier: str) -> Optional[int]:
+        string = self._snapshot._strings.find(identifier)
+        if string is None:
+            return None
+        if self._sorted_ids is None:
+            self._sorted_ids = self._rows["identifier"][self._order]
+        i = int(np.searchsorted(self._sorted_ids, string))
+        if i < len(self._sorted_ids) and self._sorted_ids[i] == string:
+            return int(self._order[i])
+        return None
+
+    def __getitem__(self, identifier: str) -> BaseModel:
+        row = self._row(identifier)
+        if row is None:
+            raise KeyError(identifier)
+        return self.at(row)
+
+    def __contains__(self, identifier: object) -> bool:
+        return isinstance(identifier, str) and self._row(identifier) is not None
+
+    def at(self, row: int) -> BaseModel:
+        """The entity in row ``row`` (document order)."""
+        item = self._cache.get(row)
+        if item is None:
+            _identifier, offset, length = self._rows[row].tolist()
+            data = self._snapshot._decode(offset, offset + length)
+            item = self._cache[row] = self._snapshot._materialize(self.section, data)
+        return item
+
+    def items_in_order(self) -> Iterator[BaseModel]:
+        for row in range(len(self)):
+            yield self.at(row)
+
+
+class Snapshot:
+    """A snapshot file opened read-only; see the module docstring."""
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        with open(self.path, "rb") as stream:
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def open(cls, path: PathLike) -> Snapshot:
+        return cls(path)
+
+    def _open(self) -> None:
+        if len(self._buffer) < _HEADER.size:
+            raise StaleSnapshotError(f"{self.path} is not a catalog snapshot")
+        magic, version, digest, where, length = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise StaleSnapshotError(f"{self.path} is not a catalog snapshot")
+        if version != FORMAT_VERSION:
+            raise StaleSnapshotError(f"{self.path} has snapshot format {version}, expected {FORMAT_VERSION}")
+        if digest != schema_digest():
+            raise StaleSnapshotError(f"{self.path} was written for another version of {SCHEMA_PATH.name}")
+        directory = json.loads(bytes(self._buffer[where : where + length]))
+        self._strings = _Strings(self._buffer, *directory["strings"])
+        self._value = self._decoder()
+        self.sections: dict[str, SectionView] = {
+            section: SectionView(self, section, *layout) for section, layout in directory["sections"].items()
+        }
+
+    def close(self) -> None:
+        """Release the mapping; materialized entities stay usable."""
+        for view in getattr(self, "sections", {}).values():
+            view._rows = view._order = view._sorted_ids = None
+        if hasattr(self, "_recurse"):
+            self._recurse.clear()
+        self._strings = self._value = None
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getitem__(self, section: str) -> SectionView:
+        """The entities of ``section``; an empty view for a slot the catalog does not use."""
+        if section not in SECTIONS:
+            raise KeyError(section)
+        view = self.sections.get(section)
+        if view is None:
+            view = self.sections[section] = SectionView(self, section, 0, 0, 0)
+        return view
+
+    def get(self, section: str, identifier: str) -> Optional[BaseModel]:
+        return self[section].get(identifier)
+
+    def _materialize(self, section: str, data: dict[str, Any]) -> BaseModel:
+        return SECTIONS[section].model_validate(data)
+
+    def _decode(self, start: int, end: int) -> Any:
+        value, position = self._value(start)
+        if position != end:
+            raise ValueError("corrupt snapshot record")
+        return value
+
+    def _decoder(self):
+        """Compile the record decoder, with everything it touches bound to locals."""
+        buffer = self._buffer
+        table = self._strings
+        cache = table._cache
+        u32, curie, i64, f64, i32 = (s.unpack_from for s in (_U32, _CURIE_REF, _I64, _F64, _I32))
+        fromordinal = date.fromordinal
+        constants = (None, False, True)
+
+        def string(i: int) -> str:
+            s = cache[i]
+            return table[i] if s is None else s
+
+        def value(p: int) -> tuple[Any, int]:
+            tag = buffer[p]
+            p += 1
+            if tag == _STR:
+                return string(u32(buffer, p)[0]), p + 4
+            if tag == _CURIE:
+                prefix, local = curie(buffer, p)
+                return f"{string(prefix)}:{string(local)}", p + 8
+            if tag == _DICT:
+                count = u32(buffer, p)[0]
+                p += 4
+                result = {}
+                for _ in range(count):
+                    key = string(u32(buffer, p)[0])
+                    result[key], p = recurse[0](p + 4)
+                return result, p
+            if tag == _LIST:
+                count = u32(buffer, p)[0]
+                p += 4
+                items = [None] * count
+                for i in range(count):
+                    items[i], p = recurse[0](p)
+                return items, p
+            if tag == _DATE:
+                return fromordinal(i32(buffer, p)[0]), p + 4
+            if tag == _INT:
+                return i64(buffer, p)[0], p + 8
+            if tag == _FLOAT:
+                return f64(buffer, p)[0], p + 8
+            if tag <= _TRUE:
+                return constants[tag], p
+            raise ValueError(f"corrupt snapshot record: unknown tag {tag}")
+
+        # Recursion goes through a list that close() empties, rather than a
+        # closure cell that would keep the mapping exported until collected.
+        recurse = self._recurse = [value]
+        return value
+
+    def to_container(self) -> Container:
+        """Materialize every entity into a ``Container``."""
+        self._strings.load()
+        data: dict[str, Any] = {}
+        with gc_paused():
+            for section in SECTIONS:
+                view = self.sections.get(section)
+                if view is None or not len(view):
+                    continue
+                items = list(view.items_in_order())
+                data[section] = items[0] if section in SINGLE_VALUED else items
+        return Container(**data)
@@ -0,0 +1,463 @@
+"""Record-at-a-time reading and writing of ``Container`` documents.
+
+A catalog is read section by section (``datasets``, ``concepts``, ...) and
+every list entry is validated into its model class on its own, so only one raw
+record and one model object are held in memory at a time. YAML, JSON and JSON
+Lines are supported. A JSON Lines catalog holds one record per line, as an
+object with a single key naming the ``Container`` slot::
+
+    {"datasets": {"identifier": "ex:herrcgre", "title": "test dataset"}}
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import textwrap
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Union
+
+import yaml
+from pydantic import BaseModel, ValidationError
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+
+from .datamodel import (
+    Concept,
+    Container,
+    DataCatalog,
+    DataService,
+    Dataset,
+    DatasetSeries,
+    Distribution,
+    Metric,
+    Policy,
+    QualityMeasurement,
+)
+from .util import gc_paused
+
+Source = Union[str, Path, IO[str]]
+
+# Container slot -> model class of its entries, in schema order.
+SECTIONS: dict[str, type[BaseModel]] = {
+    "dataCatalog": DataCatalog,
+    "datasets": Dataset,
+    "concepts": Concept,
+    "series": DatasetSeries,
+    "distributions": Distribution,
+    "metrics": Metric,
+    "qualityMeasurements": QualityMeasurement,
+    "dataServices": DataService,
+    "policies": Policy,
+}
+
+SINGLE_VALUED = frozenset({"dataCatalog"})
+
+FORMATS = {
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+@dataclass
+class Record:
+    """A validated catalog entry and where it was found."""
+
+    section: str
+    index: int
+    line: Optional[int]
+    item: BaseModel
+
+
+@dataclass
+class RecordError:
+    """A catalog entry that could not be turned into a model object."""
+
+    section: str
+    index: int
+    line: Optional[int]
+    error: Exception
+
+    def __str__(self) -> str:
+        where = f"{self.section}[{self.index}]"
+        if self.line is not None:
+            where += f" (line {self.line})"
+        return f"{where}: {self.error}"
+
+
+class RecordValidationError(ValueError):
+    """Raised by :func:`iter_records` when no ``on_error`` handler is given."""
+
+    def __init__(self, record_error: RecordError):
+        super().__init__(str(record_error))
+        self.record_error = record_error
+
+
+def detect_format(source: Source, format: Optional[str] = None) -> str:
+    if format is not None:
+        if format not in FORMATS.values():
+            raise ValueError(f"unsupported catalog format {format!r}")
+        return format
+    if isinstance(source, (str, Path)):
+        suffix = Path(source).suffix.lower()
+        if suffix in FORMATS:
+            return FORMATS[suffix]
+    raise ValueError(f"cannot determine catalog format of {source!r}, pass format=")
+
+
+@contextmanager
+def _opened(source: Source, mode: str) -> Iterator[IO[str]]:
+    if isinstance(source, (str, Path)):
+        with open(source, mode, encoding="utf-8") as stream:
+            yield stream
+    else:
+        yield source
+
+
+def iter_container(container: Any) -> Iterator[tuple[str, BaseModel]]:
+    """Yield ``(section, item)`` for every entry of an in-memory ``Container``."""
+    for section in SECTIONS:
+        value = getattr(container, section)
+        for item in [value] if section in SINGLE_VALUED else value or ():
+            if item is not None:
+                yield section, item
+
+
+def iter_raw(source: Source, format: Optional[str] = None) -> Iterator[tuple[str, int, int, Any]]:
+    """Yield ``(section, index, line, data)`` for every entry of a catalog.
+
+    ``data`` is the plain parsed value (usually a dict); nothing is validated.
+    """
+    fmt = detect_format(source, format)
+    parse = {"yaml": _iter_yaml, "json": _iter_json, "jsonl": _iter_jsonl}[fmt]
+    with _opened(source, "r") as stream:
+        yield from parse(stream)
+
+
+def iter_records(
+    source: Source,
+    format: Optional[str] = None,
+    sections: Optional[Iterable[str]] = None,
+    on_error: Optional[Callable[[RecordError], None]] = None,
+) -> Iterator[Record]:
+    """Yield a validated :class:`Record` for every entry of a catalog.
+
+    Entries that fail validation are passed to ``on_error`` and skipped; without
+    a handler the first one raises :class:`RecordValidationError`. ``sections``
+    restricts the output to the given ``Container`` slots.
+    """
+    wanted = None if sections is None else frozenset(sections)
+    for section, index, line, data in iter_raw(source, format):
+        if section.startswith("@"):  # JSON-LD keywords such as ``@type``
+            continue
+        if wanted is not None and section not in wanted:
+            continue
+        cls = SECTIONS.get(section)
+        if cls is None:
+            error: Exception = ValueError(f"unknown catalog section {section!r}")
+        else:
+            try:
+                item = cls.model_validate(data)
+            except ValidationError as e:
+                error = e
+            else:
+                yield Record(section, index, line, item)
+                continue
+        record_error = RecordError(section, index, line, error)
+        if on_error is None:
+            raise RecordValidationError(record_error)
+        on_error(record_error)
+
+
+def load_container(
+    source: Source,
+    format: Optional[str] = None,
+    on_error: Optional[Callable[[RecordError], None]] = None,
+) -> Container:
+    """Read a whole catalog into a ``Container``; see :func:`iter_records` for the options."""
+    sections: dict[str, Any] = {}
+    with gc_paused():
+        for record in iter_records(source, format, on_error=on_error):
+            if record.section in SINGLE_VALUED:
+                sections[record.section] = record.item
+            else:
+                sections.setdefault(record.section, []).append(record.item)
+    return Container(**sections)
+
+
+try:
+    from yaml._yaml import CParser
+except ImportError:  # PyYAML built without libyaml
+    _YAMLLoader = yaml.SafeLoader
+else:
+
+    class _YAMLLoader(CParser, Composer, SafeConstructor, Resolver):
+        """Safe loader that parses events with libyaml but composes nodes in Python.
+
+        ``yaml.CSafeLoader`` only composes whole documents; the Python composer
+        is what lets :func:`_iter_yaml` compose one record at a time.
+        """
+
+        def __init__(self, stream: IO[str]):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+def _iter_yaml(stream: IO[str]) -> Iterator[tuple[str, int, int, Any]]:
+    # Compose one node per entry instead of the whole document, so the YAML
+    # node tree never grows beyond a single record.
+    loader = _YAMLLoader(stream)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStartEvent
+        if loader.check_event(yaml.ScalarEvent) and loader.peek_event().value == "":
+            return
+        if not loader.check_event(yaml.MappingStartEvent):
+            raise ValueError("a catalog document must be a mapping")
+        loader.get_event()
+        while not loader.check_event(yaml.MappingEndEvent):
+            section = loader.construct_document(loader.compose_node(None, None))
+            if loader.check_event(yaml.SequenceStartEvent):
+                loader.get_event()
+                index = 0
+                while not loader.check_event(yaml.SequenceEndEvent):
+                    node = loader.compose_node(None, None)
+                    yield section, index, node.start_mark.line + 1, loader.construct_document(node)
+                    index += 1
+                loader.get_event()
+            else:
+                node = loader.compose_node(None, None)
+                data = loader.construct_document(node)
+                if data is not None:
+                    yield section, 0, node.start_mark.line + 1, data
+    finally:
+        loader.dispose()
+
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_DECODER = json.JSONDecoder()
+
+
+class _JSONScanner:
+    """Incremental reader of JSON values from a text stream."""
+
+    def __init__(self, stream: IO[str], chunk_size: int = 1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        # line number of buf[_counted], so counting newlines stays incremental
+        self._line = 1
+        self._counted = 0
+
+    @property
+    def line(self) -> int:
+        self._line += self.buf.count("\n", self._counted, self.pos)
+        self._counted = self.pos
+        return self._line
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.line  # bring _line up to pos before dropping the consumed text
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        self._counted = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or ``""`` at the end."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} at line {self.line}")
+        self.pos += 1
+
+    def accept(self, char: str) -> bool:
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                data, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer end may continue in the next chunk.
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return data
+
+
+def _iter_json(stream: IO[str]) -> Iterator[tuple[str, int, int, Any]]:
+    scanner = _JSONScanner(stream)
+    if scanner.peek() == "":
+        return
+    scanner.expect("{")
+    if scanner.accept("}"):
+        return
+    while True:
+        section = scanner.value()
+        scanner.expect(":")
+        if scanner.accept("["):
+            index = 0
+            if not scanner.accept("]"):
+                while True:
+                    scanner.peek()
+                    line = scanner.line
+                    yield section, index, line, scanner.value()
+                    index += 1
+                    if not scanner.accept(","):
+                        break
+                scanner.expect("]")
+        else:
+            scanner.peek()
+            line = scanner.line
+            data = scanner.value()
+            if data is not None:
+                yield section, 0, line, data
+        if not scanner.accept(","):
+            break
+    scanner.expect("}")
+
+
+def _iter_jsonl(stream: IO[str]) -> Iterator[tuple[str, int, int, Any]]:
+    counters: Counter[str] = Counter()
+    for line, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+        obj = json.loads(text)
+        if not isinstance(obj, dict) or len(obj) != 1:
+            raise ValueError(f"line {line}: expected an object with a single section key")
+        ((section, data),) = obj.items()
+        yield section, counters[section], line, data
+        counters[section] += 1
+
+
+class CatalogWriter:
+    """Write catalog entries one at a time as YAML, JSON or JSON Lines.
+
+    For YAML and JSON the entries of a section must be written consecutively;
+    JSON Lines accepts them in any order. Use as a context manager, or call
+    :meth:`close` to finish the document.
+    """
+
+    def __init__(self, target: Source, format: Optional[str] = None):
+        self.format = detect_format(target, format)
+        if isinstance(target, (str, Path)):
+            self._stream: IO[str] = open(target, "w", encoding="utf-8")
+            self._owned = True
+        else:
+            self._stream = target
+            self._owned = False
+        self._section: Optional[str] = None
+        self._written: set[str] = set()
+        self._first = True
+        self._closed = False
+        self.count = 0
+
+    def __enter__(self) -> CatalogWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, section: str, item: Union[BaseModel, dict]) -> None:
+        if self._closed:
+            raise ValueError("write to a closed CatalogWriter")
+        if section not in SECTIONS:
+            raise ValueError(f"unknown catalog section {section!r}")
+        if isinstance(item, BaseModel):
+            mode = "python" if self.format == "yaml" else "json"
+            data = item.model_dump(mode=mode, exclude_none=True)
+        else:
+            data = item
+        self.count += 1
+        if self.format == "jsonl":
+            self._stream.write(json.dumps({section: data}, ensure_ascii=False) + "\n")
+            return
+        if section != self._section or section in SINGLE_VALUED:
+            if section in self._written:
+                raise ValueError(
+                    f"section {section!r} was already written; entries must be grouped by section"
+                )
+            self._end_section()
+            self._start_section(section)
+        if self.format == "yaml":
+            if section in SINGLE_VALUED:
+                text = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+            else:
+                text = yaml.safe_dump([data], sort_keys=False, allow_unicode=True)
+            self._stream.write(textwrap.indent(text, "  "))
+        else:
+            if not self._first:
+                self._stream.write(",\n    ")
+            self._stream.write(json.dumps(data, ensure_ascii=False))
+        self._first = False
+
+    def _start_section(self, section: str) -> None:
+        if self.format == "yaml":
+            self._stream.write(f"{section}:\n")
+        else:
+            self._stream.write("{\n" if not self._written else ",\n")
+            opening = "" if section in SINGLE_VALUED else "[\n    "
+            self._stream.write(f"  {json.dumps(section)}: {opening}")
+        self._section = section
+        self._written.add(section)
+        self._first = True
+
+    def _end_section(self) -> None:
+        if self._section is not None and self.format == "json" and self._section not in SINGLE_VALUED:
+            self._stream.write("\n  ]")
+        self._section = None
+
+    def close(self) -> None:
+        # Closing twice (e.g. close() inside a with block) must not end the document twice.
+        if self._closed:
+            return
+        self._closed = True
+        if self._stream.closed:
+            return
+        if self.format == "json":
+            self._end_section()
+            self._stream.write("\n}\n" if self._written else "{}\n")
+        if self._owned:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+
+def write_records(records: Iterable[Record], target: Source, format: Optional[str] = None) -> int:
+    """Write ``records`` (e.g. from :func:`iter_records`) and return how many were written."""
+    with CatalogWriter(target, format) as writer:
+        for record in records:
+            writer.write(record.section, record.item)
+        return writer.count
@@ -0,0 +1,256 @@
+"""Deterministic synthetic catalogs for benchmarks.
+
+:func:`iter_synthetic` yields the entries of a catalog of ``datasets`` datasets
+as ``(section, data)`` pairs in document order, with dates as ISO strings, ready
+for :class:`~simple_data_catalog_model.streaming.CatalogWriter`; the other
+entity counts follow from :class:`Ratios`. The same arguments and seed always give
+the same catalog. Entries are produced one at a time, so catalogs of a million
+datasets can be written without holding them in memory;
+:func:`synthetic_container` builds a (validated) ``Container`` for smaller ones.
+
+The catalog is shaped like a real one: themes and publishers follow a Zipf
+distribution, optional slots are left out now and then, series group datasets
+with adjacent coverage, data services serve a few datasets each, every dataset
+gets measurements of some metrics, and policies carry permissions with duties,
+prohibitions with remedies and duties with consequences, referring to the
+duties of their ``obligation`` list.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Any, Iterator, Optional
+
+from .datamodel import Container, PartyCollection
+from .streaming import SINGLE_VALUED
+
+_WORDS = (
+    "energy grid load demand supply meter station network asset outage voltage transformer cable feeder "
+    "solar wind heat gas hydrogen storage battery charging mobility traffic parking water air quality "
+    "emission weather forecast climate soil land parcel building address population income health school "
+    "budget tender permit inspection incident sensor reading hourly daily monthly annual regional national"
+).split()
+_DIMENSIONS = ("Completeness", "Accuracy", "Timeliness", "Consistency", "Availability")
+_FORMATS = ("csv", "parquet", "json", "geojson", "xlsx", "netcdf")
+_STATUSES = ("draft", "published", "deprecated")
+_ACTIONS = ("use", "access", "distribute", "derive", "reproduce", "aggregate", "anonymize")
+_DUTIES = ("attribute", "register", "provide", "notify", "compensate", "delete", "inform")
+_PARTIES = tuple(party.value for party in PartyCollection)
+_START = date(2015, 1, 1)
+
+
+@dataclass(frozen=True)
+class Ratios:
+    """Entity counts per dataset (or per policy, for the rule counts)."""
+
+    concepts: float = 0.05
+    series: float = 0.02
+    distributions: float = 2.0
+    data_services: float = 0.01
+    metrics: float = 0.002
+    measurements: float = 3.0
+    policies: float = 0.005
+    themes: float = 2.0
+    # per policy
+    permissions: float = 2.0
+    prohibitions: float = 1.0
+    duties: float = 3.0
+
+
+def _count(ratio: float, datasets: int, minimum: int = 1) -> int:
+    return max(minimum, round(ratio * datasets))
+
+
+class _Zipf:
+    """Draw indexes ``0 .. n-1`` with weight ``1 / (rank + 1)``."""
+
+    def __init__(self, rng: random.Random, n: int):
+        self._rng = rng
+        self._population = range(n)
+        self._cum_weights = list(accumulate(1.0 / (rank + 1) for rank in range(n)))
+
+    def draw(self, k: int = 1) -> list[int]:
+        return self._rng.choices(self._population, cum_weights=self._cum_weights, k=k)
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(_WORDS, k=words))
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    # Knuth's method is fine for the small means used here.
+    limit, k, p = math.exp(-mean), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limit:
+            return k
+        k += 1
+
+
+def _period(rng: random.Random, start: date) -> dict[str, Any]:
+    end = start + timedelta(days=rng.randrange(30, 3 * 365))
+    period: dict[str, Any] = {"hasBeginning": start.isoformat()}
+    if rng.random() < 0.9:
+        period["hasEnd"] = end.isoformat()
+    return period
+
+
+def _rules(rng: random.Random, p: int, ratios: Ratios) -> dict[str, Any]:
+    def rule(kind: str, i: int, actions: tuple[str, ...]) -> dict[str, Any]:
+        return {
+            "uid": f"plcy:policy-{p}-{kind}-{i}",
+            "description": _text(rng, 8),
+            "action": rng.choice(actions),
+            "assignee": rng.sample(_PARTIES, rng.randint(1, 2)),
+        }
+
+    duties = [rule("duty", i, _DUTIES) for i in range(max(1, _poisson(rng, ratios.duties)))]
+    uids = [d["uid"] for d in duties]
+    # Consequences point forward only, so duty chains never loop.
+    for i, duty in enumerate(duties[:-1]):
+        if rng.random() < 0.3:
+            duty["consequence"] = [rng.choice(uids[i + 1 :])]
+    permissions = [rule("permission", i, _ACTIONS) for i in range(max(1, _poisson(rng, ratios.permissions)))]
+    for permission in permissions:
+        if rng.random() < 0.7:
+            permission["duty"] = rng.sample(uids, rng.randint(1, min(2, len(uids))))
+    prohibitions = [rule("prohibition", i, _ACTIONS) for i in range(_poisson(rng, ratios.prohibitions))]
+    for prohibition in prohibitions:
+        if rng.random() < 0.5:
+            prohibition["remedy"] = [rng.choice(uids)]
+    rules: dict[str, Any] = {"permission": permissions, "obligation": duties}
+    if prohibitions:
+        rules["prohibition"] = prohibitions
+    return rules
+
+
+def iter_synthetic(
+    datasets: int, seed: int = 0, ratios: Optional[Ratios] = None
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield the entries of a synthetic catalog, section by section."""
+    ratios = ratios or Ratios()
+    rng = random.Random(seed)
+    n_concepts = _count(ratios.concepts, datasets)
+    n_series = _count(ratios.series, datasets, 0)
+    n_services = _count(ratios.data_services, datasets, 0)
+    n_metrics = _count(ratios.metrics, datasets)
+    n_policies = _count(ratios.policies, datasets)
+    n_publishers = max(1, datasets // 50)
+    themes = _Zipf(rng, n_concepts)
+    publishers = _Zipf(rng, n_publishers)
+    dataset_ids = [f"ex:dataset-{i}" for i in range(datasets)]
+
+    yield "dataCatalog", {
+        "identifier": "ex:catalog",
+        "title": "synthetic catalog",
+        "description": f"a synthetic catalog of {datasets} datasets (seed {seed})",
+        "publisher": {"name": "publisher 0"},
+        "issued": _START.isoformat(),
+        "dataset": dataset_ids,
+    }
+
+    for i, identifier in enumerate(dataset_ids):
+        publisher = publishers.draw()[0]
+        issued = _START + timedelta(days=rng.randrange(3650))
+        data: dict[str, Any] = {
+            "identifier": identifier,
+            "title": f"{_text(rng, 3)} {i}",
+            "description": _text(rng, rng.randint(8, 40)),
+            "publisher": {"name": f"publisher {publisher}"},
+            "status": rng.choice(_STATUSES),
+            "issued": issued.isoformat(),
+            "temporal": _period(rng, issued - timedelta(days=rng.randrange(365))),
+            "theme": [f"ex:concept-{c}" for c in sorted(set(themes.draw(max(1, _poisson(rng, ratios.themes)))))],
+        }
+        if rng.random() < 0.8:
+            data["contactPoint"] = {"hasEmail": f"data@publisher{publisher}.example.com"}
+        if rng.random() < 0.7:
+            data["license"] = {"title": rng.choice(("cc-by 4.0", "cc-by-sa 4.0", "cc0 1.0", "proprietary"))}
+        if rng.random() < 0.5:
+            data["modified"] = (issued + timedelta(days=rng.randrange(1, 700))).isoformat()
+        if n_series and rng.random() < 0.6:
+            data["inSeries"] = f"ex:series-{i * n_series // datasets}"
+        if rng.random() < 0.8:
+            data["hasPolicy"] = f"plcy:policy-{rng.randrange(n_policies)}"
+        if i and rng.random() < 0.05:
+            data["wasDerivedFrom"] = [dataset_ids[rng.randrange(i)]]
+        distributions = []
+        for d in range(_poisson(rng, ratios.distributions)):
+            fmt = rng.choice(_FORMATS)
+            distributions.append({
+                "identifier": f"{identifier}-distribution-{d}",
+                "title": f"{fmt} download",
+                "format": fmt,
+                "issued": (issued + timedelta(days=rng.randrange(30))).isoformat(),
+                "accessURL": f"https://data.example.com/{i}/{d}.{fmt}",
+            })
+        if distributions:
+            data["distribution"] = distributions
+        yield "datasets", data
+
+    for c in range(n_concepts):
+        concept = {"identifier": f"ex:concept-{c}", "prefLabel": f"{_WORDS[c % len(_WORDS)]} {c}",
+                   "definition": _text(rng, 12)}
+        if rng.random() < 0.5:
+            concept["altLabel"] = _text(rng, 1)
+        yield "concepts", concept
+
+    for s in range(n_series):
+        first = _START + timedelta(days=s * 3650 // max(1, n_series))
+        yield "series", {
+            "identifier": f"ex:series-{s}",
+            "title": f"{_text(rng, 2)} series {s}",
+            "publisher": {"name": f"publisher {publishers.draw()[0]}"},
+            "temporal": _period(rng, first),
+        }
+
+    for m in range(n_metrics):
+        yield "metrics", {
+            "identifier": f"ex:metric-{m}",
+            "prefLabel": f"{_text(rng, 2)} metric {m}",
+            "definition": _text(rng, 10),
+            "expectedDataType": "xsd:float",
+            "inDimension": _DIMENSIONS[m % len(_DIMENSIONS)],
+        }
+
+    measurements = _count(ratios.measurements, datasets, 0)
+    for q in range(measurements):
+        yield "qualityMeasurements", {
+            "identifier": f"ex:measurement-{q}",
+            "computedOn": dataset_ids[q % datasets],
+            "isMeasurementOf": f"ex:metric-{rng.randrange(n_metrics)}",
+            "value": round(rng.random(), 4),
+            "generatedAtTime": (_START + timedelta(days=3650 + q * 365 // max(1, measurements))).isoformat(),
+        }
+
+    for d in range(n_services):
+        yield "dataServices", {
+            "identifier": f"ex:service-{d}",
+            "title": f"{_text(rng, 2)} api {d}",
+            "endpointURL": f"https://api.example.com/{d}",
+            "servesDataset": sorted(set(rng.choices(dataset_ids, k=rng.randint(1, 5)))),
+            "hasPolicy": f"plcy:policy-{rng.randrange(n_policies)}",
+        }
+
+    for p in range(n_policies):
+        yield "policies", {
+            "uid": f"plcy:policy-{p}",
+            "title": f"{_text(rng, 2)} policy {p}",
+            "description": _text(rng, 20),
+            **_rules(rng, p, ratios),
+        }
+
+
+def synthetic_container(datasets: int, seed: int = 0, ratios: Optional[Ratios] = None) -> Container:
+    """Build a validated ``Container`` from :func:`iter_synthetic`."""
+    data: dict[str, Any] = {}
+    for section, item in iter_synthetic(datasets, seed, ratios):
+        if section in SINGLE_VALUED:
+            data[section] = item
+        else:
+            data.setdefault(section, []).append(item)
+    return Container.model_validate(data)
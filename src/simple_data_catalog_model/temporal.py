@@ -0,0 +1,349 @@
+"""Interval index over the dates of a catalog.
+
+:class:`TemporalIndex` indexes, per field:
+
+* ``temporal``: ``PeriodOfTime`` coverage (``hasBeginning``/``hasEnd``) of
+  catalogs, datasets and series; an open end extends to the start or end of
+  time;
+* ``series``: the coverage of every series rolled up from its member datasets
+  (through ``inSeries``) as the hull of their coverage, kept up to date as
+  members change from sorted lists of the members' starts and ends;
+* ``issued`` and ``modified``: of catalogs, datasets, series, data services and
+  distributions, including the distributions inlined in a dataset. Those are
+  keyed ``("distributions", identifier, owner)`` with the key of the entity
+  that holds them, since two datasets may inline distributions with the same
+  identifier;
+* ``generatedAtTime``: of quality measurements.
+
+Dates are stored as half-open ranges of day ordinals (a date is a range of one
+day) in an :class:`IntervalSet`: an array sorted by start with an implicit
+augmented binary tree of maximum ends, the layout used by cgranges. Overlap,
+cover and point queries visit ``O(log n + k)`` entries. Changes go to a small
+buffer that queries scan as well, and the arrays are rebuilt once the buffer
+outgrows the square root of the set size.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from datetime import date, timedelta
+from typing import Hashable, Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+from .datamodel import Container
+from .index import Key, identifier_of
+from .streaming import iter_container
+
+RESOURCES = ("dataCatalog", "datasets", "series", "dataServices")
+FIELDS = ("temporal", "series", "issued", "modified", "generatedAtTime")
+
+# Open ends of a PeriodOfTime.
+MIN_DAY = date.min.toordinal()
+MAX_DAY = date.max.toordinal() + 1
+
+DateLike = Union[date, str]
+# An entity key, or ``("distributions", identifier, owner key)`` for an inlined distribution.
+Entry = Union[Key, tuple[str, str, Key]]
+
+
+def _ordinal(value: DateLike) -> int:
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return value.toordinal()
+
+
+def _date(ordinal: int) -> Optional[date]:
+    return None if ordinal <= MIN_DAY or ordinal >= MAX_DAY else date.fromordinal(ordinal)
+
+
+class IntervalSet:
+    """Half-open integer intervals ``[start, end)`` with a key each."""
+
+    def __init__(self) -> None:
+        self._live: dict[Hashable, tuple[int, int]] = {}
+        # Sorted arrays of the last build.
+        self._start: list[int] = []
+        self._end: list[int] = []
+        self._keys: list[Hashable] = []
+        self._max: list[int] = []
+        self._levels = -1
+        # Changes since the last build: added intervals, and keys whose
+        # entry in the arrays is no longer valid.
+        self._pending: dict[Hashable, tuple[int, int]] = {}
+        self._stale: set[Hashable] = set()
+        self._indexed: set[Hashable] = set()
+        # Set while bulk loading: changes only accumulate until rebuild().
+        self.deferred = False
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._live
+
+    def get(self, key: Hashable) -> Optional[tuple[int, int]]:
+        return self._live.get(key)
+
+    def add(self, key: Hashable, start: int, end: int) -> None:
+        if end <= start:
+            raise ValueError(f"empty interval [{start}, {end}) for {key!r}")
+        if key in self._live:
+            self.discard(key)
+        self._live[key] = (start, end)
+        self._pending[key] = (start, end)
+        self._maybe_rebuild()
+
+    def discard(self, key: Hashable) -> None:
+        if self._live.pop(key, None) is None:
+            return
+        self._pending.pop(key, None)
+        if key in self._indexed:
+            self._stale.add(key)
+        self._maybe_rebuild()
+
+    def _maybe_rebuild(self) -> None:
+        if not self.deferred and len(self._pending) + len(self._stale) > max(64, math.isqrt(len(self._live))):
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        items = sorted(self._live.items(), key=lambda item: item[1])
+        self._keys = [key for key, _ in items]
+        self._start = [interval[0] for _, interval in items]
+        self._end = [interval[1] for _, interval in items]
+        self._indexed = set(self._keys)
+        self._pending.clear()
+        self._stale.clear()
+        self._index()
+
+    def _index(self) -> None:
+        # Implicit tree over array positions: the nodes of level k are the
+        # positions whose k lowest bits are set; the children of node x at
+        # level k are x - 2**(k-1) and x + 2**(k-1).
+        n = len(self._start)
+        if n == 0:
+            self._max, self._levels = [], -1
+            return
+        end = self._end
+        maxend = list(end)
+        # The last leaf and the largest end below it.
+        last_i = (n - 1) & ~1
+        last = end[last_i]
+        k = 1
+        while 1 << k <= n:
+            x = 1 << (k - 1)
+            for i in range((x << 1) - 1, n, x << 2):
+                right = maxend[i + x] if i + x < n else last
+                maxend[i] = max(end[i], maxend[i - x], right)
+            last_i = last_i - x if (last_i >> k) & 1 else last_i + x
+            if last_i < n and maxend[last_i] > last:
+                last = maxend[last_i]
+            k += 1
+        self._max, self._levels = maxend, k - 1
+
+    def query(self, start: int, end: int) -> list[Hashable]:
+        """Return the keys of the intervals ``[s, e)`` with ``s < end`` and ``e > start``.
+
+        That is overlap with ``[start, end)``; with the arguments swapped
+        (``start = b - 1``, ``end = a + 1`` for ``[a, b)``) it selects the
+        intervals that cover ``[a, b)``.
+        """
+        found = []
+        stale = self._stale
+        starts, ends, maxend, keys = self._start, self._end, self._max, self._keys
+        n = len(starts)
+        if n:
+            stack = [(((1 << self._levels) - 1), self._levels, False)]
+            while stack:
+                x, k, left_done = stack.pop()
+                if k <= 3:
+                    # Small subtree: scan its positions.
+                    i = x >> k << k
+                    stop = min(i + (1 << (k + 1)) - 1, n)
+                    while i < stop and starts[i] < end:
+                        if start < ends[i] and keys[i] not in stale:
+                            found.append(keys[i])
+                        i += 1
+                elif not left_done:
+                    y = x - (1 << (k - 1))
+                    stack.append((x, k, True))
+                    if y >= n or maxend[y] > start:
+                        stack.append((y, k - 1, False))
+                elif x < n and starts[x] < end:
+                    if start < ends[x] and keys[x] not in stale:
+                        found.append(keys[x])
+                    stack.append((x + (1 << (k - 1)), k - 1, False))
+        for key, (s, e) in self._pending.items():
+            if s < end and start < e:
+                found.append(key)
+        return found
+
+    def within(self, start: int, end: int) -> list[Hashable]:
+        """Return the keys of the intervals contained in ``[start, end)``."""
+        found = []
+        i = bisect.bisect_left(self._start, start)
+        j = bisect.bisect_left(self._start, end)
+        for p in range(i, j):
+            if self._end[p] <= end and self._keys[p] not in self._stale:
+                found.append(self._keys[p])
+        for key, (s, e) in self._pending.items():
+            if start <= s and e <= end:
+                found.append(key)
+        return found
+
+
+def _period(period: Optional[BaseModel]) -> Optional[tuple[int, int]]:
+    if period is None or (period.hasBeginning is None and period.hasEnd is None):
+        return None
+    start = MIN_DAY if period.hasBeginning is None else period.hasBeginning.toordinal()
+    end = MAX_DAY if period.hasEnd is None else period.hasEnd.toordinal() + 1
+    return (start, end) if start < end else None
+
+
+def _day(value: Optional[date]) -> Optional[tuple[int, int]]:
+    return None if value is None else (value.toordinal(), value.toordinal() + 1)
+
+
+def _intervals(kind: str, item: BaseModel) -> Iterator[tuple[str, Entry, tuple[int, int]]]:
+    """Yield ``(field, key, interval)`` for the dates held by an entity."""
+    key = (kind, identifier_of(item))
+    dated = []
+    if kind in RESOURCES:
+        if kind != "dataServices":
+            dated.append(("temporal", key, _period(item.temporal)))
+            for distribution in item.distribution or ():
+                inner = ("distributions", distribution.identifier, key)
+                dated.append(("issued", inner, _day(distribution.issued)))
+                dated.append(("modified", inner, _day(distribution.modified)))
+        dated.append(("issued", key, _day(item.issued)))
+        dated.append(("modified", key, _day(item.modified)))
+    elif kind == "distributions":
+        dated.append(("issued", key, _day(item.issued)))
+        dated.append(("modified", key, _day(item.modified)))
+    elif kind == "qualityMeasurements":
+        dated.append(("generatedAtTime", key, _day(item.generatedAtTime)))
+    for field, owner, interval in dated:
+        if interval is not None:
+            yield field, owner, interval
+
+
+class TemporalIndex:
+    """Overlap, cover, containment and point queries over catalog dates."""
+
+    def __init__(self, container: Optional[Container] = None):
+        self.sets: dict[str, IntervalSet] = {field: IntervalSet() for field in FIELDS}
+        # entity -> the (field, key) entries it contributed
+        self._entries: dict[Key, list[tuple[str, Entry]]] = {}
+        # series identifier -> member dataset keys; dataset key -> series identifier
+        self._members: dict[str, dict[Key, None]] = {}
+        self._series_of: dict[Key, str] = {}
+        # series identifier -> sorted starts and sorted ends of its members' coverage
+        self._hulls: dict[str, tuple[list[int], list[int]]] = {}
+        self._deferred = False
+        if container is not None:
+            self._deferred = True
+            for interval_set in self.sets.values():
+                interval_set.deferred = True
+            for kind, item in iter_container(container):
+                self.add(kind, item)
+            self._deferred = False
+            for series in self._members:
+                self._roll_up(series)
+            for interval_set in self.sets.values():
+                interval_set.deferred = False
+                interval_set.rebuild()
+
+    # -- maintenance ------------------------------------------------------------
+
+    def add(self, kind: str, item: BaseModel) -> None:
+        """Index ``item``, replacing an indexed entity with the same identifier."""
+        key = (kind, identifier_of(item))
+        if key in self._entries:
+            self.remove(*key)
+        entries = []
+        for field, owner, (start, end) in _intervals(kind, item):
+            self.sets[field].add(owner, start, end)
+            entries.append((field, owner))
+        self._entries[key] = entries
+        series = getattr(item, "inSeries", None)
+        if series is not None:
+            self._series_of[key] = series
+            self._members.setdefault(series, {})[key] = None
+            coverage = self.sets["temporal"].get(key)
+            if coverage is not None:
+                starts, ends = self._hulls.setdefault(series, ([], []))
+                bisect.insort(starts, coverage[0])
+                bisect.insort(ends, coverage[1])
+            self._roll_up(series)
+
+    def remove(self, kind: str, identifier: str) -> None:
+        key = (kind, identifier)
+        coverage = self.sets["temporal"].get(key)
+        for field, owner in self._entries.pop(key):
+            self.sets[field].discard(owner)
+        series = self._series_of.pop(key, None)
+        if series is not None:
+            members = self._members[series]
+            del members[key]
+            if not members:
+                del self._members[series]
+            if coverage is not None:
+                starts, ends = self._hulls[series]
+                del starts[bisect.bisect_left(starts, coverage[0])]
+                del ends[bisect.bisect_left(ends, coverage[1])]
+                if not starts:
+                    del self._hulls[series]
+            self._roll_up(series)
+
+    def _roll_up(self, series: str) -> None:
+        if self._deferred:
+            return
+        coverage = self._coverage(series)
+        key = ("series", series)
+        if coverage is None:
+            self.sets["series"].discard(key)
+        else:
+            self.sets["series"].add(key, *coverage)
+
+    # -- queries ----------------------------------------------------------------
+
+    def overlapping(self, start: Optional[DateLike], end: Optional[DateLike], field: str = "temporal") -> list[Entry]:
+        """Entities whose ``field`` shares at least one day with ``[start, end]`` (inclusive)."""
+        lo = MIN_DAY if start is None else _ordinal(start)
+        hi = MAX_DAY if end is None else _ordinal(end) + 1
+        return self.sets[field].query(lo, hi)
+
+    def covering(self, start: DateLike, end: DateLike, field: str = "temporal") -> list[Entry]:
+        """Entities whose ``field`` includes every day of ``[start, end]``."""
+        return self.sets[field].query(_ordinal(end), _ordinal(start) + 1)
+
+    def within(self, start: Optional[DateLike], end: Optional[DateLike], field: str = "temporal") -> list[Entry]:
+        """Entities whose ``field`` lies entirely inside ``[start, end]``."""
+        lo = MIN_DAY if start is None else _ordinal(start)
+        hi = MAX_DAY if end is None else _ordinal(end) + 1
+        return self.sets[field].within(lo, hi)
+
+    def at(self, day: DateLike, field: str = "temporal") -> list[Entry]:
+        """Entities whose ``field`` includes ``day``."""
+        ordinal = _ordinal(day)
+        return self.sets[field].query(ordinal, ordinal + 1)
+
+    def recent(self, days: int, field: str = "modified", today: Optional[date] = None) -> list[Entry]:
+        """Entities whose ``field`` falls in the last ``days`` days, today included."""
+        today = today or date.today()
+        return self.overlapping(today - timedelta(days=days - 1), today, field)
+
+    def _coverage(self, series: str) -> Optional[tuple[int, int]]:
+        hull = self._hulls.get(series)
+        if hull is None:
+            return None
+        starts, ends = hull
+        return starts[0], ends[-1]
+
+    def series_coverage(self, series: str) -> Optional[tuple[Optional[date], Optional[date]]]:
+        """The first and last day covered by the members of ``series``; ``None`` ends are open."""
+        coverage = self._coverage(series)
+        if coverage is None:
+            return None
+        return _date(coverage[0]), _date(coverage[1] - 1)
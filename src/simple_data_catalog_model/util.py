@@ -0,0 +1,24 @@
+"""Small helpers shared by the loaders."""
+
+from __future__ import annotations
+
+import gc
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Disable the cyclic garbage collector inside the block.
+
+    A loaded catalog is an acyclic tree that stays alive as a whole, so
+    collections while it is being built only rescan live objects. The
+    collector is re-enabled on exit only if it was enabled on entry.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
@@ -0,0 +1,277 @@
+"""Chunked, multi-process validation of a whole catalog.
+
+:func:`validate_catalog` reads the entries of a catalog file (or an in-memory
+``Container``), cuts every ``Container`` slot into chunks of ``chunk_size``
+consecutive entries and validates the chunks in a process pool:
+
+1. every entry is validated into its model class;
+2. optionally, the entities of the chunk are checked against the SHACL shapes.
+   Class constraints on referenced nodes (``sh:class``) are left out here,
+   since the referenced entity is usually in another chunk;
+3. the identifiers and outgoing references of the entities are sent back,
+   along with the identifiers of the distributions inlined in them.
+
+The main process then checks every reference against the identifiers of the
+whole catalog (inlined distributions included), which covers what was left out of step 2, and reports duplicate
+identifiers. Issues are located by the entry's line in the file (when read
+from a file) and a JSON pointer into the document. They are sorted by document
+order, so the report is the same for any number of workers.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from pydantic import BaseModel, ValidationError
+
+from .datamodel import Container
+from .index import REFERENCES, RULE_LISTS, identifier_of
+from .streaming import SECTIONS, SINGLE_VALUED, Source, iter_container, iter_raw
+
+SCHEMA = "schema"
+SHACL = "shacl"
+REFERENCE = "reference"
+# Order of the checks for issues on the same entry.
+_PHASES = {SCHEMA: 0, SHACL: 1, REFERENCE: 2}
+
+CLASS_CONSTRAINT = "http://www.w3.org/ns/shacl#ClassConstraintComponent"
+
+
+@dataclass(frozen=True)
+class Issue:
+    """A problem found in one catalog entry."""
+
+    section: str
+    index: int
+    line: Optional[int]
+    pointer: str
+    check: str
+    message: str
+    # Position of the entry in the document; the sort key of the report.
+    position: int = field(default=0, compare=False, repr=False)
+
+    def __str__(self) -> str:
+        where = f"{self.section}[{self.index}]"
+        if self.line is not None:
+            where += f" (line {self.line})"
+        return f"{where} {self.pointer}: {self.message}"
+
+
+@dataclass
+class ValidationReport:
+    issues: list[Issue]
+    entries: int
+    chunks: int
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+
+@dataclass
+class _Chunk:
+    section: str
+    # (position, index, line, data)
+    entries: list[tuple[int, int, Optional[int], Any]]
+
+
+@dataclass
+class _ChunkResult:
+    issues: list[Issue] = field(default_factory=list)
+    # (position, kind, identifier) of every valid entity, rules included
+    entities: list[tuple[int, str, str]] = field(default_factory=list)
+    # (kind, identifier) of the entities inlined in valid entities; they are
+    # reference targets but are not checked for duplicates
+    inlined: list[tuple[str, str]] = field(default_factory=list)
+    # (position, index, line, pointer, slot, target)
+    references: list[tuple[int, int, Optional[int], str, str, str]] = field(default_factory=list)
+
+
+def _pointer(*parts: Any) -> str:
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+def _entry_pointer(section: str, index: int) -> str:
+    return _pointer(section) if section in SINGLE_VALUED else _pointer(section, index)
+
+
+def _references(kind: str, item: BaseModel, base: str) -> Iterator[tuple[str, str, str]]:
+    """Yield ``(pointer, slot, target)`` for the references held by ``item``."""
+    for ref in REFERENCES:
+        if ref.inlined or kind not in ref.sources:
+            continue
+        value = getattr(item, ref.slot, None)
+        if value is None:
+            continue
+        if isinstance(value, list):
+            for i, target in enumerate(value):
+                yield base + _pointer(ref.slot, i), ref.slot, target
+        else:
+            yield base + _pointer(ref.slot), ref.slot, value
+
+
+def _inlined(kind: str, item: BaseModel) -> Iterator[tuple[str, str]]:
+    """Yield ``(kind, identifier)`` for the entities inlined in ``item``."""
+    for ref in REFERENCES:
+        if not ref.inlined or kind not in ref.sources:
+            continue
+        for value in getattr(item, ref.slot, None) or ():
+            yield ref.targets[0], identifier_of(value)
+
+
+def _iter_rules(policy: BaseModel) -> Iterator[tuple[str, BaseModel]]:
+    for attr in RULE_LISTS:
+        for i, rule in enumerate(getattr(policy, attr) or ()):
+            yield _pointer(attr, i), rule
+
+
+def _validate_chunk(chunk: _Chunk, shacl: bool) -> _ChunkResult:
+    result = _ChunkResult()
+    cls = SECTIONS.get(chunk.section)
+    if cls is None:
+        for position, index, line, _data in chunk.entries:
+            message = f"unknown catalog section {chunk.section!r}"
+            result.issues.append(Issue(chunk.section, index, line, _pointer(chunk.section), SCHEMA, message, position))
+        return result
+    valid: list[tuple[int, int, Optional[int], BaseModel]] = []
+    for position, index, line, data in chunk.entries:
+        base = _entry_pointer(chunk.section, index)
+        try:
+            item = cls.model_validate(data)
+        except ValidationError as e:
+            for error in e.errors():
+                result.issues.append(
+                    Issue(chunk.section, index, line, base + _pointer(*error["loc"]), SCHEMA, error["msg"], position)
+                )
+            continue
+        valid.append((position, index, line, item))
+        result.entities.append((position, chunk.section, identifier_of(item)))
+        result.inlined.extend(_inlined(chunk.section, item))
+        for pointer, slot, target in _references(chunk.section, item, base):
+            result.references.append((position, index, line, pointer, slot, target))
+        if chunk.section == "policies":
+            for rule_pointer, rule in _iter_rules(item):
+                result.entities.append((position, "rules", rule.uid))
+                for pointer, slot, target in _references("rules", rule, base + rule_pointer):
+                    result.references.append((position, index, line, pointer, slot, target))
+    if shacl and valid:
+        result.issues.extend(_shacl_issues(chunk.section, valid))
+    return result
+
+
+def _shacl_issues(section: str, valid: list[tuple[int, int, Optional[int], BaseModel]]) -> Iterator[Issue]:
+    from .shacl import IncrementalValidator
+
+    validator = IncrementalValidator()
+    validator.apply(added=[(section, item) for _position, _index, _line, item in valid])
+    for position, index, line, item in valid:
+        for result in validator.results_for(section, identifier_of(item)):
+            if result.component == CLASS_CONSTRAINT:
+                continue
+            message = f"{result.path}: {result.message}" if result.path else str(result.message)
+            yield Issue(section, index, line, _entry_pointer(section, index), SHACL, message, position)
+
+
+def _iter_dumped(container: Container) -> Iterator[tuple[str, int, Optional[int], Any]]:
+    counters: dict[str, int] = {}
+    for section, item in iter_container(container):
+        index = counters.get(section, 0)
+        counters[section] = index + 1
+        yield section, index, None, item.model_dump(exclude_none=True)
+
+
+def iter_chunks(
+    source: Union[Source, Container], format: Optional[str] = None, chunk_size: int = 1000
+) -> Iterator[_Chunk]:
+    """Cut the entries of a catalog into chunks of consecutive entries of one slot."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    entries = _iter_dumped(source) if isinstance(source, Container) else iter_raw(source, format)
+    chunk: Optional[_Chunk] = None
+    position = 0
+    for section, index, line, data in entries:
+        if section.startswith("@"):
+            continue
+        if chunk is not None and (chunk.section != section or len(chunk.entries) >= chunk_size):
+            yield chunk
+            chunk = None
+        if chunk is None:
+            chunk = _Chunk(section, [])
+        chunk.entries.append((position, index, line, data))
+        position += 1
+    if chunk is not None:
+        yield chunk
+
+
+def _check_references(results: Iterable[_ChunkResult], entries: dict[int, tuple[str, int, Optional[int]]]) -> list[Issue]:
+    identifiers: dict[str, dict[str, int]] = {}
+    issues = []
+    for result in results:
+        for position, kind, identifier in result.entities:
+            seen = identifiers.setdefault(kind, {})
+            if identifier in seen:
+                section, index, line = entries[position]
+                issues.append(
+                    Issue(section, index, line, _entry_pointer(section, index), REFERENCE,
+                          f"duplicate {kind} identifier {identifier!r}", position)
+                )
+            else:
+                seen[identifier] = position
+    for result in results:
+        for kind, identifier in result.inlined:
+            identifiers.setdefault(kind, {}).setdefault(identifier, -1)
+    targets = {ref.slot: ref.targets for ref in REFERENCES}
+    for result in results:
+        for position, index, line, pointer, slot, target in result.references:
+            if not any(target in identifiers.get(kind, ()) for kind in targets[slot]):
+                section = entries[position][0]
+                issues.append(Issue(section, index, line, pointer, REFERENCE, f"{slot} -> {target} does not exist", position))
+    return issues
+
+
+def validate_catalog(
+    source: Union[Source, Container],
+    format: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    shacl: bool = False,
+) -> ValidationReport:
+    """Validate a catalog in chunks on ``workers`` processes (default: all CPUs).
+
+    With ``workers=1`` the chunks are validated in the calling process.
+    """
+    workers = workers or os.cpu_count() or 1
+    results: dict[int, _ChunkResult] = {}
+    entries: dict[int, tuple[str, int, Optional[int]]] = {}
+    chunks = 0
+
+    def register(chunk: _Chunk) -> _Chunk:
+        for position, index, line, _data in chunk.entries:
+            entries[position] = (chunk.section, index, line)
+        return chunk
+
+    if workers == 1:
+        for number, chunk in enumerate(iter_chunks(source, format, chunk_size)):
+            results[number] = _validate_chunk(register(chunk), shacl)
+            chunks += 1
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: dict[Future, int] = {}
+            for number, chunk in enumerate(iter_chunks(source, format, chunk_size)):
+                # Bound the chunks in flight so the reader does not run ahead of the pool.
+                if len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[pending.pop(future)] = future.result()
+                pending[pool.submit(_validate_chunk, register(chunk), shacl)] = number
+                chunks += 1
+            for future in pending:
+                results[pending[future]] = future.result()
+    ordered = [results[number] for number in sorted(results)]
+    issues = [issue for result in ordered for issue in result.issues]
+    issues += _check_references(ordered, entries)
+    issues.sort(key=lambda issue: (issue.position, _PHASES[issue.check], issue.pointer, issue.message))
+    return ValidationReport(issues, len(entries), chunks)
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+import pytest
+
+from simple_data_catalog_model.streaming import load_container
+
+TESTS = Path(__file__).parent
+
+
+@pytest.fixture(scope="session")
+def testdata_yaml() -> Path:
+    return TESTS / "testdata.yaml"
+
+
+@pytest.fixture(scope="session")
+def testdata_json() -> Path:
+    return TESTS / "testdata.json"
+
+
+@pytest.fixture
+def container(testdata_yaml):
+    return load_container(testdata_yaml)
@@ -0,0 +1,63 @@
+import json
+import os
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from simple_data_catalog_model import datamodel
+from simple_data_catalog_model.datamodel import Container, Dataset, LinkMLMeta, Resource
+
+PROBE = """
+import json, sys
+import simple_data_catalog_model.datamodel as m
+print(json.dumps({
+    "metadata": m._metadata.cache_info().currsize,
+    "built": [c.__name__ for c in (m.Dataset, m.Container) if c.__pydantic_complete__],
+}))
+m.Dataset(identifier="ex:d")
+print(json.dumps({"built": m.Dataset.__pydantic_complete__, "metadata": m._metadata.cache_info().currsize}))
+"""
+
+
+def test_import_defers_metadata_and_validators():
+    env = {**os.environ, "PYTHONPATH": str(Path(datamodel.__file__).parents[1])}
+    out = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True, env=env)
+    out = out.stdout.splitlines()
+    assert json.loads(out[0]) == {"metadata": 0, "built": []}
+    # Validating builds the class, but still does not need the metadata.
+    assert json.loads(out[1]) == {"built": True, "metadata": 0}
+
+
+def test_class_and_schema_metadata():
+    assert isinstance(Dataset.linkml_meta, LinkMLMeta)
+    assert Dataset.linkml_meta is Dataset.linkml_meta
+    assert "class_uri" in Dataset.linkml_meta
+    assert datamodel.linkml_meta["id"]
+    with pytest.raises(AttributeError):
+        datamodel.no_such_name
+
+
+def test_json_schema_carries_slot_metadata():
+    schema = Dataset.model_json_schema()
+    assert "linkml_meta" in schema["properties"]["identifier"]
+    assert "linkml_meta" in schema["properties"]["distribution"]
+
+
+def test_inherited_fields_keep_their_order():
+    resource_fields = list(Resource.model_fields)
+    assert list(Dataset.model_fields)[: len(resource_fields)] == resource_fields
+    assert "distribution" in Dataset.model_fields
+
+
+def test_validation_after_deferred_build():
+    dataset = Dataset(identifier="ex:d", issued="2025-01-01", temporal={"hasBeginning": "2025-01-01"})
+    assert dataset.issued == date(2025, 1, 1)
+    assert dataset.temporal.hasBeginning == date(2025, 1, 1)
+    with pytest.raises(ValidationError):
+        Dataset(identifier="ex:d", unknown="x")
+    with pytest.raises(ValidationError):
+        Container(dataCatalog={"identifier": "ex:c"}, datasets=[{"title": "no id"}])
@@ -0,0 +1,86 @@
+import pytest
+
+from simple_data_catalog_model.datamodel import Concept, Container
+from simple_data_catalog_model.diff import THEIRS, apply, diff, fingerprint, fingerprints, merge
+
+
+def _with(container, **changes) -> Container:
+    return container.model_copy(update=changes)
+
+
+def _catalog(container, identifier):
+    return container.dataCatalog.model_copy(update={"identifier": identifier})
+
+
+def _labels(container):
+    return {c.identifier: c.prefLabel for c in container.concepts}
+
+
+def test_fingerprint_ignores_unset_slots():
+    assert fingerprint(Concept(identifier="ex:x")) == fingerprint(Concept(identifier="ex:x", altLabel=None))
+    assert fingerprint(Concept(identifier="ex:x")) != fingerprint(Concept(identifier="ex:y"))
+
+
+def test_diff_and_apply_round_trip(container):
+    concepts = list(container.concepts)
+    concepts[0] = concepts[0].model_copy(update={"prefLabel": "power"})
+    del concepts[1]
+    concepts.append(Concept(identifier="ex:new", prefLabel="new"))
+    new = _with(container, concepts=concepts)
+
+    changes = diff(container, new, fingerprints(container))
+    assert changes.summary() == {"added": 1, "removed": 1, "modified": 1}
+    assert changes.removed == [("concepts", "ex:bcd")]
+    assert apply(container, changes) == new
+    assert not diff(new, new)
+
+
+def test_apply_checks_keys(container):
+    changes = diff(container, _with(container, concepts=[]))
+    apply(container, changes)
+    with pytest.raises(KeyError):
+        apply(_with(container, concepts=[]), changes)
+
+
+def test_clean_merge_combines_both_sides(container):
+    first, second = container.concepts[0], container.concepts[1]
+    ours = _with(container, concepts=[first.model_copy(update={"prefLabel": "power"}), *container.concepts[1:]])
+    theirs = _with(container, concepts=[first, second.model_copy(update={"prefLabel": "trial"}), *container.concepts[2:]])
+    result = merge(container, ours, theirs)
+    assert result.clean
+    assert _labels(result.container) == {"ex:abc": "power", "ex:bcd": "trial", "ex:def": "data"}
+
+
+def test_conflict_is_resolved_by_prefer(container):
+    first = container.concepts[0]
+    ours = _with(container, concepts=[first.model_copy(update={"prefLabel": "power"}), *container.concepts[1:]])
+    theirs = _with(container, concepts=container.concepts[1:])
+    result = merge(container, ours, theirs)
+    (conflict,) = result.conflicts
+    assert conflict.key == ("concepts", "ex:abc")
+    assert str(conflict) == "concepts ex:abc: modified in ours, removed in theirs"
+    assert _labels(result.container)["ex:abc"] == "power"
+    assert "ex:abc" not in _labels(merge(container, ours, theirs, prefer=THEIRS).container)
+
+
+def test_catalog_identifier_changed_on_both_sides(container):
+    ours = _with(container, dataCatalog=_catalog(container, "ex:ours"))
+    theirs = _with(container, dataCatalog=_catalog(container, "ex:theirs"))
+    result = merge(container, ours, theirs)
+    (conflict,) = result.conflicts
+    assert conflict.key == ("dataCatalog", "ex:fhwiehduwke")
+    assert conflict.ours.identifier == "ex:ours" and conflict.theirs.identifier == "ex:theirs"
+    assert result.container.dataCatalog.identifier == "ex:ours"
+    assert merge(container, ours, theirs, prefer=THEIRS).container.dataCatalog.identifier == "ex:theirs"
+
+
+def test_catalog_identifier_changed_on_one_side(container):
+    ours = _with(container, dataCatalog=_catalog(container, "ex:ours"))
+    result = merge(container, ours, container)
+    assert result.clean
+    assert result.container.dataCatalog.identifier == "ex:ours"
+
+
+def test_merge_rejects_unknown_prefer(container):
+    with pytest.raises(ValueError, match="prefer"):
+        merge(container, container, container, prefer="mine")
@@ -0,0 +1,95 @@
+import pytest
+
+from simple_data_catalog_model.datamodel import (
+    Concept,
+    Container,
+    DataCatalog,
+    Dataset,
+    Distribution,
+    Permission,
+    Policy,
+    QualityMeasurement,
+)
+from simple_data_catalog_model.index import CatalogIndex, identifier_of
+
+
+@pytest.fixture
+def index(container):
+    return CatalogIndex(container)
+
+
+def test_lookup(index):
+    assert index.get("ex:herrcgre").title == "test dataset"
+    assert index.get("ex:herrcgre", "concepts") is None
+    assert index.get("plcy:register-in-catalog", "rules").action == "register"
+    assert "ex:abc" in index
+    assert len(index) == 9
+
+
+def test_reverse_references(index):
+    assert [identifier_of(d) for d in index.datasets_with_theme("ex:abc")] == ["ex:herrcgre"]
+    assert [identifier_of(d) for d in index.datasets_in_series("ex:abcde")] == ["ex:herrcgre"]
+    assert [identifier_of(m) for m in index.measurements_on("ex:herrcgre")] == ["ex:sfasdggfvrln"]
+    assert index.referrers("ex:herrcgre", "dataset") == [("dataCatalog", "ex:fhwiehduwke")]
+    assert index.policy_of_rule("plcy:make-accessible").uid == "plcy:open-information-policy"
+
+
+def test_dangling(index):
+    # The fixture's dataset refers to its policy by a different prefix.
+    (dangling,) = index.dangling()
+    assert (dangling.slot, dangling.target) == ("hasPolicy", "ex:open-information-policy")
+
+
+def test_update_moves_reverse_edges(index):
+    dataset = index.get("ex:herrcgre", "datasets")
+    index.update("datasets", dataset.model_copy(update={"theme": ["ex:def"]}))
+    assert index.datasets_with_theme("ex:abc") == []
+    assert [identifier_of(d) for d in index.datasets_with_theme("ex:def")] == ["ex:herrcgre"]
+
+
+def test_remove_and_add(index):
+    index.remove("concepts", "ex:abc")
+    assert any(d.target == "ex:abc" for d in index.dangling())
+    index.add("concepts", Concept(identifier="ex:abc", prefLabel="energy"))
+    assert not any(d.target == "ex:abc" for d in index.dangling())
+
+
+def test_remove_policy_drops_its_rules(index):
+    index.remove("policies", "plcy:open-information-policy")
+    assert index.get("plcy:make-accessible", "rules") is None
+    with pytest.raises(ValueError):
+        index.add("rules", index.get("ex:abc"))
+
+
+def test_update_unknown_raises(index):
+    with pytest.raises(KeyError):
+        index.update("datasets", Dataset(identifier="ex:nope"))
+
+
+def test_to_container_round_trip(container, index):
+    assert index.to_container() == container
+
+
+def test_inlined_distribution_is_a_reference_target():
+    container = Container(
+        dataCatalog=DataCatalog(identifier="ex:c", dataset=["ex:d"]),
+        datasets=[Dataset(identifier="ex:d", distribution=[Distribution(identifier="ex:dist", title="csv")])],
+        qualityMeasurements=[QualityMeasurement(identifier="ex:q", computedOn="ex:dist")],
+    )
+    index = CatalogIndex(container)
+    assert index.dangling() == []
+    assert index.get("ex:dist", "distributions").title == "csv"
+    assert "ex:dist" in index
+    index.update("datasets", Dataset(identifier="ex:d"))
+    assert [(d.slot, d.target) for d in index.dangling()] == [("computedOn", "ex:dist")]
+    assert index.get("ex:dist") is None
+
+
+def test_rule_uid_reused_by_another_policy_is_rejected(index):
+    policy = Policy(uid="plcy:other", permission=[Permission(uid="plcy:make-accessible", action="use")])
+    with pytest.raises(ValueError, match="plcy:make-accessible"):
+        index.add("policies", policy)
+    assert index.policy_of_rule("plcy:make-accessible").uid == "plcy:open-information-policy"
+    assert index.get("plcy:other") is None
+    # Re-adding the policy that owns the rule is fine.
+    index.update("policies", index.get("plcy:open-information-policy"))
@@ -0,0 +1,88 @@
+from collections import deque
+
+import pytest
+
+from simple_data_catalog_model.lineage import HUBS, LineageGraph
+from simple_data_catalog_model.synthetic import synthetic_container
+
+DATASET = ("datasets", "ex:herrcgre")
+
+
+@pytest.fixture(scope="module")
+def synthetic():
+    return LineageGraph(synthetic_container(150, seed=5))
+
+
+def _naive(graph, root, depth=None, direction="both", stop=()):
+    start = graph._nodes[graph._resolve(root)]
+    reached = {start: 0}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        level = reached[node]
+        if (depth is not None and level >= depth) or (level and node[0] in stop):
+            continue
+        for edge in graph.edges(node, direction):
+            for neighbour in (edge.source, edge.target):
+                if neighbour not in reached:
+                    reached[neighbour] = level + 1
+                    queue.append(neighbour)
+    return reached
+
+
+@pytest.mark.parametrize("direction", ["in", "out", "both"])
+@pytest.mark.parametrize("depth", [None, 1, 2])
+def test_batched_search_matches_naive_search(synthetic, direction, depth):
+    roots = [key for key in synthetic._nodes if key[0] in ("datasets", "concepts")][:100]
+    assert len(roots) > 64  # more than one batch
+    for root, reached in zip(roots, synthetic.traverse(roots, depth, direction)):
+        assert reached == _naive(synthetic, root, depth, direction)
+
+
+def test_impact_stops_at_hubs(synthetic):
+    roots = [key for key in synthetic._nodes if key[0] == "datasets"][:10]
+    for root, reached in zip(roots, synthetic.impact(roots)):
+        assert reached == _naive(synthetic, root, stop=HUBS)
+
+
+def test_fixture_graph(container):
+    graph = LineageGraph(container)
+    assert DATASET in graph and "ex:abc" in graph and "ex:missing" not in graph
+    assert graph.dangling == 1  # hasPolicy ex:open-information-policy
+    out = graph.reach(DATASET, depth=1, direction="out")
+    assert out == {DATASET: 0, ("series", "ex:abcde"): 1, ("concepts", "ex:abc"): 1,
+                   ("concepts", "ex:bcd"): 1, ("concepts", "ex:def"): 1}
+    incoming = graph.reach(DATASET, depth=1, direction="in")
+    assert set(incoming) == {DATASET, ("dataCatalog", "ex:fhwiehduwke"), ("qualityMeasurements", "ex:sfasdggfvrln")}
+
+
+def test_results_are_cached_copies(container):
+    graph = LineageGraph(container, cache_size=1)
+    first = graph.reach(DATASET)
+    first.clear()
+    assert graph.reach(DATASET) != {}
+    graph.reach("ex:abc")
+    assert len(graph._cache) == 1
+
+
+def test_invalid_arguments(container):
+    graph = LineageGraph(container)
+    with pytest.raises(KeyError):
+        graph.reach("ex:missing")
+    with pytest.raises(ValueError, match="direction"):
+        graph.reach(DATASET, direction="up")
+    with pytest.raises(ValueError, match="unknown kinds"):
+        graph.reach(DATASET, stop=["things"])
+
+
+def test_subgraph_export(container):
+    graph = LineageGraph(container)
+    exported = graph.export("ex:herrcgre", depth=1, direction="out", data=True)
+    assert exported["root"] == {"kind": "datasets", "identifier": "ex:herrcgre"}
+    assert len(exported["nodes"]) == 5
+    assert all("data" in node for node in exported["nodes"])
+    assert {edge["slot"] for edge in exported["edges"]} == {"inSeries", "theme"}
+    assert len(exported["edges"]) == 4
+    # Only edges between reached nodes are kept.
+    subgraph = graph.subgraph(DATASET, depth=1, direction="in")
+    assert all(edge.target == DATASET for edge in subgraph.edges)
@@ -0,0 +1,78 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from simple_data_catalog_model.datamodel import Metric, QualityMeasurement
+from simple_data_catalog_model.measurements import MeasurementStore
+
+
+@pytest.fixture
+def store():
+    metrics = [
+        Metric(identifier="ex:complete", inDimension="Completeness"),
+        Metric(identifier="ex:accurate", inDimension="Accuracy"),
+    ]
+    store = MeasurementStore(metrics)
+    store.append(
+        ["ex:m1", "ex:m2", "ex:m3", "ex:m4", "ex:m5"],
+        ["ex:a", "ex:a", "ex:a", "ex:b", "ex:b"],
+        ["ex:complete", "ex:complete", "ex:accurate", "ex:complete", None],
+        [0.5, 0.7, 0.9, None, 0.1],
+        [date(2025, 1, 1), date(2025, 1, 3), "2025-01-02", date(2025, 1, 1), None],
+    )
+    return store
+
+
+def test_from_container(container):
+    store = MeasurementStore.from_container(container)
+    assert len(store) == 1
+    assert store.latest() == {"ex:herrcgre": 0.9}
+
+
+def test_round_trip_keeps_missing_values(store):
+    measurements = store.to_measurements()
+    assert measurements[3].value is None
+    assert measurements[4].isMeasurementOf is None and measurements[4].generatedAtTime is None
+    again = MeasurementStore()
+    again.extend(measurements)
+    assert again.to_measurements() == measurements
+
+
+def test_aggregate_ignores_missing_values(store):
+    result = store.aggregate("dataset").as_dict()
+    assert result["ex:a"]["count"] == 3
+    assert result["ex:a"]["mean"] == pytest.approx(0.7)
+    assert result["ex:a"]["latest"] == 0.7
+    assert result["ex:a"]["latest_date"] == date(2025, 1, 3)
+    assert result["ex:b"]["count"] == 1
+
+
+def test_aggregate_by_dimension_and_window(store):
+    result = store.aggregate("dimension", start="2025-01-02").as_dict()
+    assert set(result) == {"Completeness", "Accuracy"}
+    assert result["Completeness"]["count"] == 1
+
+
+def test_rolling_mean(store):
+    rolling = store.rolling_mean(2, start="2025-01-01", end="2025-01-03")
+    assert rolling.labels == ["ex:a"]
+    assert rolling.dates.tolist() == [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)]
+    np.testing.assert_allclose(rolling.mean[0], [0.5, 0.7, 0.8])
+
+
+def test_rolling_mean_rejects_reversed_window(store):
+    with pytest.raises(ValueError, match="after end"):
+        store.rolling_mean(3, start="2025-02-01", end="2025-01-01")
+    with pytest.raises(ValueError, match="window"):
+        store.rolling_mean(0)
+
+
+def test_rolling_mean_with_start_after_data_is_empty(store):
+    rolling = store.rolling_mean(3, start="2026-01-01")
+    assert rolling.labels == [] and rolling.mean.shape == (0, 0)
+
+
+def test_append_checks_column_lengths(store):
+    with pytest.raises(ValueError, match="same length"):
+        store.append(["ex:x"], [], [], [], [])
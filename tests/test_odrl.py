@@ -0,0 +1,99 @@
+import pytest
+
+from simple_data_catalog_model.datamodel import (
+    Container,
+    DataCatalog,
+    Dataset,
+    Duty,
+    PartyCollection,
+    Permission,
+    Policy,
+    Prohibition,
+)
+from simple_data_catalog_model.odrl import DENY, NOT_APPLICABLE, PERMIT, PolicyEngine
+
+CONSUMER = PartyCollection.Data_Consumer
+
+
+def _policy(**changes) -> Policy:
+    data = {
+        "uid": "plcy:p",
+        "permission": [Permission(uid="plcy:use", action="use", assignee=[CONSUMER], duty=["plcy:attribute"])],
+        "prohibition": [Prohibition(uid="plcy:no-sell", action="sell", remedy=["plcy:delete"])],
+        "obligation": [
+            Duty(uid="plcy:attribute", action="attribute", consequence=["plcy:compensate"]),
+            Duty(uid="plcy:compensate", action="compensate"),
+            Duty(uid="plcy:delete", action="delete"),
+            Duty(uid="plcy:register", action="register", assignee=[PartyCollection.Data_Provider]),
+        ],
+    }
+    data.update(changes)
+    return Policy(**data)
+
+
+@pytest.fixture
+def engine():
+    container = Container(
+        dataCatalog=DataCatalog(identifier="ex:catalog", dataset=["ex:d"]),
+        datasets=[Dataset(identifier="ex:d", hasPolicy="plcy:p"), Dataset(identifier="ex:free")],
+        policies=[_policy()],
+    )
+    return PolicyEngine(container)
+
+
+def test_permission_carries_duty_closure(engine):
+    decision = engine.decide("ex:d", CONSUMER, "use")
+    assert decision.effect == PERMIT
+    assert decision.rules == ("plcy:use",)
+    assert decision.duties == ("plcy:attribute", "plcy:compensate")
+
+
+def test_permission_is_per_assignee(engine):
+    assert engine.decide("ex:d", "Data Provider", "use").effect == NOT_APPLICABLE
+
+
+def test_prohibition_without_assignee_applies_to_everyone(engine):
+    decision = engine.decide("ex:d", "Data Provider", "sell")
+    assert decision.effect == DENY
+    assert decision.remedies == ("plcy:delete",)
+
+
+def test_resource_without_policy(engine):
+    assert engine.decide("ex:free", CONSUMER, "use").effect == NOT_APPLICABLE
+    assert engine.decide("ex:missing", CONSUMER, "use").effect == NOT_APPLICABLE
+
+
+def test_obligations(engine):
+    # Duties without an assignee bind every party.
+    everyone = ("plcy:attribute", "plcy:compensate", "plcy:delete")
+    assert engine.obligations("ex:d", "Data Provider") == ("plcy:register",) + everyone
+    assert engine.obligations("ex:d", CONSUMER) == everyone
+
+
+def test_decide_many_evaluates_repeats_once(engine):
+    decisions = engine.decide_many([("ex:d", CONSUMER, "use")] * 3 + [("ex:d", CONSUMER, "sell")])
+    assert [d.effect for d in decisions] == [PERMIT, PERMIT, PERMIT, DENY]
+    assert engine.misses == 2
+
+
+def test_updating_policy_evicts_dependent_decisions(engine):
+    assert engine.permitted("ex:d", CONSUMER, "use")
+    engine.update_policy(_policy(prohibition=[Prohibition(uid="plcy:no-use", action="use")]))
+    assert engine.decide("ex:d", CONSUMER, "use").effect == DENY
+
+
+def test_changing_has_policy_evicts_resource(engine):
+    assert engine.permitted("ex:d", CONSUMER, "use")
+    engine.update_resource("datasets", Dataset(identifier="ex:d"))
+    assert engine.decide("ex:d", CONSUMER, "use").effect == NOT_APPLICABLE
+
+
+def test_removing_policy(engine):
+    assert engine.permitted("ex:d", CONSUMER, "use")
+    engine.remove_policy("plcy:p")
+    assert engine.decide("ex:d", CONSUMER, "use").effect == NOT_APPLICABLE
+
+
+def test_container_and_index_are_exclusive(engine):
+    with pytest.raises(ValueError):
+        PolicyEngine(Container(dataCatalog=DataCatalog(identifier="ex:c")), index=engine.index)
@@ -0,0 +1,73 @@
+from datetime import date
+
+import pytest
+
+from simple_data_catalog_model.datamodel import Concept, QualityMeasurement
+from simple_data_catalog_model.index import CatalogIndex
+from simple_data_catalog_model.pages import build_pages, iter_pages, label_of, page_path
+
+
+def _with(container, **changes):
+    return container.model_copy(update=changes)
+
+
+def test_page_paths_are_injective():
+    assert page_path("datasets", "herrcgre") == "datasets/herrcgre.adoc"
+    assert page_path("datasets", "ex-herrcgre") == "datasets/ex-herrcgre.adoc"
+    sanitised = {page_path("datasets", i) for i in ("ex:herrcgre", "ex/herrcgre", "-ex-herrcgre")}
+    assert len(sanitised) == 3
+    assert all(p.startswith("datasets/ex-herrcgre-") for p in sanitised)
+
+
+def test_colliding_pages_are_rejected(container, monkeypatch):
+    import simple_data_catalog_model.pages as pages
+
+    monkeypatch.setattr(pages, "page_path", lambda kind, identifier: f"{kind}/page.adoc")
+    with pytest.raises(ValueError, match="would share the page"):
+        dict(iter_pages(CatalogIndex(container)))
+
+
+def test_measurement_labels():
+    measurement = QualityMeasurement(identifier="ex:m", computedOn="ex:d", isMeasurementOf="ex:complete",
+                                     value=0.75, generatedAtTime=date(2025, 4, 22))
+    assert label_of("qualityMeasurements", measurement) == "ex:complete = 0.75 (2025-04-22)"
+    bare = QualityMeasurement(identifier="ex:m", computedOn="ex:d")
+    assert label_of("qualityMeasurements", bare) == "ex:m = n/a"
+
+
+def test_build_renders_every_page(container, tmp_path):
+    report = build_pages(container, tmp_path, workers=1)
+    assert len(report.regenerated) == 8 and not report.skipped
+    dataset = (tmp_path / "pages" / page_path("datasets", "ex:herrcgre")).read_text()
+    assert dataset.startswith("= test dataset\n")
+    assert f"* theme: xref:{page_path('concepts', 'ex:abc')}[energy]" in dataset
+    # Measurements have no page of their own and are listed without a link.
+    assert "* computedOn: ex:fkrhkqewjewrc = 0.9 (2025-04-22) (`ex:sfasdggfvrln`)" in dataset
+    assert "xref:" in (tmp_path / "nav.adoc").read_text()
+
+
+def test_rebuild_touches_changed_pages_only(container, tmp_path):
+    build_pages(container, tmp_path, workers=1)
+    concepts = [container.concepts[0].model_copy(update={"prefLabel": "power"}), *container.concepts[1:]]
+    report = build_pages(_with(container, concepts=concepts), tmp_path, workers=1)
+    # The concept itself and the dataset that shows its label.
+    assert sorted(report.regenerated) == sorted([page_path("concepts", "ex:abc"), page_path("datasets", "ex:herrcgre")])
+    assert len(report.skipped) == 6
+
+
+def test_removed_entity_page_is_deleted(container, tmp_path):
+    build_pages(container, tmp_path, workers=1)
+    concepts = [*container.concepts, Concept(identifier="ex:new", prefLabel="new")]
+    build_pages(_with(container, concepts=concepts), tmp_path, workers=1)
+    path = page_path("concepts", "ex:new")
+    assert (tmp_path / "pages" / path).exists()
+    report = build_pages(container, tmp_path, workers=1)
+    assert report.deleted == [path]
+    assert not (tmp_path / "pages" / path).exists()
+
+
+def test_measurement_without_value_is_rendered(container, tmp_path):
+    measurements = [container.qualityMeasurements[0].model_copy(update={"value": None})]
+    build_pages(_with(container, qualityMeasurements=measurements), tmp_path, workers=1)
+    dataset = (tmp_path / "pages" / page_path("datasets", "ex:herrcgre")).read_text()
+    assert "= n/a" in dataset
@@ -0,0 +1,83 @@
+import io
+from pathlib import Path
+
+import pytest
+import rdflib
+from rdflib.compare import isomorphic
+
+from simple_data_catalog_model.index import identifier_of
+from simple_data_catalog_model.rdf import (
+    default_schema,
+    iter_records_from_ntriples,
+    literal,
+    parse_literal,
+    write_ntriples,
+    write_turtle,
+)
+from simple_data_catalog_model.streaming import SINGLE_VALUED, iter_container
+
+TESTS = Path(__file__).parent
+
+
+def _ntriples(container) -> str:
+    sink = io.StringIO()
+    write_ntriples(container, sink)
+    return sink.getvalue()
+
+
+def _entities(records):
+    return [(r.section, r.item) for r in records]
+
+
+def test_ntriples_and_turtle_agree(container):
+    ntriples = rdflib.Graph().parse(data=_ntriples(container), format="nt")
+    sink = io.StringIO()
+    write_turtle(container, sink)
+    turtle = rdflib.Graph().parse(data=sink.getvalue(), format="turtle")
+    assert len(ntriples) > 0
+    assert isomorphic(ntriples, turtle)
+
+
+def test_output_matches_linkml_convert(container):
+    # testdata.ttl is the linkml-convert output for testdata.yaml.
+    expected = rdflib.Graph().parse(TESTS / "testdata.ttl", format="turtle")
+    sink = io.StringIO()
+    write_turtle(container, sink)
+    assert isomorphic(rdflib.Graph().parse(data=sink.getvalue(), format="turtle"), expected)
+    assert isomorphic(rdflib.Graph().parse(data=_ntriples(container), format="nt"), expected)
+
+
+def test_round_trip(container):
+    records = list(iter_records_from_ntriples(_ntriples(container).splitlines()))
+    assert _entities(records) == list(iter_container(container))
+
+
+def test_unordered_round_trip(container):
+    lines = sorted(_ntriples(container).splitlines(), reverse=True)
+    records = list(iter_records_from_ntriples(lines, ordered=False))
+    # RDF has no order, so multivalued slots may come back permuted.
+    keys = sorted((r.section, identifier_of(r.item)) for r in records)
+    assert keys == sorted((section, identifier_of(item)) for section, item in iter_container(container))
+    (dataset,) = [r.item for r in records if r.section == "datasets"]
+    assert sorted(dataset.theme) == sorted(container.datasets[0].theme)
+    sections = [r.section for r in records]
+    assert all(sections.count(s) == 1 for s in SINGLE_VALUED)
+
+
+def test_literal_escaping_round_trip():
+    text = 'a "quoted"\tvalue\\ over\nlines'
+    assert parse_literal(literal(text)) == text
+    assert literal("1", "http://www.w3.org/2001/XMLSchema#float").endswith("#float>")
+
+
+def test_curies():
+    schema = default_schema()
+    iri = schema.expand("dcat:Dataset")
+    assert iri == "http://www.w3.org/ns/dcat#Dataset"
+    assert schema.compact(iri) == "dcat:Dataset"
+    assert schema.expand("https://example.com/x") == "https://example.com/x"
+
+
+def test_malformed_line_raises():
+    with pytest.raises(ValueError, match="line 1"):
+        list(iter_records_from_ntriples(["not a triple"]))
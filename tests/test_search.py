@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from simple_data_catalog_model.datamodel import Dataset
+from simple_data_catalog_model.search import SearchIndex
+
+
+@pytest.fixture
+def index(container):
+    return SearchIndex(container)
+
+
+def _ids(result):
+    return [hit.identifier for hit in result.hits]
+
+
+def test_ranked_keyword_search(index):
+    result = index.search("test")
+    # The concept labelled "test", the dataset titled "test dataset" and the
+    # catalog, whose title is longer.
+    assert _ids(result) == ["ex:bcd", "ex:herrcgre", "ex:fhwiehduwke"]
+    scores = [hit.score for hit in result.hits]
+    assert scores == sorted(scores, reverse=True) and scores[-1] > 0
+
+
+def test_concept_label_expansion(index):
+    assert "ex:herrcgre" in _ids(index.search("juice"))
+    assert "ex:herrcgre" not in _ids(index.search("juice", expand=False))
+
+
+def test_facets(index):
+    assert _ids(index.search(filters={"status": "draft"})) == ["ex:herrcgre"]
+    assert index.search(filters={"status": "published"}).total == 0
+    assert index.search("test").facets["status"]["draft"] == 1
+    with pytest.raises(ValueError, match="facet"):
+        index.search(filters={"colour": "red"})
+
+
+def test_add_and_remove(index):
+    index.add("datasets", Dataset(identifier="ex:new", title="hydrogen storage"))
+    assert _ids(index.search("hydrogen")) == ["ex:new"]
+    index.remove("datasets", "ex:new")
+    assert index.search("hydrogen").total == 0
+
+
+def test_save_and_open(index, tmp_path):
+    index.save(tmp_path)
+    opened = SearchIndex.open(tmp_path)
+    assert len(opened) == len(index)
+    for query in ("test", "juice", "energy"):
+        assert _ids(opened.search(query)) == _ids(index.search(query))
+
+
+def test_opened_index_can_be_updated_and_saved_again(index, tmp_path):
+    index.save(tmp_path)
+    opened = SearchIndex.open(tmp_path)
+    opened.remove("datasets", "ex:herrcgre")
+    opened.add("datasets", Dataset(identifier="ex:new", title="hydrogen storage"))
+    opened.save(tmp_path)
+    # The previous generation's arrays are gone, the old mapping still works.
+    assert sorted(p.name for p in tmp_path.glob("*.npy")) == [
+        "docs.2.npy", "offsets.2.npy", "terms.2.npy", "weights.2.npy",
+    ]
+    assert "ex:herrcgre" not in _ids(opened.search("test"))
+    reopened = SearchIndex.open(tmp_path)
+    assert _ids(reopened.search("hydrogen")) == ["ex:new"]
+    assert "ex:herrcgre" not in _ids(reopened.search("test"))
+
+
+def test_interrupted_save_leaves_previous_index(index, tmp_path, monkeypatch):
+    index.save(tmp_path)
+    before = _ids(SearchIndex.open(tmp_path).search("test"))
+    index.add("datasets", Dataset(identifier="ex:new", title="test hydrogen"))
+
+    def crash(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", crash)
+    with pytest.raises(OSError):
+        index.save(tmp_path)
+    monkeypatch.undo()
+    assert _ids(SearchIndex.open(tmp_path).search("test")) == before
+
+
+def test_open_rejects_other_format(index, tmp_path):
+    index.save(tmp_path)
+    meta = json.loads((tmp_path / "documents.json").read_text())
+    meta["version"] = 0
+    (tmp_path / "documents.json").write_text(json.dumps(meta))
+    with pytest.raises(ValueError, match="format"):
+        SearchIndex.open(tmp_path)
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+import rdflib
+from pyshacl.shapes_graph import ShapesGraph
+from rdflib.namespace import SH
+
+from simple_data_catalog_model.index import RULE_LISTS
+from simple_data_catalog_model.shacl import IncrementalValidator, load_shapes, validate_graph
+
+TESTS = Path(__file__).parent
+DATASET = ("datasets", "ex:herrcgre")
+
+
+@pytest.fixture(scope="module")
+def shapes():
+    return load_shapes()
+
+
+@pytest.fixture
+def validator(container, shapes):
+    return IncrementalValidator(container, shapes)
+
+
+def _paths(results):
+    return {r.path for r in results}
+
+
+def test_reports_dangling_policy(validator):
+    assert not validator.conforms
+    assert "<http://www.w3.org/ns/odrl/2/hasPolicy>" in _paths(validator.results_for(*DATASET))
+
+
+def test_incremental_matches_full_validation(validator):
+    incremental = set(validator.results)
+    assert set(validator.validate_all()) == incremental
+
+
+def test_adding_referenced_entity_revalidates_referrer(container, validator):
+    original = container.policies[0]
+    # Rule uids are unique across policies, so the copy gets its own.
+    rules = {
+        attr: [rule.model_copy(update={"uid": rule.uid + "-copy"}) for rule in getattr(original, attr)]
+        for attr in RULE_LISTS
+        if getattr(original, attr)
+    }
+    policy = original.model_copy(update={"uid": "ex:open-information-policy", **rules})
+    revalidated = validator.apply(added=[("policies", policy)])
+    assert DATASET in revalidated
+    assert "<http://www.w3.org/ns/odrl/2/hasPolicy>" not in _paths(validator.results_for(*DATASET))
+
+
+def test_replacing_entity(container, validator):
+    dataset = container.datasets[0].model_copy(update={"hasPolicy": "plcy:open-information-policy"})
+    validator.apply(added=[("datasets", dataset)])
+    assert "<http://www.w3.org/ns/odrl/2/hasPolicy>" not in _paths(validator.results_for(*DATASET))
+    assert set(validator.results) == set(validator.validate_all())
+
+
+def test_removing_entity_drops_its_results(validator):
+    validator.apply(removed=[DATASET])
+    assert validator.results_for(*DATASET) == []
+    assert all(r.entity != DATASET for r in validator.results)
+
+
+def test_validation_reuses_the_harvested_shapes(shapes, monkeypatch):
+    # validate_graph swaps the harvested ShapesGraph into pySHACL's Validator
+    # (pinned in pyproject). Fails if a release harvests the shapes again anyway.
+    harvests = []
+    build = ShapesGraph._build_node_shape_cache
+    monkeypatch.setattr(ShapesGraph, "_build_node_shape_cache", lambda self: harvests.append(self) or build(self))
+    report = validate_graph(rdflib.Graph().parse(TESTS / "testdata.ttl", format="turtle"), shapes)
+    assert harvests == []
+    assert (None, SH.resultPath, rdflib.URIRef("http://www.w3.org/ns/odrl/2/hasPolicy")) in report
@@ -0,0 +1,68 @@
+import struct
+
+import pytest
+
+from simple_data_catalog_model import snapshot as snapshots
+from simple_data_catalog_model.snapshot import Snapshot, StaleSnapshotError, write_snapshot
+
+
+@pytest.fixture
+def path(container, tmp_path):
+    path = tmp_path / "catalog.snap"
+    write_snapshot(container, path)
+    return path
+
+
+def test_round_trip(container, path):
+    with Snapshot.open(path) as snapshot:
+        assert snapshot.to_container() == container
+
+
+def test_lookup_by_identifier(container, path):
+    with Snapshot.open(path) as snapshot:
+        concepts = snapshot["concepts"]
+        assert list(concepts) == ["ex:abc", "ex:bcd", "ex:def"]
+        assert concepts["ex:def"] == container.concepts[2]
+        assert snapshot.get("datasets", "ex:herrcgre") == container.datasets[0]
+        assert "ex:missing" not in concepts
+        assert snapshot.get("concepts", "ex:missing") is None
+        assert len(snapshot["dataServices"]) == 0
+        with pytest.raises(KeyError):
+            snapshot["unknown"]
+
+
+def test_entities_outlive_the_mapping(container, path):
+    snapshot = Snapshot.open(path)
+    dataset = snapshot.get("datasets", "ex:herrcgre")
+    snapshot.close()
+    assert dataset == container.datasets[0]
+
+
+def test_rewrite_replaces_file(container, path):
+    smaller = container.model_copy(update={"concepts": container.concepts[:1]})
+    write_snapshot(smaller, path)
+    assert not path.with_name(path.name + ".tmp").exists()
+    with Snapshot.open(path) as snapshot:
+        assert list(snapshot["concepts"]) == ["ex:abc"]
+
+
+def test_snapshot_of_another_schema_is_stale(path, monkeypatch):
+    monkeypatch.setattr(snapshots, "schema_digest", lambda: b"\x00" * 16)
+    with pytest.raises(StaleSnapshotError, match="another version"):
+        Snapshot.open(path)
+
+
+def test_snapshot_of_another_format_is_stale(path):
+    data = bytearray(path.read_bytes())
+    struct.pack_into("<I", data, 8, snapshots.FORMAT_VERSION + 1)
+    path.write_bytes(bytes(data))
+    with pytest.raises(StaleSnapshotError, match="format"):
+        Snapshot.open(path)
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "catalog.yaml"
+    path.write_text("dataCatalog: {}\n" * 10)
+    with pytest.raises(StaleSnapshotError, match="not a catalog snapshot"):
+        Snapshot.open(path)
+
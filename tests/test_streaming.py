@@ -0,0 +1,141 @@
+import gc
+import io
+import json
+
+import pytest
+import yaml
+
+from simple_data_catalog_model.datamodel import Container, Dataset
+from simple_data_catalog_model.streaming import (
+    CatalogWriter,
+    RecordValidationError,
+    detect_format,
+    iter_container,
+    iter_records,
+    load_container,
+    write_records,
+)
+
+
+def test_yaml_and_json_fixtures_agree(testdata_yaml, testdata_json):
+    from_yaml = load_container(testdata_yaml)
+    from_json = load_container(testdata_json)
+    assert from_json.datasets[0].theme == from_yaml.datasets[0].theme == ["ex:abc", "ex:bcd", "ex:def"]
+    assert from_json.concepts == from_yaml.concepts
+
+
+def test_records_carry_section_index_and_line(testdata_yaml):
+    records = list(iter_records(testdata_yaml))
+    assert [r.section for r in records[:2]] == ["dataCatalog", "datasets"]
+    concepts = [r for r in records if r.section == "concepts"]
+    assert [r.index for r in concepts] == [0, 1, 2]
+    assert concepts[0].line == 31
+    assert isinstance(records[1].item, Dataset)
+
+
+def test_sections_filter(testdata_yaml):
+    sections = {r.section for r in iter_records(testdata_yaml, sections=["concepts"])}
+    assert sections == {"concepts"}
+
+
+@pytest.mark.parametrize("format", ["yaml", "json", "jsonl"])
+def test_round_trip(container, tmp_path, format):
+    path = tmp_path / f"catalog.{format}"
+    with CatalogWriter(path) as writer:
+        for section, item in iter_container(container):
+            writer.write(section, item)
+    assert writer.count == sum(1 for _ in iter_container(container))
+    assert load_container(path) == container
+
+
+def test_write_records_to_stream(testdata_yaml):
+    stream = io.StringIO()
+    count = write_records(iter_records(testdata_yaml), stream, "json")
+    document = json.loads(stream.getvalue())
+    assert count == 9
+    assert Container.model_validate(document) == load_container(testdata_yaml)
+
+
+def test_close_twice_on_caller_stream_ends_document_once(container):
+    stream = io.StringIO()
+    with CatalogWriter(stream, "json") as writer:
+        writer.write("dataCatalog", container.dataCatalog)
+        writer.close()
+    assert stream.getvalue().count("\n}\n") == 1
+    json.loads(stream.getvalue())
+    with pytest.raises(ValueError, match="closed"):
+        writer.write("datasets", container.datasets[0])
+
+
+def test_empty_json_document():
+    stream = io.StringIO()
+    CatalogWriter(stream, "json").close()
+    assert json.loads(stream.getvalue()) == {}
+
+
+def test_sections_must_be_grouped(container):
+    writer = CatalogWriter(io.StringIO(), "yaml")
+    writer.write("datasets", container.datasets[0])
+    writer.write("concepts", container.concepts[0])
+    with pytest.raises(ValueError, match="already written"):
+        writer.write("datasets", container.datasets[0])
+
+
+def test_invalid_record_raises_with_location(tmp_path):
+    path = tmp_path / "bad.yaml"
+    path.write_text(yaml.safe_dump({"concepts": [{"identifier": "ex:a"}, {"prefLabel": "no id"}]}))
+    with pytest.raises(RecordValidationError) as info:
+        list(iter_records(path))
+    assert info.value.record_error.section == "concepts"
+    assert info.value.record_error.index == 1
+
+
+def test_on_error_skips_invalid_records(tmp_path):
+    path = tmp_path / "bad.jsonl"
+    path.write_text(
+        '{"concepts": {"identifier": "ex:a"}}\n{"concepts": {"prefLabel": "no id"}}\n{"unknown": {}}\n'
+    )
+    errors = []
+    records = list(iter_records(path, on_error=errors.append))
+    assert [r.item.identifier for r in records] == ["ex:a"]
+    assert [(e.section, e.line) for e in errors] == [("concepts", 2), ("unknown", 3)]
+
+
+def test_malformed_date_reaches_on_error(tmp_path):
+    path = tmp_path / "bad.json"
+    datasets = [{"identifier": "ex:a", "issued": "2025-13-45"}, {"identifier": "ex:b"}]
+    path.write_text(json.dumps({"dataCatalog": {"identifier": "ex:c"}, "datasets": datasets}))
+    errors = []
+    container = load_container(path, on_error=errors.append)
+    assert [d.identifier for d in container.datasets] == ["ex:b"]
+    assert [(e.section, e.index) for e in errors] == [("datasets", 0)]
+
+
+def test_load_restores_gc_after_error(tmp_path):
+    path = tmp_path / "bad.yaml"
+    path.write_text(yaml.safe_dump({"concepts": [{"prefLabel": "no id"}]}))
+    assert gc.isenabled()
+    with pytest.raises(RecordValidationError):
+        load_container(path)
+    assert gc.isenabled()
+
+
+def test_yaml_records_match_safe_load(testdata_yaml):
+    document = yaml.safe_load(testdata_yaml.read_text())
+    container = load_container(testdata_yaml)
+    assert container == Container(**document)
+
+
+def test_json_line_numbers(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps({"concepts": [{"identifier": f"ex:{i}"} for i in range(3)]}, indent=2))
+    assert [r.line for r in iter_records(path)] == [3, 6, 9]
+
+
+def test_detect_format():
+    assert detect_format("catalog.yml") == "yaml"
+    assert detect_format("catalog.ndjson") == "jsonl"
+    with pytest.raises(ValueError):
+        detect_format(io.StringIO())
+    with pytest.raises(ValueError):
+        detect_format("catalog.yaml", "xml")
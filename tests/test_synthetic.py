@@ -0,0 +1,37 @@
+from collections import Counter
+
+from simple_data_catalog_model.index import CatalogIndex
+from simple_data_catalog_model.streaming import SECTIONS, CatalogWriter, load_container
+from simple_data_catalog_model.synthetic import Ratios, iter_synthetic, synthetic_container
+
+
+def test_same_seed_same_catalog():
+    assert list(iter_synthetic(50, seed=3)) == list(iter_synthetic(50, seed=3))
+    assert list(iter_synthetic(50, seed=3)) != list(iter_synthetic(50, seed=4))
+
+
+def test_entries_are_in_document_order():
+    sections = [section for section, _data in iter_synthetic(200)]
+    order = list(SECTIONS)
+    assert sections == sorted(sections, key=order.index)
+    counts = Counter(sections)
+    assert counts["dataCatalog"] == 1 and counts["datasets"] == 200
+
+
+def test_ratios_scale_entity_counts():
+    counts = Counter(section for section, _data in iter_synthetic(1000, ratios=Ratios(concepts=0.1, series=0.0)))
+    assert counts["concepts"] == 100
+    assert "series" not in counts
+
+
+def test_catalog_is_valid_and_closed():
+    container = synthetic_container(200, seed=1)
+    assert CatalogIndex(container).dangling() == []
+
+
+def test_written_catalog_loads_back(tmp_path):
+    path = tmp_path / "catalog.json"
+    with CatalogWriter(path) as writer:
+        for section, data in iter_synthetic(100, seed=2):
+            writer.write(section, data)
+    assert load_container(path) == synthetic_container(100, seed=2)
@@ -0,0 +1,106 @@
+import random
+from datetime import date
+
+import pytest
+
+from simple_data_catalog_model.datamodel import Container, DataCatalog, Dataset, Distribution, PeriodOfTime
+from simple_data_catalog_model.temporal import IntervalSet, TemporalIndex
+
+DATASET = ("datasets", "ex:herrcgre")
+
+
+def _dataset(identifier, start=None, end=None, **slots):
+    return Dataset(identifier=identifier, temporal=PeriodOfTime(hasBeginning=start, hasEnd=end), **slots)
+
+
+@pytest.mark.parametrize("size", [5, 100, 1000])
+def test_interval_set_matches_brute_force(size):
+    rng = random.Random(size)
+    intervals = IntervalSet()
+    live = {}
+    for step in range(3 * size):
+        key = rng.randrange(size)
+        if rng.random() < 0.2:
+            intervals.discard(key)
+            live.pop(key, None)
+        else:
+            start = rng.randrange(1000)
+            end = start + rng.randrange(1, 100)
+            intervals.add(key, start, end)
+            live[key] = (start, end)
+        if step % 50 == 0:
+            lo = rng.randrange(1000)
+            hi = lo + rng.randrange(1, 200)
+            assert sorted(intervals.query(lo, hi)) == sorted(k for k, (s, e) in live.items() if s < hi and lo < e)
+            assert sorted(intervals.within(lo, hi)) == sorted(k for k, (s, e) in live.items() if lo <= s and e <= hi)
+    assert len(intervals) == len(live)
+
+
+def test_empty_interval_is_rejected():
+    with pytest.raises(ValueError, match="empty"):
+        IntervalSet().add("k", 5, 5)
+
+
+def test_queries_on_fixture(container):
+    index = TemporalIndex(container)
+    assert index.at("2025-06-01") == [DATASET]
+    assert index.at("2026-01-01") == []
+    assert index.covering("2025-02-01", "2025-03-01") == [DATASET]
+    assert index.within("2025-01-01", "2025-12-31") == [DATASET]
+    assert index.within("2025-02-01", None) == []
+    assert index.overlapping("2025-12-31", None) == [DATASET]
+    assert index.series_coverage("ex:abcde") == (date(2025, 1, 1), date(2025, 12, 31))
+
+
+def test_open_ends():
+    index = TemporalIndex()
+    index.add("datasets", _dataset("ex:a", start=date(2020, 1, 1)))
+    assert index.at("9999-01-01") == [("datasets", "ex:a")]
+    assert index.series_coverage("ex:none") is None
+
+
+def test_series_coverage_follows_members():
+    index = TemporalIndex()
+    index.add("datasets", _dataset("ex:a", date(2020, 1, 1), date(2020, 6, 30), inSeries="ex:s"))
+    index.add("datasets", _dataset("ex:b", date(2021, 1, 1), date(2021, 12, 31), inSeries="ex:s"))
+    index.add("datasets", _dataset("ex:c", date(2020, 3, 1), date(2021, 2, 1), inSeries="ex:s"))
+    assert index.series_coverage("ex:s") == (date(2020, 1, 1), date(2021, 12, 31))
+    assert index.at("2021-06-01", field="series") == [("series", "ex:s")]
+    index.remove("datasets", "ex:b")
+    assert index.series_coverage("ex:s") == (date(2020, 1, 1), date(2021, 2, 1))
+    index.add("datasets", _dataset("ex:a", date(2020, 2, 1), date(2020, 3, 1), inSeries="ex:s"))
+    assert index.series_coverage("ex:s") == (date(2020, 2, 1), date(2021, 2, 1))
+    index.remove("datasets", "ex:a")
+    index.remove("datasets", "ex:c")
+    assert index.series_coverage("ex:s") is None
+    assert index.at("2020-06-01", field="series") == []
+
+
+def test_bulk_load_rolls_up_series():
+    datasets = [_dataset(f"ex:d{i}", date(2000 + i, 1, 1), date(2000 + i, 12, 31), inSeries="ex:s") for i in range(50)]
+    index = TemporalIndex(Container(dataCatalog=DataCatalog(identifier="ex:c"), datasets=datasets))
+    assert index.series_coverage("ex:s") == (date(2000, 1, 1), date(2049, 12, 31))
+    assert index.within("2000-01-01", "2049-12-31", field="series") == [("series", "ex:s")]
+
+
+def test_inlined_distributions_are_keyed_by_owner():
+    shared = Distribution(identifier="ex:csv", issued=date(2025, 1, 1))
+    index = TemporalIndex()
+    index.add("datasets", Dataset(identifier="ex:a", distribution=[shared]))
+    index.add("datasets", Dataset(identifier="ex:b", distribution=[shared]))
+    index.add("distributions", Distribution(identifier="ex:csv", issued=date(2025, 1, 1)))
+    assert sorted(index.at("2025-01-01", field="issued"), key=str) == [
+        ("distributions", "ex:csv"),
+        ("distributions", "ex:csv", ("datasets", "ex:a")),
+        ("distributions", "ex:csv", ("datasets", "ex:b")),
+    ]
+    index.remove("datasets", "ex:a")
+    assert ("distributions", "ex:csv", ("datasets", "ex:b")) in index.at("2025-01-01", field="issued")
+    assert len(index.at("2025-01-01", field="issued")) == 2
+
+
+def test_recent():
+    index = TemporalIndex()
+    index.add("datasets", Dataset(identifier="ex:a", modified=date(2025, 3, 10)))
+    assert index.recent(7, today=date(2025, 3, 12)) == [("datasets", "ex:a")]
+    assert index.recent(2, today=date(2025, 3, 12)) == []
@@ -0,0 +1,16 @@
+import gc
+
+from simple_data_catalog_model.util import gc_paused
+
+
+def test_gc_paused_restores_previous_state():
+    with gc_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        with gc_paused():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from simple_data_catalog_model.validation import REFERENCE, SCHEMA, iter_chunks, validate_catalog
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = tmp_path / "catalog.json"
+    concepts = [{"identifier": f"ex:c{i}", "prefLabel": f"concept {i}"} for i in range(7)]
+    concepts[3] = {"prefLabel": "no id"}
+    concepts.append({"identifier": "ex:c0"})
+    document = {
+        "dataCatalog": {"identifier": "ex:catalog", "dataset": ["ex:d", "ex:missing"]},
+        "datasets": [{"identifier": "ex:d", "theme": ["ex:c1", "ex:c9"]}],
+        "concepts": concepts,
+    }
+    path.write_text(json.dumps(document, indent=2))
+    return path
+
+
+def _summary(report):
+    return [(i.check, i.pointer) for i in report.issues]
+
+
+def test_fixture_has_only_the_dangling_policy(container):
+    report = validate_catalog(container, workers=1)
+    assert [(i.section, i.pointer) for i in report.issues] == [("datasets", "/datasets/0/hasPolicy")]
+    assert report.entries == 9
+
+
+def test_issues_in_document_order(catalog):
+    report = validate_catalog(catalog, workers=1, chunk_size=3)
+    assert _summary(report) == [
+        (REFERENCE, "/dataCatalog/dataset/1"),
+        (REFERENCE, "/datasets/0/theme/1"),
+        (SCHEMA, "/concepts/3/identifier"),
+        (REFERENCE, "/concepts/7"),
+    ]
+    assert "duplicate concepts identifier 'ex:c0'" in str(report.issues[-1])
+    assert report.issues[2].line is not None
+    assert report.entries == 10 and not report.ok
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_report_does_not_depend_on_chunking_or_workers(catalog, chunk_size):
+    expected = validate_catalog(catalog, workers=1)
+    assert validate_catalog(catalog, workers=2, chunk_size=chunk_size).issues == expected.issues
+
+
+def test_chunks_hold_one_section(catalog):
+    chunks = list(iter_chunks(catalog, chunk_size=3))
+    assert [(c.section, len(c.entries)) for c in chunks] == [
+        ("dataCatalog", 1), ("datasets", 1), ("concepts", 3), ("concepts", 3), ("concepts", 2),
+    ]
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(iter_chunks(catalog, chunk_size=0))
+
+
+def test_shacl_leaves_reference_checks_to_the_main_process(container):
+    report = validate_catalog(container, workers=1, shacl=True)
+    # The dangling hasPolicy is reported once, by the reference check.
+    assert [i.check for i in report.issues if "hasPolicy" in str(i)] == [REFERENCE]
+
+
+def test_inlined_distribution_is_a_reference_target(tmp_path):
+    path = tmp_path / "catalog.json"
+    document = {
+        "dataCatalog": {"identifier": "ex:catalog", "dataset": ["ex:d"]},
+        "datasets": [{"identifier": "ex:d", "distribution": [{"identifier": "ex:dist"}]}],
+        "qualityMeasurements": [
+            {"identifier": "ex:q", "computedOn": "ex:dist"},
+            {"identifier": "ex:r", "computedOn": "ex:other"},
+        ],
+    }
+    path.write_text(json.dumps(document))
+    report = validate_catalog(path, workers=1, chunk_size=1)
+    assert _summary(report) == [(REFERENCE, "/qualityMeasurements/1/computedOn")]